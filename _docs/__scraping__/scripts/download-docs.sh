@@ -19,6 +19,10 @@ LANGUAGE="en"
 CATEGORY=""
 OUTPUT_DIR="./downloaded"
 SCRAPE_NAV=true
+CONCURRENCY=16
+CACHE_ARGS=""
+FETCH_ARGS=""
+SYNC_ARGS=""
 
 # Usage
 usage() {
@@ -34,7 +38,14 @@ OPTIONS:
                            Available: claude-code, api, build-with-claude,
                                      about-claude, agents-and-tools, etc.
     -o, --output DIR       Output directory (default: ./downloaded)
+    -j, --concurrency N    Parallel downloads (default: 16)
     --no-scrape           Skip navigation scraping (use llms.txt only)
+    --cache-dir DIR       HTTP cache directory (default: ~/.cache/claude-docs-scraper)
+    --no-cache            Bypass the HTTP cache and refetch everything
+    --retries N           Retries for connection errors, 429 and 5xx (default: 4)
+    --rate N              Max requests per second per host (default: unlimited)
+    --incremental         Only rewrite changed files, move renamed ones and
+                          delete files that vanished upstream (uses .manifest.json)
     --list-languages      List available languages and exit
     --list-categories     List available categories and exit
     -h, --help            Show this help message
@@ -72,10 +83,34 @@ while [[ $# -gt 0 ]]; do
             OUTPUT_DIR="$2"
             shift 2
             ;;
+        -j|--concurrency)
+            CONCURRENCY="$2"
+            shift 2
+            ;;
         --no-scrape)
             SCRAPE_NAV=false
             shift
             ;;
+        --cache-dir)
+            CACHE_ARGS="$CACHE_ARGS --cache-dir $2"
+            shift 2
+            ;;
+        --no-cache)
+            CACHE_ARGS="$CACHE_ARGS --no-cache"
+            shift
+            ;;
+        --retries)
+            FETCH_ARGS="$FETCH_ARGS --retries $2"
+            shift 2
+            ;;
+        --rate)
+            FETCH_ARGS="$FETCH_ARGS --rate $2"
+            shift 2
+            ;;
+        --incremental)
+            SYNC_ARGS="--incremental"
+            shift
+            ;;
         --list-languages)
             python3 "$(dirname "$0")/parse-llms-txt.py" --list-languages
             exit 0
@@ -116,6 +151,7 @@ echo -e "${CYAN}Configuration:${NC}"
 echo -e "  Language: ${YELLOW}${LANGUAGE}${NC}"
 echo -e "  Category: ${YELLOW}${CATEGORY:-all}${NC}"
 echo -e "  Output: ${YELLOW}${ACTUAL_OUTPUT}${NC}"
+echo -e "  Concurrency: ${YELLOW}${CONCURRENCY}${NC}"
 echo ""
 
 # Build filter arguments
@@ -126,43 +162,50 @@ fi
 
 # Step 1: Parse llms.txt with filters
 echo -e "${YELLOW}📡 Step 1: Fetching file list from llms.txt...${NC}"
-LLMS_JSON=$(python3 parse-llms-txt.py $FILTER_ARGS --format json)
-FILE_COUNT=$(echo "$LLMS_JSON" | jq 'length')
 
-if [[ "$FILE_COUNT" -eq 0 ]]; then
+# Raw llms.txt, kept for reference; the parse below revalidates it through the HTTP cache
+LLMS_RAW=$(python3 scraper_http.py "https://docs.claude.com/llms.txt" $CACHE_ARGS $FETCH_ARGS)
+
+NAV_TEMP_FILE=$(mktemp)
+ENTRIES_FILE=$(mktemp)
+trap 'rm -f "$NAV_TEMP_FILE" "$ENTRIES_FILE"' EXIT
+
+# Entries are read from fd 3 by the download step. Normally they stream
+# straight from the parser (which keeps running during the navigation
+# scrape), so downloads start before llms.txt is fully parsed. An
+# incremental sync deletes files missing from the plan, so it waits for the
+# complete list (set -e stops here if the parse fails).
+if [[ -n "$SYNC_ARGS" ]]; then
+    python3 parse-llms-txt.py $FILTER_ARGS $CACHE_ARGS $FETCH_ARGS --format jsonl > "$ENTRIES_FILE"
+    exec 3< "$ENTRIES_FILE"
+else
+    exec 3< <(python3 parse-llms-txt.py $FILTER_ARGS $CACHE_ARGS $FETCH_ARGS --format jsonl)
+fi
+
+if ! IFS= read -r FIRST_ENTRY <&3; then
     echo -e "${RED}✗ No files found for language '$LANGUAGE' and category '$CATEGORY'${NC}"
     exit 1
 fi
 
-# Also fetch raw llms.txt for reference
-LLMS_RAW=$(curl -sSf "https://docs.claude.com/llms.txt")
-
-echo -e "${GREEN}✓ Found ${FILE_COUNT} files${NC}"
+echo -e "${GREEN}✓ File list found${NC}"
 echo ""
 
 # Step 2: Scrape navigation (if enabled and category is specified)
 SCRAPED_NAV=""
-NAV_TEMP_FILE=$(mktemp)
 METADATA_FILE=""
 
 if [[ "$SCRAPE_NAV" == true && -n "$CATEGORY" ]]; then
     echo -e "${YELLOW}📊 Step 2: Scraping navigation structure...${NC}"
 
-    # Construct the category overview URL
-    NAV_URL="https://docs.claude.com/${LANGUAGE}/docs/${CATEGORY}/overview"
-
     # Create output directory early for metadata
     mkdir -p "$ACTUAL_OUTPUT"
     METADATA_FILE="$ACTUAL_OUTPUT/.metadata.json"
 
-    # Check if we can scrape this category (check for 200 status code)
-    if curl -sI "$NAV_URL" 2>&1 | grep -qE "HTTP/[0-9.]+ 200"; then
-        if python3 scrape-navigation.py -l "$LANGUAGE" -c "$CATEGORY" -o "$NAV_TEMP_FILE" --silent 2>/dev/null; then
-            SCRAPED_NAV="$NAV_TEMP_FILE"
-            echo -e "${GREEN}✓ Navigation structure extracted${NC}"
-        else
-            echo -e "${YELLOW}⚠ Could not scrape navigation, will use flat structure${NC}"
-        fi
+    # Categories without an overview page (no sidebar) fail here after the
+    # scheduler has retried transient errors
+    if python3 scrape-navigation.py -l "$LANGUAGE" -c "$CATEGORY" -o "$NAV_TEMP_FILE" --silent $CACHE_ARGS $FETCH_ARGS 2>/dev/null; then
+        SCRAPED_NAV="$NAV_TEMP_FILE"
+        echo -e "${GREEN}✓ Navigation structure extracted${NC}"
     else
         echo -e "${YELLOW}⚠ Category doesn't have sidebar navigation, using flat structure${NC}"
     fi
@@ -173,30 +216,22 @@ fi
 echo -e "${YELLOW}📁 Step 3: Creating directory structure...${NC}"
 mkdir -p "$ACTUAL_OUTPUT"
 
-# Create temporary file for category name mapping
-CATEGORY_MAPPING=$(mktemp)
-trap "rm -f $CATEGORY_MAPPING $NAV_TEMP_FILE" EXIT
-
+NAV_ARGS=""
 if [[ -n "$SCRAPED_NAV" && -f "$SCRAPED_NAV" ]]; then
+    NAV_ARGS="--nav $SCRAPED_NAV"
+
     # Create categorized folders from scraped navigation with numeric prefixes
-    # Use keys_unsorted to preserve website navigation order
-    categories=$(jq -r 'keys_unsorted[]' "$SCRAPED_NAV")
-    index=1
-    for cat in $categories; do
-        # Create numbered folder name (01-, 02-, etc.)
+    # (to_entries keeps the website navigation order)
+    while IFS=$'\t' read -r index cat count; do
         numbered_cat=$(printf "%02d-%s" "$index" "$cat")
-        echo "$cat=$numbered_cat" >> "$CATEGORY_MAPPING"
-
         mkdir -p "$ACTUAL_OUTPUT/$numbered_cat"
-        count=$(jq -r ".[\"$cat\"] | length" "$SCRAPED_NAV")
         echo -e "  ${CYAN}• ${numbered_cat}${NC} (${count} files)"
-        ((index++))
-    done
+    done < <(jq -r 'to_entries | to_entries[] | "\(.key + 1)\t\(.value.key)\t\(.value.value | length)"' "$SCRAPED_NAV")
     mkdir -p "$ACTUAL_OUTPUT/99-uncategorized"
     echo -e "  ${CYAN}• 99-uncategorized${NC} (for unlisted files)"
 else
     # No navigation scraped - use flat structure
-    echo -e "  ${CYAN}• ${ACTUAL_OUTPUT}${NC} (${FILE_COUNT} files, flat structure)"
+    echo -e "  ${CYAN}• ${ACTUAL_OUTPUT}${NC} (flat structure)"
 fi
 
 # Save raw llms.txt for reference
@@ -208,66 +243,21 @@ echo ""
 echo -e "${YELLOW}⬇️  Step 4: Downloading files...${NC}"
 echo ""
 
-total_files=0
-successful_downloads=0
-failed_downloads=0
-
-# Process each file from llms.txt using process substitution to avoid subshell
-while IFS= read -r item; do
-    url=$(echo "$item" | jq -r '.url')
-    file_path=$(echo "$item" | jq -r '.file_path')
-    title=$(echo "$item" | jq -r '.title')
-    file_cat=$(echo "$item" | jq -r '.category')
-
-    ((total_files++)) || true
-
-    # Determine output path
-    if [[ -n "$SCRAPED_NAV" && -f "$SCRAPED_NAV" ]]; then
-        # Check if file is in scraped navigation (take first match if file is in multiple categories)
-        nav_category=$(jq -r --arg file "$file_path" '
-            [to_entries[] | select(.value[] == $file) | .key] | first // empty
-        ' "$SCRAPED_NAV" 2>/dev/null || echo "")
-
-        if [[ -n "$nav_category" ]]; then
-            # Look up numbered folder name from mapping file
-            numbered_folder=$(grep "^${nav_category}=" "$CATEGORY_MAPPING" | cut -d'=' -f2)
-
-            # Find file index within category to preserve navigation order
-            file_index=$(jq -r --arg cat "$nav_category" --arg file "$file_path" '
-                .[$cat] as $files |
-                ($files | index($file)) + 1
-            ' "$SCRAPED_NAV" 2>/dev/null)
-
-            if [[ -n "$file_index" && "$file_index" != "null" ]]; then
-                # Prefix filename with its navigation order
-                numbered_filename=$(printf "%02d-%s" "$file_index" "$(basename "$file_path")")
-                output_path="$ACTUAL_OUTPUT/$numbered_folder/$numbered_filename"
-            else
-                # Fallback if index not found
-                output_path="$ACTUAL_OUTPUT/$numbered_folder/$(basename "$file_path")"
-            fi
-        else
-            output_path="$ACTUAL_OUTPUT/99-uncategorized/$file_path"
-            mkdir -p "$(dirname "$output_path")"
-        fi
-    else
-        # Use flat structure
-        output_path="$ACTUAL_OUTPUT/$file_path"
-        mkdir -p "$(dirname "$output_path")"
-    fi
-
-    printf "${BLUE}[%3d/%3d]${NC} %-50s " "$total_files" "$FILE_COUNT" "$(basename "$file_path")"
-
-    if curl -sSf "$url" -o "$output_path" 2>/dev/null; then
-        file_size=$(du -h "$output_path" | cut -f1)
-        echo -e "${GREEN}✓${NC} (${file_size})"
-        ((successful_downloads++)) || true
-    else
-        echo -e "${RED}✗ Failed${NC}"
-        ((failed_downloads++)) || true
-        rm -f "$output_path" 2>/dev/null || true
-    fi
-done < <(echo "$LLMS_JSON" | jq -c '.[]')
+# Entries flow as JSON Lines through planning (numbered output paths) into
+# the concurrent download engine, each handed on as soon as it is parsed.
+# The engine prints per-file progress on stderr and a JSON summary on stdout.
+DOWNLOAD_SUMMARY=$( { printf '%s\n' "$FIRST_ENTRY"; cat <&3; } \
+    | python3 plan-downloads.py $NAV_ARGS --format jsonl \
+    | python3 download-files.py - -o "$ACTUAL_OUTPUT" -j "$CONCURRENCY" $CACHE_ARGS $FETCH_ARGS $SYNC_ARGS) || true
+exec 3<&-
+FILE_COUNT=$(echo "$DOWNLOAD_SUMMARY" | jq -r '.total // 0' 2>/dev/null || echo 0)
+successful_downloads=$(echo "$DOWNLOAD_SUMMARY" | jq -r '.successful // 0' 2>/dev/null || echo 0)
+failed_downloads=$(echo "$DOWNLOAD_SUMMARY" | jq -r '.failed // 0' 2>/dev/null || echo 0)
+FILE_COUNT=${FILE_COUNT:-0}
+successful_downloads=${successful_downloads:-0}
+failed_downloads=${failed_downloads:-$FILE_COUNT}
+sync_stats=$(echo "$DOWNLOAD_SUMMARY" | jq -c '{updated, unchanged, moved, deleted}' 2>/dev/null || echo '{}')
+sync_stats=${sync_stats:-'{}'}
 
 echo ""
 
@@ -290,6 +280,7 @@ if [[ -n "$CATEGORY" ]]; then
     "total_files": $FILE_COUNT,
     "successful": $successful_downloads,
     "failed": $failed_downloads,
+    "sync": $sync_stats,
     "total_size": "$TOTAL_SIZE"
   },
   "navigation": $(cat "$SCRAPED_NAV" 2>/dev/null || echo '{}')
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Download documentation files concurrently.
+Reads a download plan (JSON list or JSON Lines of {"url", "output_path"}
+entries) and fetches it with a bounded worker pool, reusing keep-alive
+connections per host. JSON Lines plans are consumed as they arrive, so
+fetching starts while the producer is still writing the plan.
+
+Every run records a per-file manifest (.manifest.json in the output directory).
+With --incremental the manifest drives a sync: unchanged files are not
+rewritten, files whose output path changed are moved into place (and only
+revalidated, not downloaded again, when the HTTP cache is on), and files that
+vanished from the plan are deleted.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import argparse
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+
+from jsonstream import read_records
+from scraper_http import (
+    ConnectionPool, add_cache_arguments, add_fetch_arguments,
+    cache_from_args, configure_scheduler
+)
+
+DEFAULT_CONCURRENCY = 16
+DEFAULT_PER_HOST = 8
+MANIFEST_NAME = '.manifest.json'
+MANIFEST_VERSION = 1
+
+
+def iter_plan(source):
+    """Yield plan entries from a file path, or stdin when source is '-'."""
+    if source == '-':
+        yield from read_records(sys.stdin)
+        return
+    with open(source) as f:
+        yield from read_records(f)
+
+
+def load_manifest(path):
+    """Load the per-file manifest, keyed by URL. Missing or corrupt → empty."""
+    try:
+        with open(path) as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get('version') != MANIFEST_VERSION:
+        return {}
+    return manifest.get('files', {})
+
+
+def save_manifest(path, files):
+    """Write the manifest atomically, sorted for stable diffs."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + '.tmp')
+    with open(tmp, 'w') as f:
+        json.dump(
+            {'version': MANIFEST_VERSION, 'files': dict(sorted(files.items()))},
+            f,
+            indent=2
+        )
+    os.replace(tmp, path)
+
+
+def human_size(num_bytes):
+    """Format a byte count like `du -h` (e.g. 512, 4.2K, 1.3M)."""
+    if num_bytes < 1024:
+        return str(num_bytes)
+    size = num_bytes / 1024
+    for unit in ('K', 'M'):
+        if size < 1024:
+            return f'{size:.1f}{unit}'
+        size /= 1024
+    return f'{size:.1f}G'
+
+
+def remove_empty_parents(path, stop_at):
+    """Remove empty directories from path's parent up to (not including) stop_at."""
+    stop_at = Path(stop_at).resolve()
+    parent = Path(path).parent.resolve()
+    while parent != stop_at and stop_at in parent.parents:
+        try:
+            parent.rmdir()
+        except OSError:
+            return
+        parent = parent.parent
+
+
+def apply_moves(plan, previous, output_dir):
+    """
+    Move files whose output path changed since the last run.
+
+    Moves go through temporary names first so swaps and chains of renames
+    (e.g. after a navigation reorder) never overwrite a file still needed.
+
+    Returns:
+        int: Number of files moved
+    """
+    output_dir = Path(output_dir)
+    moves = []
+    for entry in plan:
+        old = previous.get(entry['url'])
+        if not old or old['path'] == entry['output_path']:
+            continue
+        if (output_dir / old['path']).is_file():
+            moves.append((old['path'], entry['output_path']))
+
+    staged = []
+    for n, (old_path, new_path) in enumerate(moves):
+        tmp = output_dir / f'{old_path}.sync-{n}.tmp'
+        os.replace(output_dir / old_path, tmp)
+        staged.append((tmp, old_path, new_path))
+
+    for tmp, old_path, new_path in staged:
+        target = output_dir / new_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp, target)
+        remove_empty_parents(output_dir / old_path, output_dir)
+
+    return len(moves)
+
+
+def download_entry(pool, entry, output_dir, previous=None, after=None):
+    """
+    Fetch one plan entry and write it to disk.
+
+    When a previous manifest record says the file on disk already has the
+    fetched content, the write is skipped. If after is given (the future of
+    an earlier entry with the same output path), the write waits for it to
+    finish, so the last entry in the plan wins, as it did downloading one by
+    one.
+
+    Returns:
+        tuple: (manifest record, changed)
+    """
+    try:
+        body = pool.fetch(entry['url'])
+    finally:
+        # Even a failed entry finishes after the one before it, so waiting
+        # on it orders every later write
+        if after is not None:
+            wait([after])
+    digest = hashlib.sha256(body).hexdigest()
+    output_path = Path(output_dir) / entry['output_path']
+
+    changed = True
+    if (previous and previous['sha256'] == digest
+            and previous['path'] == entry['output_path']
+            and output_path.is_file()
+            and output_path.stat().st_size == len(body)):
+        changed = False
+    else:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = output_path.with_name(f'{output_path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        try:
+            tmp.write_bytes(body)
+            os.replace(tmp, output_path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+
+    record = {
+        'path': entry['output_path'],
+        'sha256': digest,
+        'size': len(body),
+        'fetched_at': datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ'),
+        'nav_position': entry.get('nav_position')
+    }
+    return record, changed
+
+
+def download_all(plan, output_dir='.', concurrency=DEFAULT_CONCURRENCY,
+                 per_host=DEFAULT_PER_HOST, silent=False, cache=None,
+                 incremental=False, manifest_path=None):
+    """
+    Download every entry in the plan.
+
+    Args:
+        plan: Iterable of dicts with 'url' and 'output_path' (relative to
+              output_dir), optionally 'nav_position'. Entries are submitted
+              as the iterable yields them.
+        output_dir: Base directory for output paths
+        concurrency: Maximum number of downloads in flight
+        per_host: Maximum number of connections per host
+        silent: Suppress per-file progress lines
+        cache: Optional HTTPCache; unchanged files are served from disk after a 304
+        incremental: Sync against the previous manifest (skip, move, delete)
+        manifest_path: Manifest location (default: <output_dir>/.manifest.json)
+
+    Returns:
+        dict: {'total', 'successful', 'failed', 'updated', 'unchanged',
+               'moved', 'deleted', 'bytes', 'failed_urls'}
+    """
+    manifest_path = manifest_path or Path(output_dir) / MANIFEST_NAME
+    previous = load_manifest(manifest_path) if incremental else {}
+    if incremental:
+        # Moves and deletions need the complete plan up front
+        plan = list(plan)
+    summary = {
+        'total': 0,
+        'successful': 0,
+        'failed': 0,
+        'updated': 0,
+        'unchanged': 0,
+        'moved': 0,
+        'deleted': 0,
+        'bytes': 0,
+        'failed_urls': []
+    }
+    manifest = {}
+
+    if incremental:
+        summary['moved'] = apply_moves(plan, previous, output_dir)
+        # After the moves, previous records describe the new locations
+        for entry in plan:
+            old = previous.get(entry['url'])
+            if old:
+                old['path'] = entry['output_path']
+
+    pool = ConnectionPool(per_host=per_host, cache=cache)
+
+    planned = set()
+    # Futures of the entries writing each output path, in plan order
+    writers = {}
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            futures = {}
+            for entry in plan:
+                planned.add(entry['url'])
+                chain = writers.setdefault(entry['output_path'], [])
+                # An entry sharing its output path with an earlier one (e.g. a
+                # page listed in several categories of a flat download) writes
+                # after it, and always: the file on disk is no longer the
+                # previous run's
+                after = chain[-1] if chain else None
+                future = executor.submit(
+                    download_entry, pool, entry, output_dir,
+                    previous.get(entry['url']) if after is None else None, after
+                )
+                chain.append(future)
+                futures[future] = entry
+
+            total = summary['total'] = len(futures)
+            for done, future in enumerate(as_completed(futures), 1):
+                entry = futures[future]
+                name = Path(entry['output_path']).name
+                try:
+                    record, changed = future.result()
+                except Exception as e:
+                    summary['failed'] += 1
+                    summary['failed_urls'].append(entry['url'])
+                    if incremental and entry['url'] in previous:
+                        # Keep the last good copy and its manifest record
+                        manifest[entry['url']] = previous[entry['url']]
+                    else:
+                        # Never leave a stale file behind, unless another entry
+                        # wrote this path; the last one for a path cleans up,
+                        # after all the earlier ones have finished
+                        chain = writers[entry['output_path']]
+                        if chain[-1] is future and all(other.exception() is not None for other in chain):
+                            (Path(output_dir) / entry['output_path']).unlink(missing_ok=True)
+                    if not silent:
+                        print(f"[{done:3d}/{total:3d}] {name:<50} ✗ Failed ({e})", file=sys.stderr)
+                    continue
+
+                manifest[entry['url']] = record
+                summary['successful'] += 1
+                summary['bytes'] += record['size']
+                summary['updated' if changed else 'unchanged'] += 1
+                if not silent:
+                    state = human_size(record['size']) if changed else 'unchanged'
+                    print(f"[{done:3d}/{total:3d}] {name:<50} ✓ ({state})", file=sys.stderr)
+    finally:
+        pool.close()
+
+    if incremental:
+        for url, old in previous.items():
+            if url in planned or old['path'] in writers:
+                continue
+            stale = Path(output_dir) / old['path']
+            if stale.is_file():
+                stale.unlink()
+                remove_empty_parents(stale, output_dir)
+                summary['deleted'] += 1
+                if not silent:
+                    print(f"  Deleted: {old['path']}", file=sys.stderr)
+
+    save_manifest(manifest_path, manifest)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Download documentation files concurrently from a JSON plan'
+    )
+    parser.add_argument(
+        'plan',
+        nargs='?',
+        default='-',
+        help='Plan file: JSON list or JSON Lines of {"url", "output_path"} (default: stdin)'
+    )
+    parser.add_argument(
+        '-o', '--output-dir',
+        default='.',
+        help='Base directory for relative output paths (default: current directory)'
+    )
+    parser.add_argument(
+        '-j', '--concurrency',
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f'Maximum parallel downloads (default: {DEFAULT_CONCURRENCY})'
+    )
+    parser.add_argument(
+        '--per-host',
+        type=int,
+        default=DEFAULT_PER_HOST,
+        help=f'Maximum connections per host (default: {DEFAULT_PER_HOST})'
+    )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Sync against the previous manifest: skip unchanged, move renamed, delete vanished files'
+    )
+    parser.add_argument(
+        '--manifest',
+        default=None,
+        help=f'Manifest path (default: <output-dir>/{MANIFEST_NAME})'
+    )
+    parser.add_argument(
+        '--silent',
+        action='store_true',
+        help='Only output the JSON summary, no progress lines'
+    )
+    add_cache_arguments(parser)
+    add_fetch_arguments(parser)
+
+    args = parser.parse_args()
+    configure_scheduler(args)
+
+    cache = cache_from_args(args)
+    summary = download_all(
+        iter_plan(args.plan),
+        output_dir=args.output_dir,
+        concurrency=args.concurrency,
+        per_host=args.per_host,
+        silent=args.silent,
+        cache=cache,
+        incremental=args.incremental,
+        manifest_path=args.manifest
+    )
+    if cache:
+        cache.prune()
+
+    # Summary goes to stdout so wrapper scripts can pick up the counts
+    print(json.dumps(summary, indent=2))
+    sys.exit(0 if summary['failed'] == 0 else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -16,6 +16,10 @@ readonly NC='\033[0m'
 
 # Defaults
 OUTPUT_DIR="./downloaded/mcp"
+CONCURRENCY=16
+CACHE_ARGS=""
+FETCH_ARGS=""
+SYNC_ARGS=""
 
 # Usage
 usage() {
@@ -26,6 +30,13 @@ Download Model Context Protocol documentation with navigation structure.
 
 OPTIONS:
     -o, --output DIR       Output directory (default: ./downloaded/mcp)
+    -j, --concurrency N    Parallel downloads (default: 16)
+    --cache-dir DIR       HTTP cache directory (default: ~/.cache/claude-docs-scraper)
+    --no-cache            Bypass the HTTP cache and refetch everything
+    --retries N           Retries for connection errors, 429 and 5xx (default: 4)
+    --rate N              Max requests per second per host (default: unlimited)
+    --incremental         Only rewrite changed files, move renamed ones and
+                          delete files that vanished upstream (uses .manifest.json)
     -h, --help            Show this help message
 
 EXAMPLES:
@@ -46,6 +57,30 @@ while [[ $# -gt 0 ]]; do
             OUTPUT_DIR="$2"
             shift 2
             ;;
+        -j|--concurrency)
+            CONCURRENCY="$2"
+            shift 2
+            ;;
+        --cache-dir)
+            CACHE_ARGS="$CACHE_ARGS --cache-dir $2"
+            shift 2
+            ;;
+        --no-cache)
+            CACHE_ARGS="$CACHE_ARGS --no-cache"
+            shift
+            ;;
+        --retries)
+            FETCH_ARGS="$FETCH_ARGS --retries $2"
+            shift 2
+            ;;
+        --rate)
+            FETCH_ARGS="$FETCH_ARGS --rate $2"
+            shift 2
+            ;;
+        --incremental)
+            SYNC_ARGS="--incremental"
+            shift
+            ;;
         -h|--help)
             usage
             ;;
@@ -75,7 +110,7 @@ echo -e "${YELLOW}📊 Step 1: Scraping navigation structure...${NC}"
 NAV_FILE=$(mktemp)
 trap "rm -f $NAV_FILE" EXIT
 
-if ! python3 scrape-mcp-navigation.py -o "$NAV_FILE" --silent 2>/dev/null; then
+if ! python3 scrape-mcp-navigation.py -o "$NAV_FILE" --silent $CACHE_ARGS $FETCH_ARGS 2>/dev/null; then
     echo -e "${RED}✗ Failed to scrape navigation${NC}"
     exit 1
 fi
@@ -85,11 +120,11 @@ echo ""
 
 # Step 2: Parse llms.txt
 echo -e "${YELLOW}📡 Step 2: Fetching file list from llms.txt...${NC}"
-LLMS_JSON=$(python3 parse-mcp-llms.py --format json --silent)
+LLMS_JSON=$(python3 parse-mcp-llms.py --format json --silent $CACHE_ARGS $FETCH_ARGS)
 FILE_COUNT=$(echo "$LLMS_JSON" | jq 'length')
 
-# Also fetch raw llms.txt for reference
-LLMS_RAW=$(curl -sSf "https://modelcontextprotocol.io/llms.txt")
+# Also fetch raw llms.txt for reference (served from the HTTP cache just populated)
+LLMS_RAW=$(python3 scraper_http.py "https://modelcontextprotocol.io/llms.txt" $CACHE_ARGS $FETCH_ARGS)
 
 echo -e "${GREEN}✓ Found ${FILE_COUNT} files${NC}"
 echo ""
@@ -212,7 +247,6 @@ echo ""
 echo -e "${YELLOW}⬇️  Step 5: Downloading files to numbered paths...${NC}"
 echo ""
 
-total_files=0
 successful_downloads=0
 failed_downloads=0
 
@@ -220,13 +254,15 @@ failed_downloads=0
 LLMS_FILE=$(mktemp)
 echo "$LLMS_JSON" > "$LLMS_FILE"
 
-# Download each file to its mapped location
+# Map each file to its output location, then hand the whole plan to the
+# concurrent download engine
+PLAN_TSV=$(mktemp)
+PLAN_FILE=$(mktemp)
+trap "rm -f $NAV_FILE $PLAN_TSV $PLAN_FILE" EXIT
+
 while IFS= read -r item; do
     url=$(echo "$item" | jq -r '.url')
     path=$(echo "$item" | jq -r '.path')
-    title=$(echo "$item" | jq -r '.title')
-
-    total_files=$((total_files + 1))
 
     # Look up the mapped output path
     output_path=$(echo "$PATH_MAP" | jq -r --arg p "$path" '.[$p] // empty')
@@ -282,28 +318,25 @@ while IFS= read -r item; do
             filename="${filename}.md"
         fi
         output_path="99-uncategorized/$filename"
-        mkdir -p "$OUTPUT_DIR/99-uncategorized"
     fi
 
-    full_output_path="$OUTPUT_DIR/$output_path"
-
-    # Display shortened filename for progress
-    display_name=$(basename "$output_path")
-    printf "${BLUE}[%3d/%3d]${NC} %-50s " "$total_files" "$FILE_COUNT" "$display_name"
-
-    if curl -sSf "$url" -o "$full_output_path" 2>/dev/null; then
-        file_size=$(du -h "$full_output_path" | cut -f1)
-        echo -e "${GREEN}✓${NC} → ${CYAN}${output_path}${NC}"
-        successful_downloads=$((successful_downloads + 1))
-    else
-        echo -e "${RED}✗ Failed${NC}"
-        failed_downloads=$((failed_downloads + 1))
-        rm -f "$full_output_path" 2>/dev/null || true
-    fi
+    printf '%s\t%s\n' "$url" "$output_path" >> "$PLAN_TSV"
 done < <(jq -c '.[]' "$LLMS_FILE")
 
 rm -f "$LLMS_FILE"
 
+jq -R -s 'split("\n") | map(select(length > 0) | split("\t") | {url: .[0], output_path: .[1]})' \
+    "$PLAN_TSV" > "$PLAN_FILE"
+
+# The engine prints per-file progress on stderr and a JSON summary on stdout
+DOWNLOAD_SUMMARY=$(python3 download-files.py "$PLAN_FILE" -o "$OUTPUT_DIR" -j "$CONCURRENCY" $CACHE_ARGS $FETCH_ARGS $SYNC_ARGS) || true
+successful_downloads=$(echo "$DOWNLOAD_SUMMARY" | jq -r '.successful // 0' 2>/dev/null || echo 0)
+failed_downloads=$(echo "$DOWNLOAD_SUMMARY" | jq -r '.failed // 0' 2>/dev/null || echo 0)
+successful_downloads=${successful_downloads:-0}
+failed_downloads=${failed_downloads:-$FILE_COUNT}
+sync_stats=$(echo "$DOWNLOAD_SUMMARY" | jq -c '{updated, unchanged, moved, deleted}' 2>/dev/null || echo '{}')
+sync_stats=${sync_stats:-'{}'}
+
 echo ""
 
 # Generate metadata
@@ -321,6 +354,7 @@ cat > "$METADATA_FILE" <<EOF
     "total_files": $FILE_COUNT,
     "successful": $successful_downloads,
     "failed": $failed_downloads,
+    "sync": $sync_stats,
     "total_size": "$TOTAL_SIZE"
   },
   "navigation": $(cat "$NAV_FILE")
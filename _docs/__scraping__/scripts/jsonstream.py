@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Streaming JSON record I/O for the scraper pipeline.
+Scripts exchange lists of records either as a JSON array (the classic
+`--format json` output) or as JSON Lines, which downstream tools can start
+consuming before the producer has finished.
+"""
+
+import json
+
+
+def read_records(stream):
+    """
+    Yield records from a JSON array or JSON Lines stream.
+
+    JSON Lines input is consumed lazily, one record per line; a JSON array
+    has to be read whole before the first record is available.
+    """
+    first = stream.read(1)
+    while first and first.isspace():
+        first = stream.read(1)
+    if not first:
+        return
+
+    if first == '[':
+        yield from json.loads(first + stream.read())
+        return
+
+    line = first + stream.readline()
+    yield json.loads(line)
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+
+def write_json_array(records, out):
+    """
+    Write records as an indented JSON array while they are produced.
+
+    The result is byte-identical to json.dumps(list(records), indent=2).
+
+    Returns:
+        int: Number of records written
+    """
+    count = 0
+    for record in records:
+        out.write('[\n  ' if count == 0 else ',\n  ')
+        out.write(json.dumps(record, indent=2).replace('\n', '\n  '))
+        out.flush()
+        count += 1
+    out.write('\n]\n' if count else '[]\n')
+    return count
+
+
+def write_json_lines(records, out):
+    """
+    Write records as JSON Lines, flushing after each one.
+
+    Returns:
+        int: Number of records written
+    """
+    count = 0
+    for record in records:
+        out.write(json.dumps(record) + '\n')
+        out.flush()
+        count += 1
+    return count
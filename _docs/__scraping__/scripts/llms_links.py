@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Link matchers for the llms.txt grammar.
+Both the docs.claude.com and the modelcontextprotocol.io formats are matched
+with patterns compiled once at import. A plain substring test rejects lines
+that cannot hold a link before the regex engine runs, and matches come back
+as tuples from findall, so no match objects are built per link.
+"""
+
+import re
+
+# [Text](https://docs.claude.com/{language}/docs/{category}/{file_path}.md),
+# e.g. [Overview](https://docs.claude.com/en/docs/claude-code/overview.md)
+CLAUDE_LINK = re.compile(
+    r'\[([^\]]+)\]\((https://docs\.claude\.com/([a-z]{2})/docs/([a-z0-9\-]+)/([^)]+\.md))\)'
+)
+
+# - [Title](https://modelcontextprotocol.io{path}): Description
+MCP_LINK = re.compile(
+    r'-\s+\[([^\]]+)\]\((https://modelcontextprotocol\.io([^)]+))\)(?::\s+(.+))?'
+)
+
+_claude_findall = CLAUDE_LINK.findall
+_mcp_findall = MCP_LINK.findall
+
+
+def match_claude_links(line):
+    """
+    Find docs.claude.com markdown links in a line.
+
+    Returns:
+        list: [(title, url, language, category, file_path), ...]
+    """
+    if '.md)' not in line:
+        return []
+    return _claude_findall(line)
+
+
+def match_mcp_links(line):
+    """
+    Find modelcontextprotocol.io list-item links in a line.
+
+    Returns:
+        list: [(title, url, path, description), ...] with surrounding
+        whitespace stripped; description is '' when the line has none
+    """
+    if '](https://modelcontextprotocol.io' not in line:
+        return []
+    return [
+        (title.strip(), url.strip(), path.strip(), description.strip())
+        for title, url, path, description in _mcp_findall(line)
+    ]
@@ -2,21 +2,60 @@
 """
 Parse llms.txt and filter by language and category.
 Makes the download script reusable for any Claude documentation section.
+
+Entries are parsed line by line straight off the HTTP response, so output
+starts before llms.txt has fully arrived and memory stays flat. With
+--format jsonl, download-docs.sh pipes them through plan-downloads.py into
+download-files.py, so downloads start while llms.txt is still being parsed.
 """
 
-import re
-import json
-import urllib.request
+import sys
 import argparse
 from collections import defaultdict
 
-def fetch_llms_txt():
-    """Fetch the llms.txt file from Claude docs."""
-    url = 'https://docs.claude.com/llms.txt'
-    req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
+from jsonstream import write_json_array, write_json_lines
+from llms_links import match_claude_links
+from scraper_http import (
+    add_cache_arguments, add_fetch_arguments, cache_from_args,
+    configure_scheduler, fetch_url, iter_lines
+)
+
+LLMS_TXT_URL = 'https://docs.claude.com/llms.txt'
+
+def fetch_llms_txt(cache=None):
+    """Fetch the llms.txt file from Claude docs (revalidated through the cache, if given)."""
+    return fetch_url(LLMS_TXT_URL, cache=cache).decode('utf-8')
+
+def stream_llms_txt(cache=None):
+    """Yield llms.txt lines as they arrive from Claude docs."""
+    return iter_lines(LLMS_TXT_URL, cache=cache)
+
+def iter_entries(lines, language=None, category=None):
+    """
+    Lazily parse llms.txt lines, yielding matching file entries in file order.
+
+    Args:
+        lines: Iterable of llms.txt lines (e.g. stream_llms_txt())
+        language: Language code (e.g., 'en', 'de') or None for all
+        category: Category name (e.g., 'claude-code', 'api') or None for all
+
+    Yields:
+        dict: {'title', 'url', 'file_path', 'language', 'category'}
+    """
+    for line in lines:
+        for title, url, lang, cat, file_path in match_claude_links(line):
+            if language and lang != language:
+                continue
+            if category and cat != category:
+                continue
 
-    with urllib.request.urlopen(req) as response:
-        return response.read().decode('utf-8')
+            yield {
+                'title': title,
+                'url': url,
+                'file_path': file_path,
+                'language': lang,
+                'category': cat
+            }
 
 def parse_llms_txt(content):
     """
@@ -37,28 +76,11 @@ def parse_llms_txt(content):
     all_languages = set()
     all_categories = set()
 
-    # Pattern to match markdown links with .md extension
-    # Example: [Text](https://docs.claude.com/en/docs/claude-code/overview.md)
-    # Must have proper URL structure and end with .md
-    pattern = r'\[([^\]]+)\]\((https://docs\.claude\.com/([a-z]{2})/docs/([a-z0-9\-]+)/([^)]+\.md))\)'
-
-    for match in re.finditer(pattern, content):
-        title = match.group(1)
-        full_url = match.group(2)
-        language = match.group(3)
-        category = match.group(4)
-        file_path = match.group(5)
-
-        all_languages.add(language)
-        all_categories.add(category)
-
-        data[language][category].append({
-            'title': title,
-            'url': full_url,
-            'file_path': file_path,
-            'language': language,
-            'category': category
-        })
+    lines = content.splitlines() if isinstance(content, str) else content
+    for entry in iter_entries(lines):
+        all_languages.add(entry['language'])
+        all_categories.add(entry['category'])
+        data[entry['language']][entry['category']].append(entry)
 
     return {
         'by_language': dict(data),
@@ -66,40 +88,6 @@ def parse_llms_txt(content):
         'all_categories': sorted(all_categories)
     }
 
-def filter_by_criteria(parsed_data, language=None, category=None):
-    """
-    Filter parsed data by language and/or category.
-
-    Args:
-        parsed_data: Output from parse_llms_txt()
-        language: Language code (e.g., 'en', 'de') or None for all
-        category: Category name (e.g., 'claude-code', 'api') or None for all
-
-    Returns:
-        list: Filtered file entries
-    """
-    results = []
-
-    by_lang = parsed_data['by_language']
-
-    # Filter by language
-    languages = [language] if language else parsed_data['all_languages']
-
-    for lang in languages:
-        if lang not in by_lang:
-            continue
-
-        # Filter by category
-        categories = [category] if category else by_lang[lang].keys()
-
-        for cat in categories:
-            if cat not in by_lang[lang]:
-                continue
-
-            results.extend(by_lang[lang][cat])
-
-    return results
-
 def main():
     parser = argparse.ArgumentParser(
         description='Parse llms.txt and filter Claude documentation by language and category'
@@ -131,21 +119,26 @@ def main():
     )
     parser.add_argument(
         '--format',
-        choices=['json', 'urls', 'paths'],
+        choices=['json', 'jsonl', 'urls', 'paths'],
         default='json',
-        help='Output format: json (full data), urls (just URLs), paths (just file paths)'
+        help='Output format: json (full data), jsonl (one entry per line), urls (just URLs), paths (just file paths)'
     )
+    add_cache_arguments(parser)
+    add_fetch_arguments(parser)
 
     args = parser.parse_args()
+    configure_scheduler(args)
 
-    import sys
     print("🔍 Fetching llms.txt...", flush=True, file=sys.stderr)
-    content = fetch_llms_txt()
+    cache = cache_from_args(args)
 
-    print("📊 Parsing documentation structure...", flush=True, file=sys.stderr)
-    parsed = parse_llms_txt(content)
+    # List available options if requested (needs the whole index)
+    if args.list_languages or args.list_categories:
+        print("📊 Parsing documentation structure...", flush=True, file=sys.stderr)
+        parsed = parse_llms_txt(stream_llms_txt(cache))
+        if cache:
+            cache.prune()
 
-    # List available options if requested
     if args.list_languages:
         print("\n📚 Available languages:")
         for lang in parsed['all_languages']:
@@ -164,33 +157,38 @@ def main():
             print(f"  • {cat}: {categories_count[cat]} files")
         return
 
-    # Filter results
-    results = filter_by_criteria(parsed, args.language, args.category)
-
-    import sys
-    print(f"\n✅ Found {len(results)} files", file=sys.stderr)
-    if args.language:
-        print(f"   Language: {args.language}", file=sys.stderr)
-    if args.category:
-        print(f"   Category: {args.category}", file=sys.stderr)
-    print(file=sys.stderr)
+    # Filter while streaming: entries are written as soon as they are parsed
+    print("📊 Streaming documentation entries...", flush=True, file=sys.stderr)
+    results = iter_entries(stream_llms_txt(cache), args.language, args.category)
 
     # Format output
     if args.format == 'urls':
-        output = [item['url'] for item in results]
+        output = (item['url'] for item in results)
     elif args.format == 'paths':
-        output = [item['file_path'] for item in results]
-    else:  # json
+        output = (item['file_path'] for item in results)
+    else:  # json, jsonl
         output = results
 
+    write = write_json_lines if args.format == 'jsonl' else write_json_array
+
     # Save or print
     if args.output:
         with open(args.output, 'w') as f:
-            json.dump(output, f, indent=2)
-        import sys
-        print(f"💾 Saved to: {args.output}", file=sys.stderr)
+            count = write(output, f)
     else:
-        print(json.dumps(output, indent=2))
+        count = write(output, sys.stdout)
+
+    if cache:
+        cache.prune()
+
+    print(f"\n✅ Found {count} files", file=sys.stderr)
+    if args.language:
+        print(f"   Language: {args.language}", file=sys.stderr)
+    if args.category:
+        print(f"   Category: {args.category}", file=sys.stderr)
+    if args.output:
+        print(f"💾 Saved to: {args.output}", file=sys.stderr)
+    print(file=sys.stderr)
 
 if __name__ == '__main__':
     main()
@@ -4,25 +4,49 @@ Parse llms.txt from Model Context Protocol documentation.
 Simpler than Claude parser - no language/category filtering needed.
 """
 
-import re
 import json
-import urllib.request
 import argparse
 import sys
 
-def fetch_llms_txt(url='https://modelcontextprotocol.io/llms.txt'):
-    """Fetch the llms.txt file from MCP docs."""
-    req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0'})
+from llms_links import match_mcp_links
+from scraper_http import (
+    add_cache_arguments, add_fetch_arguments, cache_from_args,
+    configure_scheduler, fetch_url
+)
 
-    with urllib.request.urlopen(req, timeout=30) as response:
-        return response.read().decode('utf-8')
+def fetch_llms_txt(url='https://modelcontextprotocol.io/llms.txt', cache=None):
+    """Fetch the llms.txt file from MCP docs (revalidated through the cache, if given)."""
+    return fetch_url(url, cache=cache, timeout=30).decode('utf-8')
 
-def parse_llms_txt(content):
+def iter_entries(lines):
     """
-    Parse MCP llms.txt and extract structured data.
+    Lazily parse MCP llms.txt lines, yielding file entries in file order.
 
     Format: - [Title](URL): Description
     Example: - [What is MCP?](https://modelcontextprotocol.io/docs/getting-started/intro): Introduction
+    """
+    for line in lines:
+        for title, full_url, path, description in match_mcp_links(line):
+            # Skip if no URL path (header lines, etc.)
+            if not path:
+                continue
+
+            # Derive file name from path
+            file_name = path.split('/')[-1]
+            if not file_name.endswith('.md'):
+                file_name += '.md'
+
+            yield {
+                'title': title,
+                'url': full_url,
+                'path': path,
+                'description': description,
+                'file_name': file_name
+            }
+
+def parse_llms_txt(content):
+    """
+    Parse MCP llms.txt and extract structured data.
 
     Returns:
         list: [
@@ -36,36 +60,7 @@ def parse_llms_txt(content):
             ...
         ]
     """
-    results = []
-
-    # Pattern: - [Title](URL): Description
-    # Matches: - [Text](https://modelcontextprotocol.io/path/to/page): Description text
-    pattern = r'-\s+\[([^\]]+)\]\((https://modelcontextprotocol\.io([^)]+))\)(?::\s+(.+))?'
-
-    for match in re.finditer(pattern, content):
-        title = match.group(1).strip()
-        full_url = match.group(2).strip()
-        path = match.group(3).strip()
-        description = match.group(4).strip() if match.group(4) else ''
-
-        # Skip if no URL path (header lines, etc.)
-        if not path:
-            continue
-
-        # Derive file name from path
-        file_name = path.split('/')[-1]
-        if not file_name.endswith('.md'):
-            file_name += '.md'
-
-        results.append({
-            'title': title,
-            'url': full_url,
-            'path': path,
-            'description': description,
-            'file_name': file_name
-        })
-
-    return results
+    return list(iter_entries(content.splitlines()))
 
 def main():
     parser = argparse.ArgumentParser(
@@ -93,13 +88,19 @@ def main():
         action='store_true',
         help='Only output data, no status messages'
     )
+    add_cache_arguments(parser)
+    add_fetch_arguments(parser)
 
     args = parser.parse_args()
+    configure_scheduler(args)
 
     if not args.silent:
         print(f"🔍 Fetching llms.txt from {args.url}...", flush=True, file=sys.stderr)
 
-    content = fetch_llms_txt(args.url)
+    cache = cache_from_args(args)
+    content = fetch_llms_txt(args.url, cache)
+    if cache:
+        cache.prune()
 
     if not args.silent:
         print("📊 Parsing file list...", flush=True, file=sys.stderr)
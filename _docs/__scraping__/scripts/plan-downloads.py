@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Plan output paths for downloaded Claude documentation.
+Maps every llms.txt entry to its numbered navigation folder and filename in a
+single pass, using a file → (category, index) index built once from the
+scraped sidebar. Output is the JSON plan consumed by download-files.py;
+JSON Lines input is planned and written entry by entry as it arrives.
+"""
+
+import json
+import sys
+import argparse
+from pathlib import PurePosixPath
+
+from jsonstream import read_records, write_json_array, write_json_lines
+
+UNCATEGORIZED_FOLDER = '99-uncategorized'
+
+
+def build_nav_index(navigation):
+    """
+    Index scraped navigation by file.
+
+    Args:
+        navigation: Output of scrape-navigation.py ({category: [files...]}, in sidebar order)
+
+    Returns:
+        dict: {file_path: (category, numbered_folder, file_index)}. A file listed
+        in several categories maps to the first one, like the sidebar shows it.
+    """
+    index = {}
+    for cat_index, (category, files) in enumerate(navigation.items(), 1):
+        folder = f'{cat_index:02d}-{category}'
+        for file_index, file_path in enumerate(files, 1):
+            index.setdefault(file_path, (category, folder, file_index))
+    return index
+
+
+def plan_entry(item, nav_index):
+    """Map one llms.txt entry to a download plan entry."""
+    file_path = item['file_path']
+
+    if nav_index is None:
+        # Flat structure
+        return {'url': item['url'], 'output_path': file_path, 'nav_position': None}
+
+    if file_path not in nav_index:
+        return {
+            'url': item['url'],
+            'output_path': f'{UNCATEGORIZED_FOLDER}/{file_path}',
+            'nav_position': None
+        }
+
+    category, folder, file_index = nav_index[file_path]
+    # Prefix filename with its navigation order
+    filename = f'{file_index:02d}-{PurePosixPath(file_path).name}'
+    return {
+        'url': item['url'],
+        'output_path': f'{folder}/{filename}',
+        'nav_position': {'category': category, 'index': file_index}
+    }
+
+
+def plan_downloads(items, navigation=None):
+    """
+    Lazily build the download plan for llms.txt entries.
+
+    Args:
+        items: Iterable from parse-llms-txt.py (entries with 'url' and 'file_path')
+        navigation: Optional scraped navigation; None for a flat structure
+
+    Yields:
+        dict: {'url', 'output_path', 'nav_position'}
+    """
+    nav_index = build_nav_index(navigation) if navigation is not None else None
+    for item in items:
+        yield plan_entry(item, nav_index)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Plan numbered output paths for llms.txt entries'
+    )
+    parser.add_argument(
+        'input',
+        nargs='?',
+        default='-',
+        help='JSON or JSON Lines from parse-llms-txt.py (default: stdin)'
+    )
+    parser.add_argument(
+        '--nav',
+        default=None,
+        help='Navigation JSON from scrape-navigation.py (default: flat structure)'
+    )
+    parser.add_argument(
+        '-o', '--output',
+        help='Output file for the plan JSON',
+        default=None
+    )
+    parser.add_argument(
+        '--format',
+        choices=['json', 'jsonl'],
+        default='json',
+        help='Output format: json (array), jsonl (one plan entry per line)'
+    )
+
+    args = parser.parse_args()
+
+    navigation = None
+    if args.nav:
+        with open(args.nav) as f:
+            navigation = json.load(f)
+
+    source = sys.stdin if args.input == '-' else open(args.input)
+    write = write_json_lines if args.format == 'jsonl' else write_json_array
+    try:
+        plan = plan_downloads(read_records(source), navigation)
+        if args.output:
+            with open(args.output, 'w') as f:
+                write(plan, f)
+        else:
+            write(plan, sys.stdout)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+if __name__ == '__main__':
+    main()
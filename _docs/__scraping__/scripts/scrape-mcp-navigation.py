@@ -7,15 +7,22 @@ Extracts 3-level hierarchy: sections → subsections → pages.
 import re
 import json
 import sys
+import time
 import argparse
-import urllib.request
 from html.parser import HTMLParser
 
+from scraper_http import (
+    add_cache_arguments, add_fetch_arguments, cache_from_args,
+    configure_scheduler, parse_url, scrape_pages
+)
+
 class MCPNavParser(HTMLParser):
     def __init__(self, section_name):
         super().__init__()
         self.section_name = section_name
         self.in_nav = False
+        self.nav_depth = 0
+        self.done = False
         self.in_subsection_header = False
         self.in_sidebar_title = False
         self.in_sidebar_group = False
@@ -30,9 +37,13 @@ class MCPNavParser(HTMLParser):
     def handle_starttag(self, tag, attrs):
         attrs_dict = dict(attrs)
 
-        # Detect navigation section
-        if tag == 'div' and attrs_dict.get('id') == 'navigation-items':
-            self.in_nav = True
+        # Detect navigation section, tracking div nesting to see where it closes
+        if tag == 'div':
+            if self.in_nav:
+                self.nav_depth += 1
+            elif not self.done and attrs_dict.get('id') == 'navigation-items':
+                self.in_nav = True
+                self.nav_depth = 1
 
         # Detect subsection header
         if self.in_nav and tag == 'div' and 'sidebar-group-header' in attrs_dict.get('class', ''):
@@ -159,24 +170,27 @@ class MCPNavParser(HTMLParser):
         if tag == 'div' and 'mt-6' in str(self.get_starttag_text() if hasattr(self, 'get_starttag_text') else ''):
             self.current_subsection = None
 
-def scrape_section(url, section_name):
-    """Fetch and parse navigation structure for one section."""
-    print(f"🔍 Fetching {section_name}: {url}...", flush=True, file=sys.stderr)
-    req = urllib.request.Request(
-        url,
-        headers={'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'}
-    )
+        # End of navigation: nothing further down the page matters
+        if tag == 'div' and self.in_nav:
+            self.nav_depth -= 1
+            if self.nav_depth == 0:
+                self.in_nav = False
+                self.done = True
 
-    try:
-        with urllib.request.urlopen(req, timeout=30) as response:
-            html = response.read().decode('utf-8')
-    except Exception as e:
-        print(f"✗ Failed to fetch {section_name}: {e}", file=sys.stderr)
-        return None
+SECTIONS = {
+    'documentation': 'https://modelcontextprotocol.io/docs/getting-started/intro',
+    'specification': 'https://modelcontextprotocol.io/specification/2025-06-18',
+    'community': 'https://modelcontextprotocol.io/community/communication',
+    'about': 'https://modelcontextprotocol.io/about'
+}
 
-    print(f"📊 Parsing {section_name} navigation...", flush=True, file=sys.stderr)
-    parser = MCPNavParser(section_name)
-    parser.feed(html)
+# Output key holding per-section timing; never a section name
+SCRAPE_REPORT_KEY = '_scrape'
+
+def parse_section(url, section_name, cache=None):
+    """Stream one section page into MCPNavParser, stopping once the sidebar closes."""
+    parser, bytes_read = parse_url(url, lambda: MCPNavParser(section_name), cache=cache)
+    print(f"📊 Parsed {section_name} navigation ({bytes_read // 1024} KB read)...", flush=True, file=sys.stderr)
 
     # Build result structure
     result = {
@@ -189,26 +203,37 @@ def scrape_section(url, section_name):
 
     return result
 
-def scrape_all_sections():
-    """Scrape all 4 main sections of MCP documentation."""
-    sections = {
-        'documentation': 'https://modelcontextprotocol.io/docs/getting-started/intro',
-        'specification': 'https://modelcontextprotocol.io/specification/2025-06-18',
-        'community': 'https://modelcontextprotocol.io/community/communication',
-        'about': 'https://modelcontextprotocol.io/about'
-    }
-
-    navigation = {}
+def scrape_sections(sections, cache=None):
+    """
+    Fetch and parse several sections concurrently.
 
+    Returns:
+        dict: {section_name: navigation, ..., '_scrape': report}. Failed
+        sections are left out; the report lists every section with its
+        URL, elapsed time and error.
+    """
     for section_name, url in sections.items():
-        result = scrape_section(url, section_name)
-        if result:
-            navigation[section_name] = result
-        else:
-            print(f"⚠️  Warning: Failed to scrape {section_name}", file=sys.stderr)
+        print(f"🔍 Fetching {section_name}: {url}...", flush=True, file=sys.stderr)
 
+    start = time.monotonic()
+    navigation, report = scrape_pages(
+        sections, lambda name, url: parse_section(url, name, cache)
+    )
+
+    for section_name, entry in report.items():
+        if not entry['ok']:
+            print(f"✗ Failed to scrape {section_name}: {entry['error']}", file=sys.stderr)
+
+    navigation[SCRAPE_REPORT_KEY] = {
+        'elapsed_ms': round((time.monotonic() - start) * 1000),
+        'sections': report
+    }
     return navigation
 
+def scrape_all_sections(cache=None):
+    """Scrape all 4 main sections of MCP documentation."""
+    return scrape_sections(SECTIONS, cache)
+
 def main():
     parser = argparse.ArgumentParser(
         description='Scrape navigation structure from MCP documentation'
@@ -233,36 +258,48 @@ def main():
         action='store_true',
         help='Only output JSON, no status messages'
     )
+    add_cache_arguments(parser)
+    add_fetch_arguments(parser)
 
     args = parser.parse_args()
+    configure_scheduler(args)
+    cache = cache_from_args(args)
 
     # Scrape navigation
     if args.section and args.url:
         # Scrape single section with custom URL
-        navigation = {args.section: scrape_section(args.url, args.section)}
+        navigation = scrape_sections({args.section: args.url}, cache)
     elif args.section:
         print("✗ Error: --url is required when using --section", file=sys.stderr)
         sys.exit(1)
     else:
         # Scrape all sections
-        navigation = scrape_all_sections()
+        navigation = scrape_all_sections(cache)
+
+    if cache:
+        cache.prune()
 
-    if not navigation:
+    report = navigation[SCRAPE_REPORT_KEY]
+    scraped = len(navigation) - 1
+    if not scraped:
         print("✗ Failed to scrape any sections", file=sys.stderr)
         sys.exit(1)
 
     if not args.silent:
         print("\n✅ Navigation structure extracted!", file=sys.stderr)
-        print(f"Scraped {len(navigation)} main sections:\n", file=sys.stderr)
+        print(f"Scraped {scraped} main sections in {report['elapsed_ms']} ms:\n", file=sys.stderr)
 
         for section_name, section_data in navigation.items():
+            if section_name == SCRAPE_REPORT_KEY:
+                continue
             if section_data:
                 top_level_count = len(section_data.get('top_level', []))
                 subsection_count = len(section_data.get('subsections', {}))
                 total_pages = top_level_count
                 for pages in section_data.get('subsections', {}).values():
                     total_pages += len(pages)
-                print(f"  • {section_name}: {total_pages} pages ({subsection_count} subsections)", file=sys.stderr)
+                elapsed_ms = report['sections'][section_name]['elapsed_ms']
+                print(f"  • {section_name}: {total_pages} pages ({subsection_count} subsections, {elapsed_ms} ms)", file=sys.stderr)
 
     # Save or print
     if args.output:
@@ -7,10 +7,15 @@ Extracts categories and their files directly from the HTML sidebar.
 import re
 import json
 import sys
+import time
 import argparse
-import urllib.request
 from html.parser import HTMLParser
 
+from scraper_http import (
+    add_cache_arguments, add_fetch_arguments, cache_from_args,
+    configure_scheduler, parse_url, scrape_pages
+)
+
 class NavParser(HTMLParser):
     def __init__(self, language, category):
         super().__init__()
@@ -18,6 +23,8 @@ class NavParser(HTMLParser):
         self.category = category
         self.search_pattern = f'/{language}/docs/{category}/'
         self.in_nav = False
+        self.nav_depth = 0
+        self.done = False
         self.in_category_header = False
         self.in_sidebar_title = False
         self.current_category = None
@@ -27,9 +34,13 @@ class NavParser(HTMLParser):
     def handle_starttag(self, tag, attrs):
         attrs_dict = dict(attrs)
 
-        # Detect navigation section
-        if tag == 'div' and attrs_dict.get('id') == 'navigation-items':
-            self.in_nav = True
+        # Detect navigation section, tracking div nesting to see where it closes
+        if tag == 'div':
+            if self.in_nav:
+                self.nav_depth += 1
+            elif not self.done and attrs_dict.get('id') == 'navigation-items':
+                self.in_nav = True
+                self.nav_depth = 1
 
         # Detect category header
         if self.in_nav and tag == 'div' and 'sidebar-group-header' in attrs_dict.get('class', ''):
@@ -71,34 +82,110 @@ class NavParser(HTMLParser):
             self.in_sidebar_title = False
             self.in_category_header = False
         elif tag == 'div' and self.in_nav:
-            # Could be end of navigation
-            pass
+            self.nav_depth -= 1
+            if self.nav_depth == 0:
+                # End of navigation: nothing further down the page matters
+                self.in_nav = False
+                self.done = True
+
+# Output key holding per-category timing in multi-category output
+SCRAPE_REPORT_KEY = '_scrape'
+
+def category_url(language, category):
+    """Sidebar page scraped for a category."""
+    return f'https://docs.claude.com/{language}/docs/{category}/overview'
+
+def parse_navigation(url, language, category, cache=None):
+    """
+    Stream a category page into NavParser, stopping once the sidebar closes.
+
+    Returns:
+        dict: Ordered {nav_category: [files]}
+    """
+    parser, bytes_read = parse_url(url, lambda: NavParser(language, category), cache=cache)
+    print(f"📊 Parsed {category} navigation structure ({bytes_read // 1024} KB read)...", flush=True, file=sys.stderr)
+
+    # Create ordered dict
+    result = {}
+    for cat in parser.category_order:
+        result[cat] = parser.categories[cat]
 
-def scrape_navigation(url, language, category):
+    return result
+
+def scrape_navigation(url, language, category, cache=None):
     """Fetch and parse navigation structure from Claude docs."""
     print(f"🔍 Fetching page: {url}...", flush=True, file=sys.stderr)
-    req = urllib.request.Request(
-        url,
-        headers={'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'}
-    )
 
     try:
-        with urllib.request.urlopen(req) as response:
-            html = response.read().decode('utf-8')
+        result = parse_navigation(url, language, category, cache)
     except Exception as e:
         print(f"✗ Failed to fetch page: {e}", file=sys.stderr)
         return None, []
 
-    print("📊 Parsing navigation structure...", flush=True, file=sys.stderr)
-    parser = NavParser(language, category)
-    parser.feed(html)
+    return result, list(result)
 
-    # Create ordered dict
-    result = {}
-    for cat in parser.category_order:
-        result[cat] = parser.categories[cat]
+def scrape_categories(language, categories, cache=None):
+    """
+    Fetch and parse the sidebars of several categories concurrently.
 
-    return result, parser.category_order
+    Returns:
+        dict: {category: {nav_category: [files]}, ..., '_scrape': report}.
+        Failed categories are left out; the report lists every category with
+        its URL, elapsed time and error.
+    """
+    targets = {category: category_url(language, category) for category in categories}
+    for category, url in targets.items():
+        print(f"🔍 Fetching page: {url}...", flush=True, file=sys.stderr)
+
+    start = time.monotonic()
+    navigation, report = scrape_pages(
+        targets, lambda category, url: parse_navigation(url, language, category, cache)
+    )
+
+    for category, entry in report.items():
+        if not entry['ok']:
+            print(f"✗ Failed to scrape {category}: {entry['error']}", file=sys.stderr)
+
+    navigation[SCRAPE_REPORT_KEY] = {
+        'elapsed_ms': round((time.monotonic() - start) * 1000),
+        'categories': report
+    }
+    return navigation
+
+def write_output(data, output, silent):
+    """Save navigation JSON to a file, or print it to stdout for piping."""
+    if output:
+        with open(output, 'w') as f:
+            json.dump(data, f, indent=2)
+        if not silent:
+            print(f"💾 Saved to: {output}", file=sys.stderr)
+    else:
+        print(json.dumps(data, indent=2))
+
+def scrape_multiple(args, requested):
+    """Scrape several categories concurrently and write the combined output."""
+    cache = cache_from_args(args)
+    navigation = scrape_categories(args.language, requested, cache)
+    if cache:
+        cache.prune()
+
+    report = navigation[SCRAPE_REPORT_KEY]
+    if len(navigation) == 1:
+        print("✗ Failed to scrape any categories", file=sys.stderr)
+        sys.exit(1)
+
+    if not args.silent:
+        print("\n✅ Navigation structure extracted!", file=sys.stderr)
+        print(f"Scraped {len(navigation) - 1}/{len(requested)} categories in {report['elapsed_ms']} ms:\n", file=sys.stderr)
+        for category, entry in report['categories'].items():
+            if entry['ok']:
+                files = sum(len(f) for f in navigation[category].values())
+                print(f"  • {category}: {len(navigation[category])} sections, {files} files ({entry['elapsed_ms']} ms)", file=sys.stderr)
+            else:
+                print(f"  • {category}: failed ({entry['error']})", file=sys.stderr)
+        print("", file=sys.stderr)
+
+    write_output(navigation, args.output, args.silent)
 
 def main():
     parser = argparse.ArgumentParser(
@@ -111,12 +198,14 @@ def main():
     )
     parser.add_argument(
         '-c', '--category',
-        default='claude-code',
-        help='Category to scrape (default: claude-code)'
+        action='append',
+        default=None,
+        help='Category to scrape (default: claude-code). Repeat to scrape several '
+             'categories concurrently; the output is then keyed by category'
     )
     parser.add_argument(
         '-u', '--url',
-        help='Custom URL to scrape (overrides language/category)'
+        help='Custom URL to scrape (overrides language/category, single category only)'
     )
     parser.add_argument(
         '-o', '--output',
@@ -128,17 +217,33 @@ def main():
         action='store_true',
         help='Only output JSON, no status messages'
     )
+    add_cache_arguments(parser)
+    add_fetch_arguments(parser)
 
     args = parser.parse_args()
+    configure_scheduler(args)
+    requested = list(dict.fromkeys(args.category or ['claude-code']))
+
+    if len(requested) > 1:
+        if args.url:
+            print("✗ Error: --url cannot be combined with several categories", file=sys.stderr)
+            sys.exit(1)
+        scrape_multiple(args, requested)
+        return
+
+    category = requested[0]
 
     # Construct URL
     if args.url:
         url = args.url
     else:
-        url = f'https://docs.claude.com/{args.language}/docs/{args.category}/overview'
+        url = category_url(args.language, category)
 
     # Scrape navigation
-    categories, order = scrape_navigation(url, args.language, args.category)
+    cache = cache_from_args(args)
+    categories, order = scrape_navigation(url, args.language, category, cache)
+    if cache:
+        cache.prune()
 
     if categories is None:
         sys.exit(1)
@@ -156,14 +261,7 @@ def main():
         print(f"\nTotal files: {total_files}\n", file=sys.stderr)
 
     # Save or print
-    if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(categories, f, indent=2)
-        if not args.silent:
-            print(f"💾 Saved to: {args.output}", file=sys.stderr)
-    else:
-        # Print to stdout for piping
-        print(json.dumps(categories, indent=2))
+    write_output(categories, args.output, args.silent)
 
 if __name__ == '__main__':
     main()
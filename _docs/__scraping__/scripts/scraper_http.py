@@ -0,0 +1,863 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP helpers for the documentation scrapers.
+Keeps persistent keep-alive connections per host so bulk downloads reuse
+TCP/TLS sessions instead of reconnecting for every file, and an on-disk
+conditional-GET cache (ETag / Last-Modified) so unchanged pages come back
+as 304 and are served from disk. stream_url()/iter_lines() hand out bodies
+chunk by chunk as they arrive, for parsers that work incrementally;
+parse_url() feeds an HTML parser and hangs up once it has what it needs.
+
+Every request goes through one FetchScheduler: a global concurrency cap, an
+optional per-host token-bucket rate limit, and retries with jittered
+exponential backoff for connection errors, 429 and 5xx (honouring
+Retry-After, which also pauses the whole host).
+"""
+
+import codecs
+import gzip
+import hashlib
+import http.client
+import json
+import os
+import random
+import sys
+import argparse
+import threading
+import time
+import urllib.parse
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+
+USER_AGENT = 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
+MAX_REDIRECTS = 5
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+STREAM_CHUNK_SIZE = 64 * 1024
+
+DEFAULT_CACHE_DIR = Path(
+    os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+) / 'claude-docs-scraper'
+# Entries younger than this are served without contacting the server at all;
+# older ones are revalidated with a conditional GET.
+DEFAULT_CACHE_TTL = 600
+DEFAULT_CACHE_MAX_MB = 512
+
+# Transient failures worth retrying; everything else is returned as is
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+DEFAULT_RETRIES = 4
+DEFAULT_BACKOFF = 0.5
+MAX_BACKOFF = 30
+# A Retry-After longer than this is treated as a hard failure
+MAX_RETRY_AFTER = 300
+DEFAULT_MAX_CONCURRENCY = 32
+
+# Space-separated origin=target pairs, e.g.
+# "https://docs.claude.com=http://127.0.0.1:8765". Requests for a mapped
+# origin are sent to the target server with the original Host header, so the
+# pipeline can run against tests/mock-docs-server.py unchanged.
+ORIGIN_MAP_ENV = 'SCRAPER_ORIGIN_MAP'
+
+
+class FetchError(Exception):
+    """Raised when a URL cannot be fetched (HTTP error or too many redirects)."""
+
+    def __init__(self, url, message, status=None):
+        super().__init__(f'{url}: {message}')
+        self.url = url
+        self.status = status
+
+
+class HTTPCache:
+    """
+    On-disk HTTP cache keyed by URL.
+
+    Each entry is a body file plus a JSON sidecar holding the validators
+    (ETag, Last-Modified), fetch time and last access time. The total size
+    is capped; prune() evicts least recently used entries first.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, ttl=DEFAULT_CACHE_TTL,
+                 max_bytes=DEFAULT_CACHE_MAX_MB * 1024 * 1024):
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        base = self.directory / key[:2] / key
+        return base.with_suffix('.json'), base.with_suffix('.body')
+
+    @staticmethod
+    def _write_atomic(path, data):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def lookup(self, url, allow_partial=False):
+        """
+        Return the cached metadata for a URL, or None if not cached.
+
+        Entries holding only a prefix of the body (see stream_url()) are
+        returned only with allow_partial.
+        """
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            return None
+        if meta.get('url') != url or not body_path.exists():
+            return None
+        if meta.get('partial') and not allow_partial:
+            return None
+        return meta
+
+    def is_fresh(self, meta):
+        """True if the entry is within its TTL and needs no revalidation."""
+        return time.time() - meta.get('fetched_at', 0) < self.ttl
+
+    @staticmethod
+    def validators(meta):
+        """Conditional request headers for a cached entry."""
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+
+    def _touch(self, url, meta):
+        meta['accessed_at'] = time.time()
+        meta_path, _ = self._paths(url)
+        self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+
+    def load(self, url, meta):
+        """Read a cached body and record the access for LRU eviction."""
+        _, body_path = self._paths(url)
+        body = body_path.read_bytes()
+        self._touch(url, meta)
+        return body
+
+    def iter_body(self, url, meta, chunk_size=STREAM_CHUNK_SIZE):
+        """Yield a cached body in chunks and record the access."""
+        _, body_path = self._paths(url)
+        self._touch(url, meta)
+        with open(body_path, 'rb') as f:
+            while chunk := f.read(chunk_size):
+                yield chunk
+
+    @staticmethod
+    def _new_meta(url, headers, size):
+        now = time.time()
+        return {
+            'url': url,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'size': size,
+            'fetched_at': now,
+            'accessed_at': now
+        }
+
+    def store(self, url, headers, body):
+        """Cache a 200 response body with its validators."""
+        meta_path, body_path = self._paths(url)
+        self._write_atomic(body_path, body)
+        meta = self._new_meta(url, headers, len(body))
+        self._write_atomic(meta_path, json.dumps(meta).encode('utf-8'))
+
+    def writer(self, url, headers):
+        """Start caching a streamed 200 response; see CacheWriter."""
+        return CacheWriter(self, url, headers)
+
+    def refresh(self, url, meta, headers):
+        """Record a 304 revalidation: new validators and fetch time."""
+        if headers.get('ETag'):
+            meta['etag'] = headers['ETag']
+        if headers.get('Last-Modified'):
+            meta['last_modified'] = headers['Last-Modified']
+        meta['fetched_at'] = time.time()
+        self._touch(url, meta)
+
+    def revalidated(self, url, meta, headers):
+        """Refresh an entry after a 304 and return its cached body."""
+        self.refresh(url, meta, headers)
+        _, body_path = self._paths(url)
+        return body_path.read_bytes()
+
+    def prune(self):
+        """Evict least recently used entries until the cache fits max_bytes."""
+        entries = []
+        total = 0
+        for meta_path in self.directory.glob('*/*.json'):
+            try:
+                meta = json.loads(meta_path.read_text())
+            except (OSError, ValueError):
+                continue
+            size = meta.get('size', 0)
+            total += size
+            entries.append((meta.get('accessed_at', 0), size, meta_path))
+
+        entries.sort()
+        for _, size, meta_path in entries:
+            if total <= self.max_bytes:
+                break
+            meta_path.unlink(missing_ok=True)
+            meta_path.with_suffix('.body').unlink(missing_ok=True)
+            total -= size
+
+
+class CacheWriter:
+    """
+    Incrementally caches a streamed response body.
+
+    Chunks go to a temporary file; commit() publishes the entry, abort()
+    discards it (e.g. when the consumer stops reading half way). A prefix
+    committed with partial=True is only served to callers that accept one.
+    """
+
+    def __init__(self, cache, url, headers):
+        self.cache = cache
+        self.url = url
+        self.headers = headers
+        self.size = 0
+        self._meta_path, self._body_path = cache._paths(url)
+        self._body_path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp = self._body_path.with_name(
+            f'{self._body_path.name}.{os.getpid()}.{threading.get_ident()}.tmp'
+        )
+        self._file = open(self._tmp, 'wb')
+
+    def write(self, chunk):
+        self._file.write(chunk)
+        self.size += len(chunk)
+
+    def commit(self, partial=False):
+        self._file.close()
+        os.replace(self._tmp, self._body_path)
+        meta = self.cache._new_meta(self.url, self.headers, self.size)
+        if partial:
+            meta['partial'] = True
+        self.cache._write_atomic(self._meta_path, json.dumps(meta).encode('utf-8'))
+
+    def abort(self):
+        self._file.close()
+        self._tmp.unlink(missing_ok=True)
+
+
+class TokenBucket:
+    """
+    Request rate limit for one host: `rate` requests per second on average,
+    bursts of up to `burst`. A rate of None only enforces pause().
+    """
+
+    def __init__(self, rate=None, burst=None):
+        self.rate = rate
+        self.capacity = burst or max(1.0, rate or 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.not_before = 0.0
+        self._lock = threading.Lock()
+
+    def pause(self, seconds):
+        """Hold back every request to this host for `seconds`."""
+        with self._lock:
+            self.not_before = max(self.not_before, time.monotonic() + seconds)
+
+    def acquire(self):
+        """Block until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self.not_before:
+                    wait = self.not_before - now
+                elif not self.rate:
+                    return
+                else:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date), or None."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class FetchScheduler:
+    """
+    Admission control shared by every request the scrapers make.
+
+    Each attempt waits for its host's token bucket, then takes one of
+    `max_concurrency` global slots. Connection errors and RETRY_STATUSES are
+    retried up to `retries` times with full-jitter exponential backoff, or
+    after Retry-After when the server sends one. A 429/503 pauses the host
+    for every worker, not just the one that got it.
+    """
+
+    def __init__(self, retries=DEFAULT_RETRIES, rate=None, burst=None,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY,
+                 backoff=DEFAULT_BACKOFF, max_backoff=MAX_BACKOFF):
+        self.retries = retries
+        self.rate = rate
+        self.burst = burst
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, host):
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return self._buckets[host]
+
+    @contextmanager
+    def slot(self, host):
+        """Admit one request to `host`."""
+        self._bucket(host).acquire()
+        if self._slots:
+            self._slots.acquire()
+        try:
+            yield
+        finally:
+            if self._slots:
+                self._slots.release()
+
+    def backoff_delay(self, attempt):
+        """Full-jitter exponential backoff for the given retry number (0-based)."""
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+
+    def run(self, url, attempt, discard=None):
+        """
+        Call attempt() under the scheduler, retrying transient failures.
+
+        Args:
+            url: URL being requested (its host selects the rate limit)
+            attempt: Callable performing one try, returning (status, headers, ...)
+            discard: Optional callable releasing a result that will be retried
+
+        Returns:
+            The result of the last attempt. Connection errors from the last
+            attempt are raised.
+        """
+        host = urllib.parse.urlsplit(url).netloc
+        for n in range(self.retries + 1):
+            try:
+                with self.slot(host):
+                    result = attempt()
+            except (http.client.HTTPException, OSError):
+                if n == self.retries:
+                    raise
+                time.sleep(self.backoff_delay(n))
+                continue
+
+            status, headers = result[0], result[1]
+            if status not in RETRY_STATUSES or n == self.retries:
+                return result
+
+            delay = parse_retry_after(headers.get('Retry-After'))
+            if delay is None:
+                delay = self.backoff_delay(n)
+            elif delay > MAX_RETRY_AFTER:
+                return result
+            if status in (429, 503):
+                self._bucket(host).pause(delay)
+            if discard:
+                discard(result)
+            time.sleep(delay)
+
+
+_scheduler = FetchScheduler()
+
+
+def get_scheduler():
+    """The scheduler used by requests that are not given one explicitly."""
+    return _scheduler
+
+
+def set_scheduler(scheduler):
+    """Replace the process-wide default scheduler."""
+    global _scheduler
+    _scheduler = scheduler
+
+
+def _load_origin_map():
+    mapping = {}
+    for item in os.environ.get(ORIGIN_MAP_ENV, '').split():
+        origin, _, target = item.partition('=')
+        if target:
+            target = urllib.parse.urlsplit(target)
+            mapping[origin.rstrip('/')] = (target.scheme, target.netloc)
+    return mapping
+
+
+ORIGIN_MAP = _load_origin_map()
+
+
+def _route(parts, headers):
+    """
+    (scheme, netloc) to connect to for a URL, after SCRAPER_ORIGIN_MAP.
+
+    A rerouted request keeps the original host in its Host header.
+    """
+    target = ORIGIN_MAP.get(f'{parts.scheme}://{parts.netloc}')
+    if target is None:
+        return parts.scheme, parts.netloc
+    headers['Host'] = parts.netloc
+    return target
+
+
+def _connect(scheme, netloc, timeout):
+    if scheme == 'https':
+        return http.client.HTTPSConnection(netloc, timeout=timeout)
+    return http.client.HTTPConnection(netloc, timeout=timeout)
+
+
+def _request_path(parts):
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+    return path
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of keep-alive HTTP(S) connections.
+
+    At most `per_host` requests are in flight per host; idle connections are
+    returned to the pool and reused by the next request to the same host.
+    When a cache is given, fetch() revalidates cached entries instead of
+    downloading them again. Every request is admitted and retried by the
+    scheduler (default: the process-wide one).
+    """
+
+    def __init__(self, per_host=8, timeout=30, cache=None, scheduler=None):
+        self.per_host = per_host
+        self.timeout = timeout
+        self.cache = cache
+        self.scheduler = scheduler
+        self._lock = threading.Lock()
+        self._idle = {}
+        self._slots = {}
+
+    def _slot(self, key):
+        with self._lock:
+            if key not in self._slots:
+                self._slots[key] = threading.BoundedSemaphore(self.per_host)
+            return self._slots[key]
+
+    def _checkout(self, key):
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop()
+        return None
+
+    def _checkin(self, key, conn):
+        with self._lock:
+            self._idle.setdefault(key, []).append(conn)
+
+    def _request_once(self, url, headers):
+        parts = urllib.parse.urlsplit(url)
+        path = _request_path(parts)
+
+        request_headers = {
+            'User-Agent': USER_AGENT,
+            'Accept-Encoding': 'gzip',
+        }
+        request_headers.update(headers or {})
+        key = _route(parts, request_headers)
+
+        with self._slot(key):
+            # A reused keep-alive socket may have been closed by the server;
+            # retry once on a fresh connection before giving up.
+            for _ in range(2):
+                conn = self._checkout(key)
+                reused = conn is not None
+                if not reused:
+                    conn = _connect(*key, self.timeout)
+                try:
+                    conn.request('GET', path, headers=request_headers)
+                    response = conn.getresponse()
+                    body = response.read()
+                except (http.client.HTTPException, OSError):
+                    conn.close()
+                    if reused:
+                        continue
+                    raise
+
+                if response.will_close:
+                    conn.close()
+                else:
+                    self._checkin(key, conn)
+
+                if response.headers.get('Content-Encoding') == 'gzip':
+                    body = gzip.decompress(body)
+                return response.status, response.headers, body
+
+        raise FetchError(url, 'connection dropped')
+
+    def request(self, url, headers=None):
+        """
+        GET a URL, following redirects.
+
+        Returns:
+            tuple: (status, headers, body) for the final response
+        """
+        scheduler = self.scheduler or get_scheduler()
+        for _ in range(MAX_REDIRECTS + 1):
+            status, response_headers, body = scheduler.run(
+                url, lambda: self._request_once(url, headers)
+            )
+            location = response_headers.get('Location')
+            if status in REDIRECT_STATUSES and location:
+                url = urllib.parse.urljoin(url, location)
+                continue
+            return status, response_headers, body
+
+        raise FetchError(url, 'too many redirects')
+
+    def fetch(self, url, headers=None):
+        """GET a URL and return the body, raising FetchError on HTTP errors."""
+        meta = self.cache.lookup(url) if self.cache else None
+        if meta:
+            if self.cache.is_fresh(meta):
+                return self.cache.load(url, meta)
+            headers = {**(headers or {}), **self.cache.validators(meta)}
+
+        status, response_headers, body = self.request(url, headers)
+        if status == 304 and meta:
+            return self.cache.revalidated(url, meta, response_headers)
+        if status >= 400:
+            raise FetchError(url, f'HTTP {status}', status)
+
+        if self.cache and status == 200:
+            self.cache.store(url, response_headers, body)
+        return body
+
+    def close(self):
+        """Close every idle connection."""
+        with self._lock:
+            for connections in self._idle.values():
+                for conn in connections:
+                    conn.close()
+            self._idle.clear()
+
+
+def fetch_url(url, cache=None, timeout=30):
+    """Fetch a single URL (through the cache, if given) and return the body."""
+    pool = ConnectionPool(per_host=1, timeout=timeout, cache=cache)
+    try:
+        return pool.fetch(url)
+    finally:
+        pool.close()
+
+
+def scrape_pages(targets, scrape):
+    """
+    Scrape several pages concurrently, timing each one.
+
+    Every page is handed to `scrape` in its own worker thread, so a run takes
+    as long as the slowest page rather than the sum of all.
+
+    Args:
+        targets: dict {name: url}
+        scrape: callable(name, url) → result; exceptions mark the page failed
+
+    Returns:
+        tuple: (results, report). results is {name: result} for the pages that
+        succeeded and report is {name: {'url', 'ok', 'elapsed_ms', 'error'}},
+        both in the order of `targets`.
+    """
+    def run(name, url):
+        start = time.monotonic()
+        try:
+            result = scrape(name, url)
+            error = None
+        except Exception as e:
+            result, error = None, str(e) or e.__class__.__name__
+        elapsed_ms = round((time.monotonic() - start) * 1000)
+        return result, {'url': url, 'ok': error is None, 'elapsed_ms': elapsed_ms, 'error': error}
+
+    with ThreadPoolExecutor(max_workers=max(1, len(targets))) as executor:
+        futures = {name: executor.submit(run, name, url) for name, url in targets.items()}
+        results, report = {}, {}
+        for name, future in futures.items():
+            result, report[name] = future.result()
+            if report[name]['ok']:
+                results[name] = result
+
+    return results, report
+
+
+def _open_once(url, request_headers, timeout):
+    parts = urllib.parse.urlsplit(url)
+    request_headers = dict(request_headers)
+    conn = _connect(*_route(parts, request_headers), timeout)
+    try:
+        conn.request('GET', _request_path(parts), headers=request_headers)
+        response = conn.getresponse()
+    except BaseException:
+        conn.close()
+        raise
+    return response.status, response.headers, conn, response
+
+
+def _open_stream(url, headers, timeout):
+    """
+    Send a GET, following redirects. Returns (connection, response) unread.
+
+    Retries happen here, before the first body byte is handed out; a stream
+    that breaks half way is not restarted.
+    """
+    request_headers = {
+        'User-Agent': USER_AGENT,
+        'Accept-Encoding': 'gzip',
+    }
+    request_headers.update(headers)
+
+    scheduler = get_scheduler()
+    for _ in range(MAX_REDIRECTS + 1):
+        _, _, conn, response = scheduler.run(
+            url,
+            lambda: _open_once(url, request_headers, timeout),
+            discard=lambda result: result[2].close()
+        )
+        location = response.headers.get('Location')
+        if response.status in REDIRECT_STATUSES and location:
+            conn.close()
+            url = urllib.parse.urljoin(url, location)
+            continue
+        return conn, response
+
+    raise FetchError(url, 'too many redirects')
+
+
+def stream_url(url, cache=None, timeout=30, chunk_size=STREAM_CHUNK_SIZE,
+               allow_partial=False):
+    """
+    Yield a URL's body in chunks as they arrive off the socket.
+
+    Goes through the cache like ConnectionPool.fetch(): fresh entries and 304
+    revalidations are streamed from disk; a 200 is cached as it streams and
+    only committed once the body has been read to the end. Closing the
+    generator early closes the connection.
+
+    With allow_partial, a consumer that stops early still gets the prefix it
+    read cached (marked partial), and partial entries are served back to it.
+    Only use this when the consumer never needs more than that prefix.
+    """
+    meta = cache.lookup(url, allow_partial=allow_partial) if cache else None
+    if meta and cache.is_fresh(meta):
+        yield from cache.iter_body(url, meta, chunk_size)
+        return
+
+    headers = cache.validators(meta) if meta else {}
+    conn, response = _open_stream(url, headers, timeout)
+    try:
+        if response.status == 304 and meta:
+            cache.refresh(url, meta, response.headers)
+            yield from cache.iter_body(url, meta, chunk_size)
+            return
+        if response.status >= 400:
+            raise FetchError(url, f'HTTP {response.status}', response.status)
+
+        writer = cache.writer(url, response.headers) if cache and response.status == 200 else None
+        decompressor = None
+        if response.headers.get('Content-Encoding') == 'gzip':
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+        complete = partial = False
+        try:
+            while True:
+                chunk = response.read1(chunk_size)
+                if not chunk:
+                    break
+                if decompressor:
+                    chunk = decompressor.decompress(chunk)
+                if writer:
+                    writer.write(chunk)
+                if chunk:
+                    yield chunk
+            complete = True
+        except GeneratorExit:
+            partial = allow_partial
+            raise
+        finally:
+            if writer:
+                if complete or partial:
+                    writer.commit(partial=not complete)
+                else:
+                    writer.abort()
+    finally:
+        conn.close()
+
+
+def iter_lines(url, cache=None, timeout=30):
+    """Yield a URL's body as decoded text lines (without newlines) as they arrive."""
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    pending = ''
+    for chunk in stream_url(url, cache=cache, timeout=timeout):
+        pending += decoder.decode(chunk)
+        lines = pending.split('\n')
+        pending = lines.pop()
+        yield from lines
+
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield pending
+
+
+def parse_url(url, make_parser, cache=None, timeout=30, chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Stream a page into an HTML parser, stopping once the parser is done.
+
+    Decoded text is fed chunk by chunk as the body arrives. As soon as the
+    parser sets its `done` attribute, reading stops and the connection is
+    closed, so the rest of the page is never transferred. The prefix read is
+    cached as a partial entry; if a cached prefix turns out to be too short,
+    the page is streamed again from the network.
+
+    Args:
+        make_parser: Callable returning a fresh html.parser.HTMLParser
+
+    Returns:
+        tuple: (parser, bytes_read)
+    """
+    meta = cache.lookup(url, allow_partial=True) if cache else None
+    allow_partial = True
+    while True:
+        parser = make_parser()
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        bytes_read = 0
+        chunks = stream_url(url, cache=cache, timeout=timeout,
+                            chunk_size=chunk_size, allow_partial=allow_partial)
+        try:
+            for chunk in chunks:
+                bytes_read += len(chunk)
+                parser.feed(decoder.decode(chunk))
+                if getattr(parser, 'done', False):
+                    return parser, bytes_read
+        finally:
+            chunks.close()
+
+        parser.feed(decoder.decode(b'', final=True))
+        if not (allow_partial and meta and meta.get('partial')):
+            return parser, bytes_read
+        allow_partial = False
+
+
+def add_cache_arguments(parser):
+    """Register the cache options shared by all scraper scripts."""
+    group = parser.add_argument_group('HTTP cache')
+    group.add_argument(
+        '--cache-dir',
+        default=str(DEFAULT_CACHE_DIR),
+        help=f'HTTP cache directory (default: {DEFAULT_CACHE_DIR})'
+    )
+    group.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always fetch full responses, bypassing the HTTP cache'
+    )
+    group.add_argument(
+        '--cache-ttl',
+        type=int,
+        default=DEFAULT_CACHE_TTL,
+        help=f'Seconds a cached response is used without revalidation (default: {DEFAULT_CACHE_TTL})'
+    )
+    group.add_argument(
+        '--cache-max-mb',
+        type=int,
+        default=DEFAULT_CACHE_MAX_MB,
+        help=f'Cache size cap in MB, least recently used entries evicted first (default: {DEFAULT_CACHE_MAX_MB})'
+    )
+
+
+def add_fetch_arguments(parser):
+    """Register the retry and rate-limit options shared by all scraper scripts."""
+    group = parser.add_argument_group('Fetch scheduling')
+    group.add_argument(
+        '--retries',
+        type=int,
+        default=DEFAULT_RETRIES,
+        help=f'Retries for connection errors, 429 and 5xx responses (default: {DEFAULT_RETRIES})'
+    )
+    group.add_argument(
+        '--rate',
+        type=float,
+        default=None,
+        help='Maximum requests per second per host (default: unlimited, back off on 429)'
+    )
+    group.add_argument(
+        '--max-concurrency',
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help=f'Maximum requests in flight across all hosts (default: {DEFAULT_MAX_CONCURRENCY})'
+    )
+
+
+def configure_scheduler(args):
+    """Install a FetchScheduler built from parsed arguments as the default."""
+    scheduler = FetchScheduler(
+        retries=max(0, args.retries),
+        rate=args.rate or None,
+        max_concurrency=args.max_concurrency
+    )
+    set_scheduler(scheduler)
+    return scheduler
+
+
+def cache_from_args(args):
+    """Build an HTTPCache from parsed arguments, or None with --no-cache."""
+    if args.no_cache:
+        return None
+    return HTTPCache(
+        directory=args.cache_dir,
+        ttl=args.cache_ttl,
+        max_bytes=args.cache_max_mb * 1024 * 1024
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Fetch a URL through the scraper HTTP cache and write it to stdout'
+    )
+    parser.add_argument('url', help='URL to fetch')
+    add_cache_arguments(parser)
+    add_fetch_arguments(parser)
+
+    args = parser.parse_args()
+    configure_scheduler(args)
+
+    cache = cache_from_args(args)
+    try:
+        body = fetch_url(args.url, cache=cache)
+    except (FetchError, OSError) as e:
+        print(f"✗ Failed to fetch {args.url}: {e}", file=sys.stderr)
+        sys.exit(1)
+    finally:
+        if cache:
+            cache.prune()
+
+    sys.stdout.buffer.write(body)
+
+
+if __name__ == '__main__':
+    main()
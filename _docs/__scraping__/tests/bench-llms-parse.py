@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Benchmark llms.txt parsing throughput.
+Generates synthetic llms.txt files in both formats (docs.claude.com and
+modelcontextprotocol.io) at several sizes, checks that the precompiled
+matchers in llms_links.py find exactly what the previous per-call regexes
+found, and reports entries/sec and MB/sec for each.
+
+Usage:
+    python3 tests/bench-llms-parse.py
+    python3 tests/bench-llms-parse.py --sizes 1000 10000 --repeat 3 --json
+"""
+
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import importlib.util
+from pathlib import Path
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / 'scripts'
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from llms_links import match_claude_links, match_mcp_links  # noqa: E402
+
+# The parsers before llms_links.py: uncompiled patterns passed to re.finditer
+# on every line, kept as the baseline
+CLAUDE_REGEX = r'\[([^\]]+)\]\((https://docs\.claude\.com/([a-z]{2})/docs/([a-z0-9\-]+)/([^)]+\.md))\)'
+MCP_REGEX = r'-\s+\[([^\]]+)\]\((https://modelcontextprotocol\.io([^)]+))\)(?::\s+(.+))?'
+
+LANGUAGES = ['en', 'de', 'es', 'fr', 'it', 'ja', 'ko', 'pt', 'ru', 'zh']
+CATEGORIES = ['claude-code', 'build-with-claude', 'agents-and-tools',
+              'about-claude', 'test-and-evaluate', 'get-started']
+WORDS = ['guide', 'overview', 'setup', 'hooks', 'agents', 'memory', 'tools',
+         'settings', 'security', 'costs', 'models', 'prompting', 'streaming']
+
+
+def load_script(name):
+    """Import a hyphenated script from scripts/ as a module."""
+    spec = importlib.util.spec_from_file_location(
+        name.replace('-', '_'), SCRIPTS_DIR / f'{name}.py'
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_claude_llms(entries, seed=0):
+    """Synthetic docs.claude.com llms.txt with `entries` links plus prose noise."""
+    rng = random.Random(seed)
+    lines = ['# Anthropic', '', '## Docs', '']
+    for n in range(entries):
+        if n % 50 == 0:
+            lines.append(f'## Section {n // 50}')
+            lines.append('Some [prose](https://example.com/page) with a link that does not match.')
+        lang = rng.choice(LANGUAGES)
+        cat = rng.choice(CATEGORIES)
+        slug = '-'.join(rng.sample(WORDS, 2))
+        lines.append(
+            f'- [{slug.title()} {n}](https://docs.claude.com/{lang}/docs/{cat}/{slug}-{n}.md): '
+            f'{" ".join(rng.sample(WORDS, 5))}'
+        )
+    return '\n'.join(lines) + '\n'
+
+
+def make_mcp_llms(entries, seed=0):
+    """Synthetic modelcontextprotocol.io llms.txt with `entries` list items."""
+    rng = random.Random(seed)
+    lines = ['# Model Context Protocol', '']
+    for n in range(entries):
+        if n % 50 == 0:
+            lines.append(f'## Section {n // 50}')
+        path = '/' + '/'.join(rng.sample(WORDS, 3)) + f'-{n}'
+        if n % 3 == 0:
+            lines.append(f'- [{path[1:].title()}](https://modelcontextprotocol.io{path})')
+        else:
+            lines.append(
+                f'- [{path[1:].title()}](https://modelcontextprotocol.io{path}): '
+                f'{" ".join(rng.sample(WORDS, 6))}'
+            )
+    return '\n'.join(lines) + '\n'
+
+
+def regex_claude(lines):
+    return [m.groups() for line in lines for m in re.finditer(CLAUDE_REGEX, line)]
+
+
+def matcher_claude(lines):
+    return [link for line in lines for link in match_claude_links(line)]
+
+
+def regex_mcp(lines):
+    return [
+        (m.group(1).strip(), m.group(2).strip(), m.group(3).strip(), (m.group(4) or '').strip())
+        for line in lines for m in re.finditer(MCP_REGEX, line)
+    ]
+
+
+def matcher_mcp(lines):
+    return [link for line in lines for link in match_mcp_links(line)]
+
+
+def best_of(func, arg, repeat):
+    """Best wall time of `repeat` runs, and the last result."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(arg)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark llms.txt link parsing')
+    parser.add_argument(
+        '--sizes',
+        type=int,
+        nargs='+',
+        default=[1000, 10000, 100000],
+        help='Number of entries per synthetic file (default: 1000 10000 100000)'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='Runs per measurement; the best is reported (default: 5)'
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='Print results as JSON instead of a table'
+    )
+    args = parser.parse_args()
+
+    parse_llms = load_script('parse-llms-txt')
+    parse_mcp = load_script('parse-mcp-llms')
+
+    cases = [
+        ('claude', make_claude_llms, [
+            ('regex', regex_claude),
+            ('matcher', matcher_claude),
+            ('parse_llms_txt', lambda lines: list(parse_llms.iter_entries(lines))),
+        ]),
+        ('mcp', make_mcp_llms, [
+            ('regex', regex_mcp),
+            ('matcher', matcher_mcp),
+            ('parse_llms_txt', lambda lines: list(parse_mcp.iter_entries(lines))),
+        ]),
+    ]
+
+    results = []
+    for fmt, generate, runners in cases:
+        for size in args.sizes:
+            content = generate(size)
+            lines = content.splitlines()
+            megabytes = len(content.encode('utf-8')) / (1024 * 1024)
+
+            expected = None
+            for name, func in runners:
+                elapsed, found = best_of(func, lines, args.repeat)
+                if name == 'regex':
+                    expected = found
+                elif name == 'matcher' and found != expected:
+                    print(f'✗ {fmt}/{size}: matcher disagrees with regex', file=sys.stderr)
+                    sys.exit(1)
+                results.append({
+                    'format': fmt,
+                    'entries': size,
+                    'parser': name,
+                    'found': len(found),
+                    'seconds': round(elapsed, 6),
+                    'entries_per_sec': round(len(found) / elapsed) if elapsed else None,
+                    'mb_per_sec': round(megabytes / elapsed, 2) if elapsed else None,
+                })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'format':<8} {'entries':>8} {'parser':<16} {'seconds':>10} {'entries/s':>12} {'MB/s':>8}")
+    for r in results:
+        print(f"{r['format']:<8} {r['entries']:>8} {r['parser']:<16} {r['seconds']:>10.4f} "
+              f"{r['entries_per_sec']:>12,} {r['mb_per_sec']:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+End-to-end throughput benchmark for the documentation download pipeline.
+Starts tests/mock-docs-server.py in-process, runs download-docs.sh and/or
+download-mcp-docs.sh against it through SCRAPER_ORIGIN_MAP, and reports
+pages/sec and bytes/sec for the whole run (llms.txt, navigation, planning
+and downloads). Nothing leaves the machine.
+
+Usage:
+    python3 tests/bench-pipeline.py
+    python3 tests/bench-pipeline.py --site both --pages 1000 --latency 30 -j 4 16 32
+    python3 tests/bench-pipeline.py --error-rate 0.05 --cache --json
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import threading
+import subprocess
+import importlib.util
+from pathlib import Path
+
+TESTS_DIR = Path(__file__).resolve().parent
+SCRIPTS_DIR = TESTS_DIR.parent / 'scripts'
+
+
+def load_mock_server():
+    spec = importlib.util.spec_from_file_location('mock_docs_server', TESTS_DIR / 'mock-docs-server.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def pipeline_command(site, output_dir, concurrency, cache_dir):
+    cache_args = ['--cache-dir', str(cache_dir)] if cache_dir else ['--no-cache']
+    if site == 'claude':
+        return ['./download-docs.sh', '-l', 'en', '-c', 'claude-code',
+                '-o', str(output_dir), '-j', str(concurrency), *cache_args]
+    return ['./download-mcp-docs.sh', '-o', str(output_dir), '-j', str(concurrency), *cache_args]
+
+
+def downloaded(output_dir):
+    """(pages, bytes) of markdown written under output_dir."""
+    pages = size = 0
+    for path in Path(output_dir).rglob('*.md'):
+        pages += 1
+        size += path.stat().st_size
+    return pages, size
+
+
+def run_once(site, concurrency, server, origin_map, cache_dir, cache_state, verbose):
+    output_dir = Path(tempfile.mkdtemp(prefix=f'bench-{site}-'))
+    env = dict(os.environ, SCRAPER_ORIGIN_MAP=origin_map)
+    before = server.stats.snapshot()
+    start = time.perf_counter()
+    try:
+        result = subprocess.run(
+            pipeline_command(site, output_dir, concurrency, cache_dir),
+            cwd=SCRIPTS_DIR,
+            env=env,
+            stdout=None if verbose else subprocess.DEVNULL,
+            stderr=None if verbose else subprocess.DEVNULL
+        )
+        elapsed = time.perf_counter() - start
+        pages, size = downloaded(output_dir)
+    finally:
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    after = server.stats.snapshot()
+    served = {key: after[key] - before[key] for key in after}
+    return {
+        'site': site,
+        'concurrency': concurrency,
+        'cache': cache_state,
+        'exit_code': result.returncode,
+        'seconds': round(elapsed, 3),
+        'pages': pages,
+        'bytes': size,
+        'pages_per_sec': round(pages / elapsed, 1),
+        'bytes_per_sec': round(size / elapsed),
+        'requests': served['requests'],
+        'not_modified': served['not_modified'],
+        'injected_errors': served['errors'],
+        'bytes_served': served['bytes'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the download pipeline against a local mock server')
+    parser.add_argument('--site', choices=['claude', 'mcp', 'both'], default='claude',
+                        help='Pipeline to run (default: claude)')
+    parser.add_argument('--pages', type=int, default=300, help='Pages per site (default: 300)')
+    parser.add_argument('--page-size', type=int, default=8192, help='Approximate bytes per page (default: 8192)')
+    parser.add_argument('--latency', type=float, default=20, help='Mean server latency in ms (default: 20)')
+    parser.add_argument('--error-rate', type=float, default=0, help='Fraction of injected 503s (default: 0)')
+    parser.add_argument('-j', '--concurrency', type=int, nargs='+', default=[16],
+                        help='Download concurrency values to compare (default: 16)')
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per configuration (default: 1)')
+    parser.add_argument('--cache', action='store_true',
+                        help='Use a fresh HTTP cache per configuration and also measure a warm second run')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON instead of a table')
+    parser.add_argument('--verbose', action='store_true', help='Show the pipeline output')
+    args = parser.parse_args()
+
+    mock = load_mock_server()
+    options = mock.build_parser().parse_args([
+        '--port', '0',
+        '--pages', str(args.pages),
+        '--page-size', str(args.page_size),
+        '--latency', str(args.latency),
+        '--error-rate', str(args.error_rate),
+    ])
+    server = mock.build_server(options)
+    host, port = server.server_address[:2]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    origin_map = f'https://{mock.CLAUDE_HOST}=http://{host}:{port} https://{mock.MCP_HOST}=http://{host}:{port}'
+
+    sites = ['claude', 'mcp'] if args.site == 'both' else [args.site]
+    results = []
+    try:
+        for site in sites:
+            for concurrency in args.concurrency:
+                for _ in range(args.repeat):
+                    cache_dir = Path(tempfile.mkdtemp(prefix='bench-cache-')) if args.cache else None
+                    try:
+                        results.append(run_once(site, concurrency, server, origin_map, cache_dir,
+                                                'cold' if cache_dir else 'none', args.verbose))
+                        if cache_dir:
+                            results.append(run_once(site, concurrency, server, origin_map, cache_dir,
+                                                    'warm', args.verbose))
+                    finally:
+                        if cache_dir:
+                            shutil.rmtree(cache_dir, ignore_errors=True)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'site':<7} {'-j':>3} {'cache':<5} {'seconds':>8} {'pages':>6} {'pages/s':>8} "
+              f"{'MB/s':>7} {'requests':>8} {'304s':>5} {'errors':>6} {'exit':>4}")
+        for r in results:
+            print(f"{r['site']:<7} {r['concurrency']:>3} {r['cache']:<5} {r['seconds']:>8.2f} {r['pages']:>6} "
+                  f"{r['pages_per_sec']:>8.1f} {r['bytes_per_sec'] / 1024 / 1024:>7.2f} {r['requests']:>8} "
+                  f"{r['not_modified']:>5} {r['injected_errors']:>6} {r['exit_code']:>4}")
+
+    sys.exit(0 if all(r['exit_code'] == 0 for r in results) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for docs.claude.com and modelcontextprotocol.io.
+Serves a synthetic llms.txt, sidebar HTML shaped like the real sites (what
+NavParser and MCPNavParser expect) and N markdown pages for each site, with
+configurable latency and error rates. The site is picked from the Host
+header, so point the scrapers at it with SCRAPER_ORIGIN_MAP:
+
+    python3 tests/mock-docs-server.py --port 8765 --pages 500 --latency 20
+    export SCRAPER_ORIGIN_MAP="https://docs.claude.com=http://127.0.0.1:8765 \\
+        https://modelcontextprotocol.io=http://127.0.0.1:8765"
+    ./scripts/download-docs.sh -l en -c claude-code -o /tmp/mirror --no-cache
+
+GET /__stats returns request, byte and error counters as JSON.
+"""
+
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+import argparse
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+CLAUDE_HOST = 'docs.claude.com'
+MCP_HOST = 'modelcontextprotocol.io'
+
+# Pages per sidebar group
+GROUP_SIZE = 8
+
+MCP_SECTIONS = {
+    'documentation': ('/docs/getting-started/intro', '/docs'),
+    'specification': ('/specification/2025-06-18', '/specification/2025-06-18'),
+    'community': ('/community/communication', '/community'),
+    'about': ('/about', '/about'),
+}
+
+WORDS = ['agent', 'context', 'model', 'prompt', 'server', 'client', 'tool',
+         'resource', 'session', 'stream', 'cache', 'token', 'hook', 'plugin']
+
+
+def markdown_page(title, size, seed):
+    """Deterministic markdown body of roughly `size` bytes."""
+    rng = random.Random(seed)
+    parts = [f'# {title}\n\n']
+    length = len(parts[0])
+    while length < size:
+        line = ' '.join(rng.choice(WORDS) for _ in range(12)) + '.\n'
+        if rng.random() < 0.1:
+            line = f'\n## {rng.choice(WORDS).title()}\n\n'
+        parts.append(line)
+        length += len(line)
+    return ''.join(parts).encode('utf-8')
+
+
+def sidebar_html(groups, filler):
+    """
+    Page with a #navigation-items sidebar followed by article filler.
+
+    groups: [(group title, [(page title, href), ...]), ...]
+    """
+    out = ['<!DOCTYPE html><html><head><title>Docs</title></head><body>',
+           '<div id="sidebar"><div id="navigation-items">']
+    for title, links in groups:
+        out.append('<div class="mt-6 lg:mt-8">')
+        out.append(f'<div class="sidebar-group-header"><h5 id="sidebar-title">{title}</h5></div>')
+        out.append('<ul id="sidebar-group" class="space-y-px">')
+        for page_title, href in links:
+            out.append(f'<li><a href="{href}">{page_title}</a></li>')
+        out.append('</ul></div>')
+    out.append('</div></div><main><article>')
+    out.append('<p>' + 'Lorem ipsum dolor sit amet. ' * 40 + '</p>\n' * filler)
+    out.append('</article></main></body></html>')
+    return ''.join(out).encode('utf-8')
+
+
+def chunk(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def build_claude_site(pages, page_size, language, category, filler):
+    """Routes {path: body} for the docs.claude.com stand-in."""
+    slugs = ['overview'] + [f'page-{n:05d}' for n in range(1, pages)]
+    base = f'/{language}/docs/{category}'
+
+    routes = {}
+    llms = ['# Anthropic', '', '## Docs', '']
+    for n, slug in enumerate(slugs):
+        title = slug.replace('-', ' ').title()
+        llms.append(f'- [{title}](https://{CLAUDE_HOST}{base}/{slug}.md): {title} page')
+        routes[f'{base}/{slug}.md'] = markdown_page(title, page_size, n)
+
+    groups = [
+        (f'Group {g + 1}', [(s.replace('-', ' ').title(), f'{base}/{s}') for s in group])
+        for g, group in enumerate(chunk(slugs, GROUP_SIZE))
+    ]
+    routes[f'{base}/overview'] = sidebar_html(groups, filler)
+    routes['/llms.txt'] = ('\n'.join(llms) + '\n').encode('utf-8')
+    return routes
+
+
+def build_mcp_site(pages, page_size, filler):
+    """Routes {path: body} for the modelcontextprotocol.io stand-in."""
+    names = list(MCP_SECTIONS)
+    per_section = {name: [] for name in names}
+    for n in range(pages):
+        name = names[n % len(names)]
+        prefix = MCP_SECTIONS[name][1]
+        group = len(per_section[name]) // GROUP_SIZE + 1
+        per_section[name].append(f'{prefix}/group-{group}/page-{n:05d}')
+
+    routes = {}
+    llms = ['# Model Context Protocol', '']
+    for n, path in enumerate(p for name in names for p in per_section[name]):
+        title = path.rsplit('/', 1)[-1].replace('-', ' ').title()
+        llms.append(f'- [{title}](https://{MCP_HOST}{path}.md): {title} page')
+        routes[f'{path}.md'] = markdown_page(title, page_size, n)
+
+    for name in names:
+        groups = [
+            (f'Group {g + 1}', [(p.rsplit('/', 1)[-1], p) for p in group])
+            for g, group in enumerate(chunk(per_section[name], GROUP_SIZE))
+        ]
+        routes[MCP_SECTIONS[name][0]] = sidebar_html(groups, filler)
+    routes['/llms.txt'] = ('\n'.join(llms) + '\n').encode('utf-8')
+    return routes
+
+
+class Stats:
+    """Thread-safe request counters, served at /__stats."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {'requests': 0, 'bytes': 0, 'not_modified': 0, 'errors': 0, 'not_found': 0}
+
+    def add(self, **counts):
+        with self._lock:
+            for key, value in counts.items():
+                self.counters[key] += value
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.counters)
+
+
+def make_handler(sites, options, stats):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def _send(self, status, body=b'', headers=None):
+            self.send_response(status)
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+            stats.add(requests=1, bytes=len(body))
+
+        def do_GET(self):
+            path = self.path.split('?', 1)[0]
+            if path == '/__stats':
+                self._send(200, json.dumps(stats.snapshot()).encode('utf-8'),
+                           {'Content-Type': 'application/json'})
+                return
+
+            if options.latency:
+                delay = options.latency * (1 + random.uniform(-options.jitter, options.jitter))
+                time.sleep(max(0.0, delay) / 1000)
+
+            if options.error_rate and random.random() < options.error_rate:
+                stats.add(errors=1)
+                headers = {'Retry-After': str(options.retry_after)} if options.retry_after is not None else {}
+                self._send(options.error_status, b'', headers)
+                return
+
+            host = self.headers.get('Host', '').split(':')[0]
+            body = sites['mcp' if host == MCP_HOST else 'claude'].get(path)
+            if body is None:
+                stats.add(not_found=1)
+                self._send(404, b'Not found\n')
+                return
+
+            etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+            if self.headers.get('If-None-Match') == etag:
+                stats.add(not_modified=1)
+                self._send(304, b'', {'ETag': etag})
+                return
+
+            content_type = 'text/html' if not path.endswith(('.md', '.txt')) else 'text/markdown'
+            self._send(200, body, {'ETag': etag, 'Content-Type': f'{content_type}; charset=utf-8'})
+
+        def log_message(self, format, *args):
+            if options.verbose:
+                super().log_message(format, *args)
+
+    return Handler
+
+
+def build_server(options):
+    """Create (but do not start) the mock server; port 0 picks a free port."""
+    sites = {
+        'claude': build_claude_site(options.pages, options.page_size, options.language,
+                                    options.category, options.filler),
+        'mcp': build_mcp_site(options.pages, options.page_size, options.filler),
+    }
+    stats = Stats()
+    server = ThreadingHTTPServer((options.host, options.port), make_handler(sites, options, stats))
+    server.daemon_threads = True
+    server.stats = stats
+    return server
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description='Serve synthetic Claude and MCP documentation sites for offline testing'
+    )
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='Port, 0 for any free port (default: 8765)')
+    parser.add_argument('--pages', type=int, default=100, help='Markdown pages per site (default: 100)')
+    parser.add_argument('--page-size', type=int, default=8192, help='Approximate bytes per page (default: 8192)')
+    parser.add_argument('--language', default='en', help='Claude docs language (default: en)')
+    parser.add_argument('--category', default='claude-code', help='Claude docs category (default: claude-code)')
+    parser.add_argument('--filler', type=int, default=200,
+                        help='Article paragraphs after the sidebar on nav pages (default: 200)')
+    parser.add_argument('--latency', type=float, default=0, help='Mean response latency in ms (default: 0)')
+    parser.add_argument('--jitter', type=float, default=0.5,
+                        help='Latency jitter as a fraction of --latency (default: 0.5)')
+    parser.add_argument('--error-rate', type=float, default=0,
+                        help='Fraction of requests answered with --error-status (default: 0)')
+    parser.add_argument('--error-status', type=int, default=503, help='Status for injected errors (default: 503)')
+    parser.add_argument('--retry-after', type=int, default=None,
+                        help='Retry-After seconds sent with injected errors (default: none)')
+    parser.add_argument('--verbose', action='store_true', help='Log every request to stderr')
+    return parser
+
+
+def main():
+    options = build_parser().parse_args()
+    server = build_server(options)
+    host, port = server.server_address[:2]
+    print(f'Serving mock docs on http://{host}:{port} ({options.pages} pages per site)', file=sys.stderr)
+    print(f'SCRAPER_ORIGIN_MAP="https://{CLAUDE_HOST}=http://{host}:{port} '
+          f'https://{MCP_HOST}=http://{host}:{port}"', flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
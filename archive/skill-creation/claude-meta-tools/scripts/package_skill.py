@@ -8,13 +8,133 @@ Usage:
 Example:
     python utils/package_skill.py skills/public/my-skill
     python utils/package_skill.py skills/public/my-skill ./dist
+
+The archive is reproducible: entries are written in sorted order with a fixed
+timestamp (SOURCE_DATE_EPOCH if set, else 1980-01-01) and normalized
+permissions (0644, or 0755 for executables), so the same skill always gives
+the same bytes and the .skill file can be cached by its SHA-256. Entries are
+deflated on a thread pool; already-compressed files (images, archives, PDFs)
+are stored as they are.
 """
 
+import os
 import sys
-import zipfile
+import time
+import zlib
+import struct
+import hashlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from quick_validate import validate_skill
 
+# Stored without compression: deflating them again only costs time
+STORED_SUFFIXES = {
+    '.png', '.jpg', '.jpeg', '.gif', '.webp', '.ico',
+    '.zip', '.gz', '.tgz', '.bz2', '.xz', '.zst', '.7z', '.skill',
+    '.pdf', '.docx', '.xlsx', '.pptx', '.odt',
+    '.mp3', '.mp4', '.mov', '.webm', '.woff', '.woff2',
+}
+DEFLATE_LEVEL = 6  # zlib's default, as zipfile.ZIP_DEFLATED uses
+
+# ZIP records (PKWARE APPNOTE): local file header, central directory header,
+# end of central directory
+LOCAL_HEADER = struct.Struct('<IHHHHHIIIHH')
+CENTRAL_HEADER = struct.Struct('<IHHHHHHIIIHHHHHII')
+END_RECORD = struct.Struct('<IHHHHIIH')
+ZIP_STORED, ZIP_DEFLATED = 0, 8
+ZIP_VERSION = 20  # 2.0: deflate, no zip64
+MADE_BY_UNIX = 3 << 8
+UTF8_FLAG = 0x800
+ZIP32_LIMIT = 0xFFFFFFFF
+
+
+def dos_timestamp():
+    """(time, date) of every entry: SOURCE_DATE_EPOCH, or the earliest ZIP date"""
+    epoch = int(os.environ.get('SOURCE_DATE_EPOCH', 0))
+    t = time.gmtime(max(epoch, 315532800))  # 1980-01-01, the earliest ZIP date
+    return (t.tm_hour << 11 | t.tm_min << 5 | t.tm_sec // 2,
+            (t.tm_year - 1980) << 9 | t.tm_mon << 5 | t.tm_mday)
+
+
+def compress_entry(file_path):
+    """(method, crc, size, data, mode) for one file; runs on the thread pool"""
+    data = file_path.read_bytes()
+    mode = 0o755 if file_path.stat().st_mode & 0o100 else 0o644
+    crc = zlib.crc32(data)
+    if data and file_path.suffix.lower() not in STORED_SUFFIXES:
+        # Raw deflate stream (no zlib header), as ZIP stores it
+        compressor = zlib.compressobj(DEFLATE_LEVEL, zlib.DEFLATED, -15)
+        deflated = compressor.compress(data) + compressor.flush()
+        if len(deflated) < len(data):
+            return ZIP_DEFLATED, crc, len(data), deflated, mode
+    return ZIP_STORED, crc, len(data), data, mode
+
+
+def write_archive(archive_path, entries, jobs=None):
+    """
+    Write a ZIP file of entries, (arcname, file path) pairs, in the given order.
+
+    Files are compressed on a thread pool (zlib releases the GIL) while a
+    bounded window of results is written in order. Returns (files, bytes in,
+    bytes out). Raises ValueError if the archive would need zip64.
+    """
+    mod_time, mod_date = dos_timestamp()
+    # Compression is CPU-bound: one thread per CPU
+    jobs = jobs or os.cpu_count() or 1
+    central = []
+    total_in = 0
+
+    with open(archive_path, 'wb') as out, ThreadPoolExecutor(max_workers=jobs) as executor:
+        pending = deque()
+        queue = iter(entries)
+
+        def submit_next():
+            for arcname, file_path in queue:
+                pending.append((arcname, executor.submit(compress_entry, file_path)))
+                return
+
+        for _ in range(jobs * 2):
+            submit_next()
+        while pending:
+            arcname, future = pending.popleft()
+            submit_next()
+            method, crc, size, data, mode = future.result()
+
+            offset = out.tell()
+            if max(offset, size) >= ZIP32_LIMIT or len(central) >= 0xFFFF:
+                raise ValueError("skill is too large for a .skill archive (needs zip64)")
+            name = arcname.encode('utf-8')
+            flags = 0 if name.isascii() else UTF8_FLAG
+            out.write(LOCAL_HEADER.pack(0x04034b50, ZIP_VERSION, flags, method, mod_time, mod_date,
+                                        crc, len(data), size, len(name), 0))
+            out.write(name)
+            out.write(data)
+            central.append(CENTRAL_HEADER.pack(0x02014b50, MADE_BY_UNIX | ZIP_VERSION, ZIP_VERSION, flags,
+                                               method, mod_time, mod_date, crc, len(data), size, len(name),
+                                               0, 0, 0, 0, (0o100000 | mode) << 16, offset) + name)
+            total_in += size
+
+        central_offset = out.tell()
+        for record in central:
+            out.write(record)
+        central_size = out.tell() - central_offset
+        if central_offset + central_size >= ZIP32_LIMIT:
+            raise ValueError("skill is too large for a .skill archive (needs zip64)")
+        out.write(END_RECORD.pack(0x06054b50, 0, 0, len(central), len(central),
+                                  central_size, central_offset, 0))
+        total_out = out.tell()
+
+    return len(central), total_in, total_out
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
 
 def package_skill(skill_path, output_dir=None):
     """
@@ -63,21 +183,29 @@ def package_skill(skill_path, output_dir=None):
 
     skill_filename = output_path / f"{skill_name}.skill"
 
-    # Create the .skill file (zip format)
+    # Collect the files in a fixed order, with paths relative to the skill's parent
+    # (skipping the archive itself when it is written inside the skill folder, and
+    # the temporary archives a packaging run in progress or interrupted leaves there)
+    entries = sorted(
+        (file_path.relative_to(skill_path.parent).as_posix(), file_path)
+        for file_path in skill_path.rglob('*')
+        if file_path.is_file() and file_path != skill_filename
+        and not file_path.match('*.skill.*.tmp')
+    )
+
+    # Create the .skill file (zip format), replacing any previous one only when complete
+    tmp_filename = skill_filename.with_name(f"{skill_filename.name}.{os.getpid()}.tmp")
     try:
-        with zipfile.ZipFile(skill_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory
-            for file_path in skill_path.rglob('*'):
-                if file_path.is_file():
-                    # Calculate the relative path within the zip
-                    arcname = file_path.relative_to(skill_path.parent)
-                    zipf.write(file_path, arcname)
-                    print(f"  Added: {arcname}")
+        files, size_in, size_out = write_archive(tmp_filename, entries)
+        os.replace(tmp_filename, skill_filename)
 
+        print(f"  Added {files} files ({size_in:,} bytes, {size_out:,} bytes packaged)")
+        print(f"  SHA-256: {file_sha256(skill_filename)}")
         print(f"\n✅ Successfully packaged skill to: {skill_filename}")
         return skill_filename
 
     except Exception as e:
+        tmp_filename.unlink(missing_ok=True)
         print(f"❌ Error creating .skill file: {e}")
         return None
 
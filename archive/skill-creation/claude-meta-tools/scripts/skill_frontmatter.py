@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Frontmatter reader for SKILL.md files, shared by quick_validate.py,
+package_skill.py and other skill tools.
+
+Only the leading '---' block is read: the file is consumed line by line up
+to the closing delimiter, so the skill body is never loaded, and a
+frontmatter larger than MAX_FRONTMATTER_BYTES is rejected instead of read.
+
+parse_frontmatter() handles the YAML subset skill frontmatter is written
+in (see parse_simple_yaml) without PyYAML, which is imported lazily, only
+for frontmatter outside that subset, and is optional otherwise.
+
+Usage:
+    from skill_frontmatter import FrontmatterError, parse_frontmatter, read_frontmatter
+
+    try:
+        frontmatter = parse_frontmatter(read_frontmatter(skill_path / 'SKILL.md'))
+    except FrontmatterError as e:
+        print(e)
+"""
+
+import re
+
+# Frontmatter is a few hundred bytes; anything past this is not frontmatter
+MAX_FRONTMATTER_BYTES = 64 * 1024
+
+
+# "key: value" and "- item" lines of the subset parse_simple_yaml handles
+KEY_LINE = re.compile(r'([A-Za-z0-9_][A-Za-z0-9_-]*):(?: +(.*))?$')
+ITEM_LINE = re.compile(r'- +(.*)$')
+
+# Plain scalars PyYAML would not load as a string: booleans, nulls and
+# anything starting like a number, date, indicator, escape or merge key (<<)
+NON_STRING_WORDS = {'y', 'n', 'yes', 'no', 'true', 'false', 'on', 'off', 'null', '~'}
+BLOCK_SCALAR_HEADERS = {'>', '>-', '|', '|-'}
+NON_STRING_START = set('-?:,[]{}#&*!|><\'"%@`=~+.0123456789')
+
+
+class FrontmatterError(ValueError):
+    """SKILL.md has no usable frontmatter; the message is the validation error"""
+
+
+class UnsupportedYAML(Exception):
+    """Frontmatter uses YAML beyond what parse_simple_yaml handles"""
+
+
+class PyYAMLMissing(FrontmatterError):
+    """Frontmatter needs PyYAML, which is not installed"""
+
+
+def read_frontmatter(skill_md, max_bytes=MAX_FRONTMATTER_BYTES):
+    """
+    Return the text between the opening '---' line and the next line
+    starting with '---', without its final newline. CRLF line endings are
+    read as LF, as read_text() would.
+
+    Raises FrontmatterError if the file does not start with '---', the block
+    is not closed, or it is longer than max_bytes; OSError if the file
+    cannot be read.
+    """
+    with open(skill_md, 'rb') as f:
+        first = f.readline(max_bytes)
+        if not first.startswith(b'---'):
+            raise FrontmatterError("No YAML frontmatter found")
+        if first not in (b'---\n', b'---\r\n'):
+            raise FrontmatterError("Invalid frontmatter format")
+
+        lines = []
+        size = 0
+        while True:
+            line = f.readline(max_bytes - size + 1)
+            if not line:
+                raise FrontmatterError("Invalid frontmatter format")
+            if line.startswith(b'---') and lines:
+                break
+            size += len(line)
+            if size > max_bytes:
+                raise FrontmatterError(f"Frontmatter is larger than {max_bytes} bytes")
+            if line.endswith(b'\r\n'):
+                line = line[:-2] + b'\n'
+            lines.append(line)
+
+    text = b''.join(lines)
+    return text[:-1].decode('utf-8')
+
+
+def is_plain_string(value):
+    """Whether PyYAML loads the unquoted value as this same string"""
+    return not (value[0] in NON_STRING_START or value.lower() in NON_STRING_WORDS
+                or ': ' in value or ' #' in value or value.endswith(':'))
+
+
+def parse_scalar(value):
+    """A value as the string PyYAML would load it as; UnsupportedYAML if it may not be one"""
+    if value.startswith("'") and value.endswith("'") and len(value) > 1:
+        inner = value[1:-1]
+        if "'" in inner.replace("''", ""):
+            raise UnsupportedYAML(value)
+        return inner.replace("''", "'")
+    if value.startswith('"') and value.endswith('"') and len(value) > 1:
+        inner = value[1:-1]
+        if '"' in inner or '\\' in inner:
+            raise UnsupportedYAML(value)
+        return inner
+    if not is_plain_string(value):
+        raise UnsupportedYAML(value)
+    return value
+
+
+def block_scalar(scalar, ended_by_newline=True):
+    """
+    The string of a folded (>) or literal (|) block. Its final newline is
+    kept (clip) if there is one, or stripped (-).
+    """
+    lines = scalar["lines"]
+    if not lines:
+        return ''
+    value = (' ' if scalar["header"][0] == '>' else '\n').join(lines)
+    if scalar["header"].endswith('-') or not ended_by_newline:
+        return value
+    return value + '\n'
+
+
+def parse_simple_yaml(text):
+    """
+    Parse the YAML subset of skill frontmatter: top-level "key: value"
+    lines, where a value is one of:
+
+    - a plain or simply quoted string
+    - a folded or literal block (>, >-, | or |-) of equally indented lines
+    - empty, and followed by one level of indented "key: value" lines (a
+      mapping, as under metadata) or "- item" lines (a list, as
+      allowed-tools may be)
+
+    Blank lines and full-line comments are skipped outside blocks.
+
+    Returns the same dict (or None, for no keys) as yaml.safe_load, and
+    raises UnsupportedYAML for anything else, including values PyYAML
+    would load as another type.
+    """
+    if '\t' in text or '\r' in text:
+        raise UnsupportedYAML("tab or carriage return")
+
+    result = {}
+    key = block = scalar = None
+    for line in text.split('\n'):
+        stripped = line.strip()
+        if not line.isprintable():
+            # Control characters and Unicode line breaks
+            raise UnsupportedYAML(line)
+        indent = len(line) - len(line.lstrip(' '))
+
+        if scalar is not None:
+            # Lines of a block scalar: indented, any text, no blank line
+            # between them and one indent for all
+            if not stripped:
+                scalar["blank"] = True
+                continue
+            if indent:
+                if scalar["blank"] or line.endswith(' ') or scalar.setdefault("indent", indent) != indent:
+                    raise UnsupportedYAML(line)
+                scalar["lines"].append(line[indent:])
+                continue
+            result[scalar["key"]] = block_scalar(scalar)
+            scalar = None
+
+        if not stripped or stripped.startswith('#'):
+            continue
+
+        item = ITEM_LINE.match(stripped)
+        if key is not None and (indent or item):
+            # Line of the block under the last key; one kind and indent per block
+            kind = 'list' if item else 'map'
+            if block is None:
+                block = (kind, indent, [] if item else {})
+                result[key] = block[2]
+            elif block[:2] != (kind, indent):
+                raise UnsupportedYAML(line)
+            if item:
+                block[2].append(parse_scalar(item.group(1).rstrip()))
+                continue
+            match = KEY_LINE.match(stripped)
+            if (not match or not match.group(2) or match.group(1) in block[2]
+                    or not is_plain_string(match.group(1))):
+                raise UnsupportedYAML(line)
+            block[2][match.group(1)] = parse_scalar(match.group(2).rstrip())
+            continue
+
+        match = KEY_LINE.match(line)
+        if not match or match.group(1) in result or not is_plain_string(match.group(1)):
+            raise UnsupportedYAML(line)
+        value = (match.group(2) or '').rstrip()
+        key = block = None
+        if value in BLOCK_SCALAR_HEADERS:
+            scalar = {"key": match.group(1), "header": value, "lines": [], "blank": False}
+            result[match.group(1)] = None
+        elif value:
+            result[match.group(1)] = parse_scalar(value)
+        else:
+            # Null unless a block follows
+            result[match.group(1)] = None
+            key = match.group(1)
+
+    if scalar is not None:
+        # At the end of the frontmatter, only a blank line leaves a newline
+        result[scalar["key"]] = block_scalar(scalar, ended_by_newline=scalar["blank"])
+    return result or None
+
+
+def parse_frontmatter(frontmatter_text):
+    """
+    Load frontmatter YAML: with parse_simple_yaml when it is in the subset,
+    otherwise with PyYAML, imported only then.
+
+    Raises FrontmatterError ("Invalid YAML in frontmatter: ...") if PyYAML
+    rejects it, or PyYAMLMissing if it needs PyYAML and that is not installed.
+    """
+    try:
+        return parse_simple_yaml(frontmatter_text)
+    except UnsupportedYAML as e:
+        construct = str(e).strip()
+
+    try:
+        import yaml
+    except ImportError:
+        raise PyYAMLMissing(
+            f"Frontmatter uses YAML beyond the built-in parser ({construct!r}); "
+            f"install PyYAML to validate it"
+        ) from None
+    try:
+        return yaml.safe_load(frontmatter_text)
+    except yaml.YAMLError as e:
+        raise FrontmatterError(f"Invalid YAML in frontmatter: {e}") from None
@@ -1,95 +1,334 @@
 #!/usr/bin/env python3
 """
 Quick validation script for skills - minimal version
+
+Usage:
+    python quick_validate.py <skill_directory>
+    python quick_validate.py --bulk <root> [<root> ...] [--format text|json|junit] [--jobs N]
+    python quick_validate.py ... [--cache FILE | --no-cache]
+
+Bulk mode finds every SKILL.md below the given roots and validates those
+skills on a process pool, reporting all errors of each skill rather than
+just the first.
+
+Only the frontmatter block of each SKILL.md is read (see skill_frontmatter.py),
+so validation cost does not grow with the size of the skill body. The
+frontmatter is parsed by the built-in parser for the YAML subset skills use;
+PyYAML is only imported (and only needed) for anything beyond it.
+
+Results are cached on disk (~/.cache/skill-creator/validate-cache.json) by
+the SHA-256 of the frontmatter block, the only input of the checks. Only
+skills whose frontmatter changed are parsed and checked again. The cache is
+discarded when VALIDATOR_VERSION or the rule set changes.
 """
 
 import sys
 import os
 import re
-import yaml
+import json
+import hashlib
+import argparse
 from pathlib import Path
+from skill_frontmatter import FrontmatterError, PyYAMLMissing, parse_frontmatter, read_frontmatter
 
-def validate_skill(skill_path):
-    """Basic validation of a skill"""
-    skill_path = Path(skill_path)
+# Bump when a check changes in a way the rule set below does not capture
+VALIDATOR_VERSION = 1
+
+# Define allowed properties
+ALLOWED_PROPERTIES = {'name', 'description', 'license', 'allowed-tools', 'metadata'}
+NAME_PATTERN = r'^[a-z0-9-]+$'
+MAX_NAME_LENGTH = 64  # per spec
+MAX_DESCRIPTION_LENGTH = 1024  # per spec
 
+# Directories never searched for skills in bulk mode
+SKIP_DIRS = {'.git', 'node_modules', '.venv', 'venv', '__pycache__', 'dist', 'build'}
+
+# Validation results by frontmatter hash
+CACHE_PATH = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'skill-creator' / 'validate-cache.json'
+CACHE_SIZE = 20000  # results kept, least recently used dropped first
+
+
+def load_skill_frontmatter(skill_path):
+    """(frontmatter text, None), or (None, [error]) if SKILL.md is missing or has no frontmatter"""
     # Check SKILL.md exists
-    skill_md = skill_path / 'SKILL.md'
+    skill_md = Path(skill_path) / 'SKILL.md'
     if not skill_md.exists():
-        return False, "SKILL.md not found"
+        return None, ["SKILL.md not found"]
 
-    # Read and validate frontmatter
-    content = skill_md.read_text()
-    if not content.startswith('---'):
-        return False, "No YAML frontmatter found"
-
-    # Extract frontmatter
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-    if not match:
-        return False, "Invalid frontmatter format"
+    # Read and extract frontmatter, without loading the skill body
+    try:
+        return read_frontmatter(skill_md), None
+    except FrontmatterError as e:
+        return None, [str(e)]
 
-    frontmatter_text = match.group(1)
 
-    # Parse YAML frontmatter
+def frontmatter_errors(frontmatter_text):
+    """All validation errors of a frontmatter block, in check order (empty if valid)"""
+    # Parse YAML frontmatter; PyYAMLMissing is left to check_frontmatter
     try:
-        frontmatter = yaml.safe_load(frontmatter_text)
-        if not isinstance(frontmatter, dict):
-            return False, "Frontmatter must be a YAML dictionary"
-    except yaml.YAMLError as e:
-        return False, f"Invalid YAML in frontmatter: {e}"
+        frontmatter = parse_frontmatter(frontmatter_text)
+    except PyYAMLMissing:
+        raise
+    except FrontmatterError as e:
+        return [str(e)]
+    if not isinstance(frontmatter, dict):
+        return ["Frontmatter must be a YAML dictionary"]
 
-    # Define allowed properties
-    ALLOWED_PROPERTIES = {'name', 'description', 'license', 'allowed-tools', 'metadata'}
+    errors = []
 
     # Check for unexpected properties (excluding nested keys under metadata)
     unexpected_keys = set(frontmatter.keys()) - ALLOWED_PROPERTIES
     if unexpected_keys:
-        return False, (
+        errors.append(
             f"Unexpected key(s) in SKILL.md frontmatter: {', '.join(sorted(unexpected_keys))}. "
             f"Allowed properties are: {', '.join(sorted(ALLOWED_PROPERTIES))}"
         )
 
     # Check required fields
     if 'name' not in frontmatter:
-        return False, "Missing 'name' in frontmatter"
+        errors.append("Missing 'name' in frontmatter")
     if 'description' not in frontmatter:
-        return False, "Missing 'description' in frontmatter"
+        errors.append("Missing 'description' in frontmatter")
 
     # Extract name for validation
     name = frontmatter.get('name', '')
     if not isinstance(name, str):
-        return False, f"Name must be a string, got {type(name).__name__}"
+        errors.append(f"Name must be a string, got {type(name).__name__}")
+        name = ''
     name = name.strip()
     if name:
         # Check naming convention (hyphen-case: lowercase with hyphens)
-        if not re.match(r'^[a-z0-9-]+$', name):
-            return False, f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)"
+        if not re.match(NAME_PATTERN, name):
+            errors.append(f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)")
         if name.startswith('-') or name.endswith('-') or '--' in name:
-            return False, f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens"
-        # Check name length (max 64 characters per spec)
-        if len(name) > 64:
-            return False, f"Name is too long ({len(name)} characters). Maximum is 64 characters."
+            errors.append(f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens")
+        # Check name length
+        if len(name) > MAX_NAME_LENGTH:
+            errors.append(f"Name is too long ({len(name)} characters). Maximum is {MAX_NAME_LENGTH} characters.")
 
     # Extract and validate description
     description = frontmatter.get('description', '')
     if not isinstance(description, str):
-        return False, f"Description must be a string, got {type(description).__name__}"
+        errors.append(f"Description must be a string, got {type(description).__name__}")
+        description = ''
     description = description.strip()
     if description:
         # Check for angle brackets
         if '<' in description or '>' in description:
-            return False, "Description cannot contain angle brackets (< or >)"
-        # Check description length (max 1024 characters per spec)
-        if len(description) > 1024:
-            return False, f"Description is too long ({len(description)} characters). Maximum is 1024 characters."
+            errors.append("Description cannot contain angle brackets (< or >)")
+        # Check description length
+        if len(description) > MAX_DESCRIPTION_LENGTH:
+            errors.append(f"Description is too long ({len(description)} characters). "
+                          f"Maximum is {MAX_DESCRIPTION_LENGTH} characters.")
+
+    return errors
 
+
+def check_frontmatter(frontmatter_text):
+    """
+    (errors, cacheable) for a frontmatter block. A block that needs PyYAML
+    when it is not installed gets an error that is not cached, since it
+    depends on the environment rather than on the frontmatter.
+    """
+    try:
+        return frontmatter_errors(frontmatter_text), True
+    except PyYAMLMissing as e:
+        return [str(e)], False
+
+
+def skill_errors(skill_path):
+    """All validation errors of a skill, in check order (empty if valid)"""
+    frontmatter_text, errors = load_skill_frontmatter(skill_path)
+    if errors:
+        return errors
+    return check_frontmatter(frontmatter_text)[0]
+
+
+def validate_skill(skill_path):
+    """Basic validation of a skill"""
+    errors = skill_errors(skill_path)
+    if errors:
+        return False, errors[0]
     return True, "Skill is valid!"
 
+
+def ruleset_id():
+    """Identifies the checks a cached result was produced by"""
+    rules = [VALIDATOR_VERSION, sorted(ALLOWED_PROPERTIES), NAME_PATTERN, MAX_NAME_LENGTH, MAX_DESCRIPTION_LENGTH]
+    return hashlib.sha256(json.dumps(rules).encode()).hexdigest()[:16]
+
+
+class ResultCache:
+    """On-disk validation results by frontmatter SHA-256; a cache, so I/O failures are ignored"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.ruleset = ruleset_id()
+        self.results = {}
+        self.dirty = False
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("ruleset") == self.ruleset and isinstance(data.get("results"), dict):
+            self.results = data["results"]
+
+    def get(self, digest):
+        errors = self.results.pop(digest, None)
+        if errors is not None:
+            # Most recently used last; saved along with the next new result,
+            # so a run with only hits does not rewrite the file
+            self.results[digest] = errors
+        return errors
+
+    def put(self, digest, errors):
+        self.results[digest] = errors
+        while len(self.results) > CACHE_SIZE:
+            del self.results[next(iter(self.results))]
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps({"ruleset": self.ruleset, "results": self.results}))
+            os.replace(tmp, self.path)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+
+def find_skills(roots):
+    """Every directory containing a SKILL.md below the roots, sorted"""
+    skills = set()
+    for root in roots:
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            if 'SKILL.md' in filenames:
+                skills.add(os.path.normpath(dirpath))
+    return sorted(skills)
+
+
+def validate_all(skill_dirs, jobs=None, cache=None):
+    """
+    Bulk results, {"path", "valid", "errors", "cached"} per skill.
+
+    Frontmatter is read here; the blocks not found in cache are checked on a
+    process pool, unless there is only one worker or block to check.
+    """
+    results = []
+    pending = {}  # frontmatter digest -> (text, results waiting for it)
+    for skill_dir in skill_dirs:
+        result = {"path": skill_dir, "valid": False, "errors": None, "cached": False}
+        results.append(result)
+        try:
+            frontmatter_text, errors = load_skill_frontmatter(skill_dir)
+        except (OSError, UnicodeDecodeError) as e:
+            frontmatter_text, errors = None, [f"Could not read SKILL.md: {e}"]
+        if errors:
+            result["errors"] = errors
+            continue
+        digest = hashlib.sha256(frontmatter_text.encode()).hexdigest()
+        errors = cache.get(digest) if cache is not None else None
+        if errors is not None:
+            result.update(errors=errors, cached=True)
+        else:
+            pending.setdefault(digest, (frontmatter_text, []))[1].append(result)
+
+    digests = list(pending)
+    texts = [pending[digest][0] for digest in digests]
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(texts) < 2:
+        checked = [check_frontmatter(text) for text in texts]
+    else:
+        # Imported here: it is slow to import and only bulk runs need it
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Large chunks keep the per-task overhead small for hundreds of skills
+        chunksize = max(1, len(texts) // (jobs * 4))
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            checked = list(executor.map(check_frontmatter, texts, chunksize=chunksize))
+
+    for digest, (errors, cacheable) in zip(digests, checked):
+        if cache is not None and cacheable:
+            cache.put(digest, errors)
+        for result in pending[digest][1]:
+            result["errors"] = errors
+
+    for result in results:
+        result["valid"] = not result["errors"]
+    return results
+
+
+def format_junit(results):
+    """JUnit XML with one test case per skill"""
+    from xml.etree import ElementTree
+
+    failures = sum(1 for result in results if not result["valid"])
+    suite = ElementTree.Element('testsuite', name='quick_validate', tests=str(len(results)),
+                                failures=str(failures), errors='0')
+    for result in results:
+        case = ElementTree.SubElement(suite, 'testcase', classname='skills', name=result["path"])
+        if not result["valid"]:
+            failure = ElementTree.SubElement(case, 'failure', message=result["errors"][0])
+            failure.text = "\n".join(result["errors"])
+    return ElementTree.tostring(suite, encoding='unicode')
+
+
+def format_text(results):
+    lines = []
+    for result in results:
+        if result["valid"]:
+            lines.append(f"✅ {result['path']}")
+        else:
+            lines.append(f"❌ {result['path']}")
+            lines.extend(f"   - {error}" for error in result["errors"])
+    invalid = sum(1 for result in results if not result["valid"])
+    cached = sum(1 for result in results if result["cached"])
+    lines.append(f"\n{len(results)} skills validated ({cached} from cache), {invalid} invalid")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate skill directories")
+    parser.add_argument('paths', nargs='+', metavar='path',
+                        help="Skill directory, or with --bulk, roots to search for SKILL.md files")
+    parser.add_argument('--bulk', action='store_true',
+                        help="Validate every skill found below the given roots")
+    parser.add_argument('--format', choices=['text', 'json', 'junit'], default='text',
+                        help="Bulk report format (default: text)")
+    parser.add_argument('-j', '--jobs', type=int, help="Worker processes for --bulk (default: CPU count)")
+    parser.add_argument('--cache', default=str(CACHE_PATH), help=f"Result cache file (default: {CACHE_PATH})")
+    parser.add_argument('--no-cache', action='store_true', help="Check every skill, without reading or updating the cache")
+    args = parser.parse_args()
+
+    if not args.bulk and len(args.paths) != 1:
+        parser.error("validating several paths needs --bulk")
+
+    cache = None if args.no_cache else ResultCache(args.cache)
+    skill_dirs = find_skills(args.paths) if args.bulk else [args.paths[0]]
+    results = validate_all(skill_dirs, args.jobs, cache)
+    if cache is not None:
+        cache.save()
+
+    if not args.bulk:
+        errors = results[0]["errors"]
+        print("\n".join(errors) if errors else "Skill is valid!")
+        sys.exit(1 if errors else 0)
+
+    if args.format == 'json':
+        invalid = sum(1 for result in results if not result["valid"])
+        print(json.dumps({"skills": results, "summary": {"total": len(results), "invalid": invalid}}, indent=2))
+    elif args.format == 'junit':
+        print(format_junit(results))
+    else:
+        print(format_text(results))
+    sys.exit(0 if all(result["valid"] for result in results) else 1)
+
+
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python quick_validate.py <skill_directory>")
-        sys.exit(1)
-    
-    valid, message = validate_skill(sys.argv[1])
-    print(message)
-    sys.exit(0 if valid else 1)
\ No newline at end of file
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Optional plan-review daemon.
+Serves ExitPlanMode checks over a Unix domain socket so the hook does not
+import the gate, load the plans index or re-read plans on every call. The
+indexes of every project it has seen stay in memory: each request still
+stats the plans directory and the plans in it (see resolve_latest), so
+edits are picked up exactly as in-process, but nothing is loaded or parsed
+again while they are unchanged. Indexes are written back to disk when they
+change, so the in-process fallback stays warm too.
+
+preuse-exitplanmode.py forwards events here when the socket exists and
+falls back to running the gate itself when it does not or the daemon does
+not answer.
+
+Protocol: the client sends its working directory, a newline, then the raw
+event JSON, and shuts down its write side. The daemon answers
+"<exit code> <stdout length>\\n" followed by stdout and stderr (UTF-8).
+
+Usage:
+    python3 hooks/plan-review-daemon.py [--socket PATH] [--idle-timeout SECONDS]
+"""
+
+import os
+import sys
+import time
+import signal
+import socket
+import argparse
+import threading
+import traceback
+import socketserver
+from pathlib import Path
+
+from plan_review_gate import evaluate
+
+SOCKET_ENV = "PLAN_REVIEW_SOCKET"
+REQUEST_TIMEOUT = 5  # seconds to receive a whole request
+
+
+def default_socket_path() -> str:
+    """Socket path shared with the hook: $PLAN_REVIEW_SOCKET or ~/.claude/plan-review.sock."""
+    return os.environ.get(SOCKET_ENV) or os.path.join(os.path.expanduser("~"), ".claude", "plan-review.sock")
+
+
+def encode_reply(code: int, out: str, err: str) -> bytes:
+    out_bytes = out.encode()
+    return f"{code} {len(out_bytes)}\n".encode() + out_bytes + err.encode()
+
+
+class GateServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, path: str):
+        super().__init__(path, GateHandler)
+        self.indexes = {}
+        self.lock = threading.Lock()
+        self.last_request = time.monotonic()
+        self.requests = 0
+
+
+class GateHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        self.connection.settimeout(REQUEST_TIMEOUT)
+        try:
+            request = self.rfile.read()
+        except OSError:
+            return
+        client_cwd, _, data = request.partition(b"\n")
+
+        server = self.server
+        with server.lock:
+            server.last_request = time.monotonic()
+            server.requests += 1
+            try:
+                # Run from the hook's directory so relative paths (and the
+                # messages quoting them) come out exactly as in-process;
+                # requests are serialized by the lock
+                os.chdir(client_cwd)
+                reply = encode_reply(*evaluate(data, server.indexes))
+            except Exception:
+                # Same outcome as the hook crashing in-process: non-blocking error
+                reply = encode_reply(1, "", traceback.format_exc())
+        try:
+            self.wfile.write(reply)
+        except OSError:
+            pass
+
+
+def claim_socket(path: str) -> bool:
+    """Remove a stale socket file; False if a live daemon already listens on it."""
+    if not os.path.exists(path):
+        return True
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except OSError:
+        os.unlink(path)
+        return True
+    finally:
+        probe.close()
+    return False
+
+
+def watch_idle(server: GateServer, idle_timeout: float) -> None:
+    """Shut the server down after idle_timeout seconds without requests."""
+    while True:
+        remaining = server.last_request + idle_timeout - time.monotonic()
+        if remaining <= 0:
+            server.shutdown()
+            return
+        time.sleep(min(remaining, 5))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve plan-review ExitPlanMode checks over a Unix socket")
+    parser.add_argument(
+        "--socket",
+        default=default_socket_path(),
+        help=f"Socket path (default: ${SOCKET_ENV} or ~/.claude/plan-review.sock)"
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        default=0,
+        help="Exit after this many seconds without requests (default: 0, never)"
+    )
+    args = parser.parse_args()
+
+    path = args.socket
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    if not claim_socket(path):
+        print(f"plan-review daemon already running on {path}", file=sys.stderr)
+        sys.exit(1)
+
+    # Only the owner may talk to the daemon
+    old_umask = os.umask(0o177)
+    try:
+        server = GateServer(path)
+    finally:
+        os.umask(old_umask)
+
+    # SIGTERM unwinds like Ctrl-C so the socket file is removed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    if args.idle_timeout > 0:
+        threading.Thread(target=watch_idle, args=(server, args.idle_timeout), daemon=True).start()
+
+    print(f"plan-review daemon listening on {path}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        print(f"plan-review daemon stopped after {server.requests} requests", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1004 @@
+#!/usr/bin/env python3
+"""
+Plan review gate for ExitPlanMode, run by preuse-exitplanmode.py.
+Blocks plan execution until review status is APPROVED, unless a bypass
+applies: quick marker, plans under the size threshold, or max reviews reached.
+Also allows through when no plan file is found, the file is unreadable, or
+stdin is not JSON.
+
+The plan checked is the one the calling session wrote, looked up by
+session_id in ~/.claude/plan-sessions/ (kept up to date by the PostToolUse
+hook, postuse-record-plan.py) or, failing that, found in the tail of the
+session transcript. Only when neither knows the session does the gate fall
+back to the most recently modified plan file.
+
+The plans directory's listing is remembered in an index next to it
+(.claude/.plans-index.json), so the directory is only rescanned when its
+mtime changes (a plan was added, removed or replaced) or the index is older
+than RESCAN_INTERVAL. In between, every listed plan is stat-ed, so an older
+plan edited in place, which leaves the directory mtime alone, still becomes
+the most recent one at once.
+
+The thresholds come from the project's policy file,
+.claude/plan-review.json (see POLICY_SETTINGS), when there is one: maximum
+reviews, minimum plan size, bypass markers and required reviewers, plus
+rules overriding them for plans whose name matches a glob. It is compiled
+into a decision table (one complete set of settings per rule, first match
+wins) that is kept in the index and only rebuilt when the file's mtime or
+size changes.
+
+A review can also be recorded in a sidecar next to the plan,
+<plan stem>.review.json (written by scripts/record-review.py), holding the
+status, the number of completed reviews and every round's reviewer verdicts
+with timestamps. When present it is used instead of the markdown status
+block, unless that block is further along (see effective_status), and it is
+cached in the index by its own mtime and size.
+
+The index also caches each recent plan's analysis (line count, bypass
+decision and parsed review status) keyed by its mtime and size, so repeated
+ExitPlanMode calls on an unchanged plan neither read nor parse it. A plan
+that changed is analysed in one buffered pass over at most
+PLAN_REVIEW_MAX_BYTES (default 4 MiB); the status block is looked for in
+the tail only, unless the heading also appears earlier in the plan.
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import sys
+import re
+import time
+from pathlib import Path
+
+# Defaults, overridden per project by the policy file
+MAX_REVIEWS = 3
+QUICK_BYPASS_MARKER = "<!-- QUICK -->"
+MIN_LINES_FOR_REVIEW = 50
+
+# Per-project policy, beside plans/ like the index
+POLICY_NAME = "plan-review.json"
+# Settings a policy (top level or rule) may give, with their types
+POLICY_SETTINGS = {
+    "max_reviews": int,
+    "min_lines": int,
+    "bypass_markers": list,
+    "required_reviewers": list,
+    "bypass": bool,
+}
+DEFAULT_POLICY = {
+    "max_reviews": MAX_REVIEWS,
+    "min_lines": MIN_LINES_FOR_REVIEW,
+    "bypass_markers": [QUICK_BYPASS_MARKER],
+    "required_reviewers": [],
+    "bypass": False,
+    "rule": None,  # glob of the rule the settings come from
+}
+
+# Lives beside plans/, not in it, so writing it doesn't change the
+# directory mtime it is keyed on
+INDEX_NAME = ".plans-index.json"
+INDEX_VERSION = 4
+RESCAN_INTERVAL = 300  # seconds; for directory mtimes too coarse to show a change
+ANALYSIS_CACHE_SIZE = 32  # plans whose analysis is kept
+
+# (exit code, stdout, stderr) letting the tool call through
+ALLOW = (0, "", "")
+
+# Machine-readable review record next to each plan
+REVIEW_SUFFIX = ".review.json"
+REVIEW_VERSION = 1
+RECORD_SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "record-review.py"
+
+# Session -> plan mapping: one small file per session id, so parallel
+# sessions never contend and a lookup is a single read
+SESSIONS_DIR_NAME = "plan-sessions"
+SESSION_ID_PATTERN = re.compile(r'[A-Za-z0-9_-]{1,128}')
+SESSION_TTL = 7 * 24 * 3600  # seconds before an idle mapping is pruned
+PLAN_WRITE_TOOLS = {"Write", "Edit", "MultiEdit"}
+TRANSCRIPT_TAIL = 1024 * 1024  # bytes of transcript searched for a plan path
+TRANSCRIPT_PLAN_MARKER = b"/.claude/plans/"  # only transcript lines with it are parsed
+
+# File to append one JSON line of phase timings to per evaluated event
+TIMING_LOG_ENV = "PLAN_REVIEW_TIMING_LOG"
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+
+
+# Plans are read in blocks, at most MAX_PLAN_BYTES of them (plus the tail
+# window), so a plan with pasted logs cannot make the hook slow
+READ_CHUNK = 64 * 1024
+TAIL_WINDOW = 8 * 1024
+MAX_PLAN_BYTES = _env_int("PLAN_REVIEW_MAX_BYTES", 4 * 1024 * 1024)
+
+STATUS_HEADING = "## Plan Review Status"
+STATUS_PATTERN = re.compile(
+    r'## Plan Review Status\s*\n'
+    r'Reviews:\s*(\d+)/\d+\s*\n'
+    r'Status:\s*(\w+)',
+    re.MULTILINE
+)
+
+
+class PhaseTimer:
+    """Microseconds spent in each phase of the gate, for PLAN_REVIEW_TIMING_LOG."""
+
+    def __init__(self):
+        self.start = self.last = time.perf_counter_ns()
+        self.phases = {}
+        self.info = {}
+
+    def mark(self, phase: str) -> None:
+        """Charge the time since the previous mark to phase."""
+        now = time.perf_counter_ns()
+        self.phases[phase] = self.phases.get(phase, 0) + (now - self.last) // 1000
+        self.last = now
+
+    def write(self, path: str, **fields) -> None:
+        """Append one JSON line with fields, info and phases; failures are ignored."""
+        record = {
+            "ts": round(time.time(), 3),
+            **fields,
+            **self.info,
+            "phases_us": self.phases,
+            "total_us": (self.last - self.start) // 1000,
+        }
+        try:
+            with open(path, "a") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError:
+            pass
+
+
+def find_plans_dir(cwd: str) -> Path | None:
+    """Locate .claude/plans/ in the project, falling back to the home directory."""
+    claude_dir = Path(cwd) / ".claude" / "plans"
+    if not claude_dir.exists():
+        # Check home directory
+        home_claude = Path.home() / ".claude" / "plans"
+        if home_claude.exists():
+            claude_dir = home_claude
+        else:
+            return None
+    return claude_dir
+
+
+def is_plan_path(path: Path) -> bool:
+    """Whether path is a .md file directly inside a .claude/plans/ directory."""
+    return path.suffix == ".md" and path.parent.name == "plans" and path.parent.parent.name == ".claude"
+
+
+def session_file(session_id) -> Path | None:
+    """Mapping file for a session id; None if the id is missing or not a plain token."""
+    if not isinstance(session_id, str) or not SESSION_ID_PATTERN.fullmatch(session_id):
+        return None
+    return Path.home() / ".claude" / SESSIONS_DIR_NAME / f"{session_id}.json"
+
+
+def prune_sessions(sessions_dir: Path) -> None:
+    """Delete mappings not updated for SESSION_TTL seconds."""
+    cutoff = time.time() - SESSION_TTL
+    try:
+        with os.scandir(sessions_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+    except OSError:
+        pass
+
+
+def record_session_plan(session_id, plan_path: Path) -> None:
+    """Remember plan_path as the session's plan; failures are ignored (it is only a cache)."""
+    path = session_file(session_id)
+    if path is None:
+        return
+    is_new = not path.exists()
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps({"plan": str(plan_path), "updated_at": round(time.time(), 3)}))
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        return
+    if is_new:
+        prune_sessions(path.parent)
+
+
+def lookup_session_plan(session_id) -> Path | None:
+    """The plan recorded for a session, if any."""
+    path = session_file(session_id)
+    if path is None:
+        return None
+    try:
+        plan = json.loads(path.read_text()).get("plan")
+    except (OSError, ValueError, AttributeError):
+        return None
+    return Path(plan) if isinstance(plan, str) else None
+
+
+def transcript_plan_writes(entry) -> list[Path]:
+    """Plan files written by the Write/Edit/MultiEdit tool_use blocks of one transcript entry."""
+    message = entry.get("message") if isinstance(entry, dict) else None
+    content = message.get("content") if isinstance(message, dict) else None
+    if not isinstance(content, list):
+        return []
+    plans = []
+    for block in content:
+        if (not isinstance(block, dict) or block.get("type") != "tool_use"
+                or block.get("name") not in PLAN_WRITE_TOOLS):
+            continue
+        tool_input = block.get("input")
+        file_path = tool_input.get("file_path") if isinstance(tool_input, dict) else None
+        if isinstance(file_path, str) and is_plan_path(Path(file_path)):
+            plans.append(Path(file_path))
+    return plans
+
+
+def plan_from_transcript(transcript_path) -> Path | None:
+    """
+    Last plan file written according to the final TRANSCRIPT_TAIL bytes of a
+    transcript. Only Write, Edit and MultiEdit calls count, as in
+    record_from_event(); reading a plan does not make it the session's.
+    """
+    if not isinstance(transcript_path, str):
+        return None
+    try:
+        with open(transcript_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            f.seek(max(size - TRANSCRIPT_TAIL, 0))
+            tail = f.read(TRANSCRIPT_TAIL)
+    except OSError:
+        return None
+    for line in reversed(tail.splitlines()):
+        if TRANSCRIPT_PLAN_MARKER not in line:
+            continue
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            # The first line may be cut by the tail
+            continue
+        plans = transcript_plan_writes(entry)
+        if plans:
+            return plans[-1]
+    return None
+
+
+def session_plan(event: dict) -> tuple[Path | None, str]:
+    """
+    The plan of the session that sent event, and where it was found:
+    "session" (the mapping), "transcript" (then recorded) or "latest" (unknown).
+    """
+    session_id = event.get("session_id")
+    plan = lookup_session_plan(session_id)
+    if plan is not None:
+        return plan, "session"
+    plan = plan_from_transcript(event.get("transcript_path"))
+    if plan is not None:
+        record_session_plan(session_id, plan)
+        return plan, "transcript"
+    return None, "latest"
+
+
+def record_from_event(data: bytes) -> None:
+    """PostToolUse: record the plan file a Write/Edit/MultiEdit touched for its session."""
+    try:
+        event = json.loads(data)
+    except ValueError:
+        return
+    if not isinstance(event, dict) or event.get("tool_name") not in PLAN_WRITE_TOOLS:
+        return
+    tool_input = event.get("tool_input")
+    file_path = tool_input.get("file_path") if isinstance(tool_input, dict) else None
+    if not isinstance(file_path, str):
+        return
+    path = Path(event.get("cwd") or ".", file_path)
+    if is_plan_path(path):
+        record_session_plan(event.get("session_id"), path.absolute())
+
+
+def load_index(plans_dir: Path) -> dict:
+    """Load the plans index; missing, corrupt or outdated → empty."""
+    try:
+        index = json.loads((plans_dir.parent / INDEX_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        return {}
+    return index
+
+
+def save_index(plans_dir: Path, index: dict) -> None:
+    """Write the plans index atomically; failures are ignored (it is only a cache)."""
+    index["version"] = INDEX_VERSION
+    path = plans_dir.parent / INDEX_NAME
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(index))
+        os.replace(tmp, path)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def scan_plans(plans_dir: Path) -> list[dict] | None:
+    """{"name", "mtime_ns", "size"} of every .md file, with one scandir pass."""
+    plans = []
+    try:
+        with os.scandir(plans_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".md") or not entry.is_file():
+                    continue
+                st = entry.stat()
+                plans.append({"name": entry.name, "mtime_ns": st.st_mtime_ns, "size": st.st_size})
+    except OSError:
+        return None
+    return plans
+
+
+def newest_plan(plans: list[dict]) -> dict | None:
+    """The most recently modified of plans (the first one on a tie)."""
+    latest = None
+    for plan in plans:
+        if latest is None or plan["mtime_ns"] > latest["mtime_ns"]:
+            latest = plan
+    return latest
+
+
+def resolve_latest(plans_dir: Path, index: dict) -> dict | None:
+    """
+    Return {"name", "mtime_ns", "size"} of the most recent plan, updating index.
+
+    While the directory mtime matches the index, the plans listed there are
+    stat-ed (an edit in place changes no directory mtime); otherwise, or if
+    one of them is gone, the directory is rescanned once and the index updated.
+    """
+    try:
+        dir_mtime_ns = plans_dir.stat().st_mtime_ns
+    except OSError:
+        return None
+
+    now = time.time()
+    names = index.get("names")
+    if (isinstance(names, list) and index.get("dir_mtime_ns") == dir_mtime_ns
+            and now - index.get("scanned_at", 0) < RESCAN_INTERVAL):
+        # Plain os.stat on strings: this runs for every plan on every call
+        base = os.fspath(plans_dir)
+        newest = newest_st = None
+        try:
+            for name in names:
+                st = os.stat(os.path.join(base, name))
+                if newest_st is None or st.st_mtime_ns > newest_st.st_mtime_ns:
+                    newest, newest_st = name, st
+        except OSError:
+            pass  # a listed plan is gone: rescan
+        else:
+            latest = None
+            if newest is not None:
+                latest = {"name": newest, "mtime_ns": newest_st.st_mtime_ns, "size": newest_st.st_size}
+            if latest != index.get("latest"):
+                index["latest"] = latest
+                index["dirty"] = True
+            return latest
+
+    plans = scan_plans(plans_dir)
+    latest = newest_plan(plans) if plans is not None else None
+    index.update({
+        "dir_mtime_ns": dir_mtime_ns,
+        "scanned_at": now,
+        "names": [plan["name"] for plan in plans] if plans is not None else None,
+        "latest": latest,
+        "dirty": True,
+    })
+    return latest
+
+
+def stat_plan(plans_dir: Path, name: str) -> dict | None:
+    """{"name", "mtime_ns", "size"} of one plan, or None if it is gone."""
+    try:
+        st = (plans_dir / name).stat()
+    except OSError:
+        return None
+    return {"name": name, "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def status_from_match(match: re.Match | None) -> dict:
+    """Review status dict for a STATUS_PATTERN match (or its absence)."""
+    status = {
+        "present": False,
+        "approved": False,
+        "review_count": 0,
+        "status": "NONE"
+    }
+
+    if match:
+        status["present"] = True
+        status["review_count"] = int(match.group(1))
+        status["status"] = match.group(2).upper()
+        status["approved"] = status["status"] == "APPROVED"
+
+    return status
+
+
+def policy_settings(config: dict, base: dict, where: str, extra: tuple = ()) -> dict:
+    """base updated with the POLICY_SETTINGS found in config; ValueError if one is invalid."""
+    settings = dict(base)
+    for key, value in config.items():
+        if key in extra:
+            continue
+        kind = POLICY_SETTINGS.get(key)
+        if kind is None:
+            raise ValueError(f"{where}: unknown setting {key!r}")
+        if kind is list:
+            valid = isinstance(value, list) and all(isinstance(v, str) and v for v in value)
+        elif kind is int:
+            valid = isinstance(value, int) and not isinstance(value, bool) and value >= 0
+        else:
+            valid = isinstance(value, bool)
+        if not valid:
+            expected = {list: "a list of strings", int: "a non-negative integer", bool: "true or false"}[kind]
+            raise ValueError(f"{where}: {key!r} must be {expected}")
+        settings[key] = value
+    return settings
+
+
+def compile_policy(config: dict) -> list:
+    """
+    Decision table for a policy file's contents: [[glob, settings], ...].
+
+    Top-level settings override DEFAULT_POLICY and each rule overrides the
+    top level, so every row holds complete settings; the table ends with a
+    "*" row for plans no rule matches. Raises ValueError if config is invalid.
+    """
+    if not isinstance(config, dict):
+        raise ValueError("policy must be a JSON object")
+    base = policy_settings(config, DEFAULT_POLICY, "policy", extra=("rules",))
+    rules = config.get("rules", [])
+    if not isinstance(rules, list):
+        raise ValueError("policy: 'rules' must be a list")
+
+    table = []
+    for i, rule in enumerate(rules):
+        if not isinstance(rule, dict) or not isinstance(rule.get("match"), str):
+            raise ValueError(f"rules[{i}]: must be an object with a 'match' glob")
+        settings = policy_settings(rule, base, f"rules[{i}]", extra=("match",))
+        settings["rule"] = rule["match"]
+        table.append([rule["match"], settings])
+    table.append(["*", base])
+    return table
+
+
+def read_policy(path: Path, key: list | None) -> dict:
+    """Compile the policy file at path (stat key, None if missing) into a cache entry."""
+    error = None
+    table = compile_policy({})
+    if key is not None:
+        try:
+            table = compile_policy(json.loads(path.read_text()))
+        except (OSError, ValueError) as e:
+            # Unusable policy: keep the defaults rather than block every plan
+            error = str(e)
+    digest = hashlib.sha256(json.dumps(table, sort_keys=True).encode()).hexdigest()
+    return {"key": key, "id": digest[:16], "table": table, "error": error}
+
+
+# Compiled policies by file path, for a caller that stays alive (the daemon)
+_policies = {}
+
+
+def load_policy(plans_dir: Path, index: dict | None = None) -> dict:
+    """
+    Compiled policy for a plans directory: {"key", "id", "table", "error"}.
+
+    The policy file is stat-ed on every call but only read and compiled when
+    its mtime and size differ from the copy kept in memory or in the index
+    (index["policy"]). A missing file gives the defaults; an invalid one
+    gives the defaults with the reason in "error".
+    """
+    path = plans_dir.parent / POLICY_NAME
+    try:
+        st = path.stat()
+        key = [st.st_mtime_ns, st.st_size]
+    except OSError:
+        key = None
+
+    policy = _policies.get(str(path))
+    if policy is None or policy["key"] != key:
+        policy = index.get("policy") if index is not None else None
+        if not isinstance(policy, dict) or policy.get("key") != key:
+            policy = read_policy(path, key)
+        _policies[str(path)] = policy
+    if index is not None:
+        cached = index.get("policy")
+        if not isinstance(cached, dict) or cached.get("key") != policy["key"]:
+            index["policy"] = policy
+            index["dirty"] = True
+    return policy
+
+
+def plan_policy(policy: dict, name: str) -> dict:
+    """Settings for a plan: the first decision table row whose glob matches its name."""
+    for glob, settings in policy["table"]:
+        if fnmatch.fnmatchcase(name, glob):
+            return settings
+    return DEFAULT_POLICY
+
+
+def bypass_decision(has_marker: bool, line_count: int, settings: dict = DEFAULT_POLICY) -> tuple[bool, str]:
+    """Bypass decision from a bypass marker, the plan's line count and its policy settings."""
+    # Policy rule bypassing the plan outright
+    if settings["bypass"]:
+        return True, f"Bypassed by policy rule {settings['rule']!r}"
+
+    # Quick bypass marker
+    if has_marker:
+        return True, "Quick bypass marker found"
+
+    # Small plan threshold
+    if line_count < settings["min_lines"]:
+        return True, f"Plan is {line_count} lines (threshold: {settings['min_lines']})"
+
+    return False, ""
+
+
+def analyze_plan(plan_path: Path, max_bytes: int = MAX_PLAN_BYTES,
+                 settings: dict = DEFAULT_POLICY) -> dict | None:
+    """
+    Everything the hook decision needs from a plan file, in one bounded pass.
+
+    The first max_bytes are read in READ_CHUNK blocks: newlines are counted
+    per block (leading and trailing blank space excluded), and the quick
+    marker and status heading are looked for across block boundaries (any
+    of the settings' bypass markers counts). The first
+    status block in the plan is then parsed: from the last TAIL_WINDOW
+    bytes, where it is normally appended, when the heading first occurs
+    there, otherwise by scanning the (bounded) plan in full.
+
+    A plan larger than max_bytes is marked truncated: its line count is a
+    lower bound and a quick marker past the limit is not seen, but its tail
+    is still checked for the status block.
+
+    Returns None if the plan is empty or cannot be read.
+    """
+    markers = [marker.encode() for marker in settings["bypass_markers"]]
+    heading = STATUS_HEADING.encode()
+    overlap = max([len(heading)] + [len(marker) for marker in markers]) - 1
+    has_marker = seen_text = False
+    first_heading = None
+    newlines = leading = trailing = 0
+    carry = tail = b""
+    read = 0
+
+    try:
+        with open(plan_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            while read < max_bytes:
+                chunk = f.read(min(READ_CHUNK, max_bytes - read))
+                if not chunk:
+                    break
+                read += len(chunk)
+
+                count = chunk.count(b"\n")
+                newlines += count
+                if not seen_text:
+                    text = chunk.lstrip()
+                    leading += chunk[:len(chunk) - len(text)].count(b"\n")
+                    seen_text = bool(text)
+                text = chunk.rstrip()
+                trailing = chunk[len(text):].count(b"\n") if text else trailing + count
+
+                window = carry + chunk
+                has_marker = has_marker or any(marker in window for marker in markers)
+                if first_heading is None:
+                    found = window.find(heading)
+                    if found >= 0:
+                        first_heading = read - len(window) + found
+                carry = window[-overlap:]
+                tail = (tail + chunk)[-TAIL_WINDOW:]
+
+            tail_start = read - len(tail)
+            truncated = read < size
+            if truncated:
+                tail_start = max(size - TAIL_WINDOW, read)
+                f.seek(tail_start)
+                tail = f.read(TAIL_WINDOW)
+                if first_heading is None and heading in tail:
+                    first_heading = tail_start
+
+            match = None
+            if first_heading is not None and first_heading < tail_start:
+                # A heading before the tail window: scan in full, so the
+                # first block in the plan wins as it would with one search
+                f.seek(0)
+                match = STATUS_PATTERN.search(f.read(max_bytes).decode("utf-8", "replace"))
+                if match is None and truncated:
+                    match = STATUS_PATTERN.search(tail.decode("utf-8", "replace"))
+            elif first_heading is not None:
+                match = STATUS_PATTERN.search(tail.decode("utf-8", "replace"))
+    except OSError:
+        return None
+
+    if read == 0:
+        return None
+
+    line_count = newlines - leading - trailing + 1 if seen_text else 1
+    bypass, reason = bypass_decision(has_marker, line_count, settings)
+    return {
+        "line_count": line_count,
+        "bypass": bypass,
+        "reason": reason,
+        "status": status_from_match(match),
+        "truncated": truncated,
+        "max_bytes": max_bytes,
+    }
+
+
+def cached_analysis(plans_dir: Path, index: dict, latest: dict, policy: dict) -> dict | None:
+    """
+    Return analyze_plan() for the plan described by latest, using the index.
+
+    A cached analysis is reused without opening the plan while its mtime,
+    size, the byte limit and the compiled policy match; otherwise the plan
+    is analysed again. Returns None if the plan cannot be read.
+    """
+    analyses = index.setdefault("analyses", {})
+    name = latest["name"]
+    cached = analyses.get(name)
+    if (cached and cached.get("max_bytes") == MAX_PLAN_BYTES and cached.get("policy") == policy["id"]
+            and (cached["mtime_ns"], cached["size"]) == (latest["mtime_ns"], latest["size"])):
+        return cached
+
+    analysis = analyze_plan(plans_dir / name, settings=plan_policy(policy, name))
+    if analysis is None:
+        return None
+    analysis["mtime_ns"] = latest["mtime_ns"]
+    analysis["size"] = latest["size"]
+    analysis["policy"] = policy["id"]
+
+    # Most recently used last; evict from the front
+    analyses.pop(name, None)
+    analyses[name] = analysis
+    while len(analyses) > ANALYSIS_CACHE_SIZE:
+        del analyses[next(iter(analyses))]
+    index["dirty"] = True
+    return analysis
+
+
+def review_path(plan_path: Path) -> Path:
+    """The review sidecar of a plan: <stem>.review.json beside it."""
+    return plan_path.with_name(plan_path.stem + REVIEW_SUFFIX)
+
+
+def load_review(path: Path) -> dict | None:
+    """A review sidecar's contents, or None if missing or malformed."""
+    try:
+        review = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+    if (not isinstance(review, dict) or review.get("version") != REVIEW_VERSION
+            or not isinstance(review.get("status"), str) or not isinstance(review.get("reviews"), int)):
+        return None
+    return review
+
+
+def review_status(review: dict) -> dict:
+    """Review status dict (as status_from_match returns) from a sidecar."""
+    status = review["status"].upper()
+    rounds = [r for r in review.get("rounds") or [] if isinstance(r, dict)]
+    return {
+        "present": True,
+        "approved": status == "APPROVED",
+        "review_count": review["reviews"],
+        "status": status,
+        "source": "sidecar",
+        "rounds": len(rounds),
+        # Who took part in the last completed review
+        "reviewers": sorted({str(r.get("reviewer")) for r in rounds if r.get("review") == review["reviews"]}),
+    }
+
+
+def apply_review(analysis: dict, plan_path: Path) -> bool:
+    """
+    Attach the plan's sidecar status to analysis["review"], or drop it when
+    the sidecar is gone. The sidecar is only read when its mtime or size
+    differs from the cached one. Returns True if analysis changed.
+    """
+    try:
+        st = review_path(plan_path).stat()
+    except OSError:
+        return analysis.pop("review", None) is not None
+    key = [st.st_mtime_ns, st.st_size]
+    cached = analysis.get("review")
+    if cached and cached["key"] == key:
+        return False
+    review = load_review(review_path(plan_path))
+    # A malformed sidecar is remembered too, so it is not re-read every call
+    analysis["review"] = {"key": key, "status": review_status(review) if review else None}
+    return True
+
+
+def effective_status(analysis: dict) -> dict:
+    """
+    The further along of the sidecar status and the markdown block's: an
+    approval, else the one with more completed reviews (the sidecar on a
+    tie). record-review.py writes a PENDING sidecar from the first round on,
+    so an APPROVED markdown block still counts until the sidecar closes the
+    cycle.
+    """
+    review = analysis.get("review")
+    markdown = analysis["status"]
+    if not review or not review["status"]:
+        return markdown
+    sidecar = review["status"]
+    if sidecar["approved"] or not markdown["present"]:
+        return sidecar
+    if markdown["approved"] or markdown["review_count"] > sidecar["review_count"]:
+        return markdown
+    return sidecar
+
+
+def missing_reviewers(status: dict, settings: dict) -> list[str]:
+    """Required reviewers without a round in the review that set status."""
+    reviewers = status.get("reviewers", ())
+    return [name for name in settings["required_reviewers"] if name not in reviewers]
+
+
+def plan_verdict(analysis: dict, settings: dict = DEFAULT_POLICY) -> str:
+    """What the gate does with an analysed plan: "bypass", "approved", "max-reviews" or "blocked"."""
+    status = effective_status(analysis)
+    if analysis["bypass"]:
+        return "bypass"
+    if status["approved"] and not missing_reviewers(status, settings):
+        return "approved"
+    if status["review_count"] >= settings["max_reviews"]:
+        return "max-reviews"
+    return "blocked"
+
+
+def check_plan(plans_dir: Path, index: dict, timer: PhaseTimer | None = None,
+               plan_name: str | None = None) -> tuple[int, str, str]:
+    """
+    Validate plan_name in plans_dir, or the most recent plan when it is not
+    given or no longer exists; returns the hook decision.
+    """
+    timer = timer or PhaseTimer()
+    latest = stat_plan(plans_dir, plan_name) if plan_name else None
+    if latest is None:
+        latest = resolve_latest(plans_dir, index)
+    timer.mark("discover")
+    if not latest:
+        # No plan file found - allow through
+        return ALLOW
+    plan_path = plans_dir / latest["name"]
+
+    # Thresholds for this plan, recompiled only when the policy file changed
+    policy = load_policy(plans_dir, index)
+    settings = plan_policy(policy, latest["name"])
+    if policy["error"]:
+        timer.info["policy_error"] = policy["error"]
+    timer.mark("policy")
+
+    # Read and parse only when the plan or the policy changed since the last call
+    cached = index.get("analyses", {}).get(latest["name"])
+    analysis = cached_analysis(plans_dir, index, latest, policy)
+    timer.mark("analyze")
+    if analysis is None:
+        # Could not read plan - allow through
+        return ALLOW
+    if apply_review(analysis, plan_path):
+        index["dirty"] = True
+    timer.mark("review")
+    timer.info.update({
+        "plan": latest["name"],
+        "bytes": latest["size"],
+        "line_count": analysis["line_count"],
+        "truncated": analysis["truncated"],
+        "cached": analysis is cached,
+    })
+
+    verdict = plan_verdict(analysis, settings)
+    status = effective_status(analysis)
+    max_reviews = settings["max_reviews"]
+
+    # Bypassed or approved: allow through
+    if verdict in ("bypass", "approved"):
+        return ALLOW
+
+    # If max reviews reached, allow with warning
+    if verdict == "max-reviews":
+        return 0, json.dumps({
+            "systemMessage": f"Warning: Plan approved after {max_reviews} review cycles without full consensus."
+        }) + "\n", ""
+
+    # Block and provide instructions
+    review_count = status["review_count"]
+    required = settings["required_reviewers"]
+    if status["approved"]:
+        reason = f"Plan is approved without a round from: {', '.join(missing_reviewers(status, settings))}."
+    else:
+        reason = "Plan requires review before execution."
+
+    instructions = f"""
+BLOCKED: {reason}
+
+Plan file: {plan_path}
+Review cycle: {review_count + 1}/{max_reviews}
+
+## Multi-Agent Review Process (3 rounds)
+
+### Round 1: Independent Review (parallel)
+Spawn TWO review agents IN PARALLEL using the Task tool.
+**IMPORTANT**: Save the agent IDs returned - you'll need them for Round 2.
+
+1. **Architect Reviewer** (subagent_type: "plan-review:architect-reviewer"):
+   - Include the full plan content
+   - Agent will challenge architectural decisions, verify best practices via MCP/web
+   - Returns findings as HIGH/MEDIUM/LOW with verdict
+   - **Save the agentId from the response**
+
+2. **Code Simplifier** (subagent_type: "code-simplifier:code-simplifier"):
+   - Include the full plan content
+   - Ask it to review for over-engineering, unnecessary complexity, simpler alternatives
+   - Returns findings with simplification recommendations
+   - **Save the agentId from the response**
+
+### Round 2: Cross-Review Debate (parallel)
+After Round 1, RESUME both agents IN PARALLEL using the `resume` parameter with their agent IDs from Round 1.
+
+Each agent receives (via prompt):
+- The OTHER agent's Round 1 findings
+
+Prompt each resumed agent to:
+- Review the other's findings
+- AGREE, DISAGREE, or ADD NUANCE to each point
+- Identify any findings they now reconsider based on the other perspective
+- State their final position on each issue
+
+Example Task call for Round 2:
+```
+Task(resume="<architect-agent-id>", prompt="Here are the Code Simplifier's findings: ...")
+Task(resume="<simplifier-agent-id>", prompt="Here are the Architect's findings: ...")
+```
+
+### Round 3: Consensus Formation (you synthesize)
+After Round 2, YOU form the consensus:
+1. **Aligned findings**: Issues both agents agree on → must address
+2. **Disputed findings**: Where they disagree → use your judgment, document reasoning
+3. **Withdrawn findings**: Issues an agent reconsidered → can skip
+
+Update the plan:
+1. Address all aligned HIGH severity concerns
+2. Make judgment calls on disputed items (document why)
+3. Add the "## Plan Review Status" section:
+
+```markdown
+## Plan Review Status
+Reviews: {review_count + 1}/{max_reviews}
+Status: APPROVED
+Last Review: <current timestamp>
+
+### Consensus Summary
+**Aligned (addressed):**
+- [finding]: [how addressed]
+
+**Disputed (judgment call):**
+- [finding]: [decision and reasoning]
+
+**Withdrawn:**
+- [finding]: [why reconsidered]
+```
+
+Instead of the markdown section, you can record the review in a sidecar the
+hook reads without parsing the plan ({plan_path.stem}{REVIEW_SUFFIX}):
+
+```bash
+python3 "{RECORD_SCRIPT}" "{plan_path}" --round 1 --reviewer architect-reviewer --verdict REVISE
+python3 "{RECORD_SCRIPT}" "{plan_path}" --round 3 --reviewer consensus --verdict APPROVED --status APPROVED
+```
+"""
+
+    if required:
+        instructions += f"""
+This project's policy requires a round from: {', '.join(required)}.
+Approval only counts once each of them has a round recorded in the sidecar
+for the approved review (--reviewer <name>); the markdown section alone is
+not enough.
+"""
+
+    instructions += "\nThen call ExitPlanMode again.\n"
+
+    bypass_options = [f"- Add `{marker}` to plan for trivial changes" for marker in settings["bypass_markers"]]
+    if settings["min_lines"]:
+        bypass_options.append(f"- Plans under {settings['min_lines']} lines auto-bypass")
+    if bypass_options:
+        instructions += "\n**Bypass options:**\n" + "\n".join(bypass_options) + "\n"
+
+    return 2, "", instructions + "\n"
+
+
+def evaluate(data: bytes, indexes: dict | None = None) -> tuple[int, str, str]:
+    """
+    Hook decision for a raw PreToolUse event: (exit code, stdout, stderr).
+
+    indexes maps absolute plans directories to their index for a caller that
+    stays alive between events (the daemon); without it the index is loaded
+    from disk. With PLAN_REVIEW_TIMING_LOG set, phase timings are appended
+    to that file as one JSON line per event.
+    """
+    timer = PhaseTimer()
+    result = None
+    try:
+        result = _evaluate(data, indexes, timer)
+        return result
+    finally:
+        log_path = os.environ.get(TIMING_LOG_ENV)
+        if log_path:
+            timer.write(
+                log_path,
+                exit_code=result[0] if result else None,
+                daemon=indexes is not None,
+            )
+
+
+def _evaluate(data: bytes, indexes: dict | None, timer: PhaseTimer) -> tuple[int, str, str]:
+    try:
+        input_data = json.loads(data)
+    except ValueError:
+        # Allow on parse failure (fail open for safety)
+        return ALLOW
+    finally:
+        timer.mark("parse")
+
+    tool_name = input_data.get("tool_name", "")
+    cwd = input_data.get("cwd", ".")
+
+    # Only handle ExitPlanMode
+    if tool_name != "ExitPlanMode":
+        return ALLOW
+
+    # The session's own plan when known, else the plans directory's newest
+    plan, source = session_plan(input_data)
+    timer.info["resolved"] = source
+    plans_dir = plan.parent if plan is not None else find_plans_dir(cwd)
+    if not plans_dir:
+        # No plan file found - allow through
+        return ALLOW
+
+    key = os.path.abspath(plans_dir)
+    index = indexes.get(key) if indexes is not None else None
+    if index is None:
+        index = load_index(plans_dir)
+        if indexes is not None:
+            indexes[key] = index
+    try:
+        result = check_plan(plans_dir, index, timer, plan.name if plan is not None else None)
+        timer.mark("decide")
+        return result
+    finally:
+        if index.pop("dirty", False):
+            save_index(plans_dir, index)
+            timer.mark("save_index")
+
+
+def main(data: bytes | None = None):
+    """Run the gate on a PreToolUse event (raw stdin bytes; read if None)."""
+    if data is None:
+        data = sys.stdin.buffer.read()
+    code, out, err = evaluate(data)
+    sys.stdout.write(out)
+    sys.stderr.write(err)
+    sys.exit(code)
+
+
+if __name__ == "__main__":
+    main()
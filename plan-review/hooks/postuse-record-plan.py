@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+PostToolUse hook for Write/Edit/MultiEdit.
+Records which plan file each session writes (~/.claude/plan-sessions/), so
+the ExitPlanMode gate checks the calling session's own plan instead of
+whichever plan was modified last. Never blocks: always exits 0.
+
+Like preuse-exitplanmode.py, it only scans stdin bytes until the event can
+concern a plan; the gate module is imported just for those.
+"""
+
+import sys
+
+PLANS_TOKEN = b".claude/plans/"
+
+
+def main():
+    data = sys.stdin.buffer.read()
+    if PLANS_TOKEN not in data:
+        sys.exit(0)
+
+    import plan_review_gate
+    plan_review_gate.record_from_event(data)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,214 +3,116 @@
 PreToolUse hook for ExitPlanMode.
 Blocks plan execution until review status is APPROVED, unless a bypass
 applies: quick marker, plans under the size threshold, or max reviews reached.
-Also allows through when no plan file is found, the file is unreadable, or
-stdin is not JSON — it validates the most recently modified plan file.
-"""
+The gate itself lives in plan_review_gate.py.
 
-import json
-import sys
-import re
-from pathlib import Path
-
-# Configuration
-MAX_REVIEWS = 3
-QUICK_BYPASS_MARKER = "<!-- QUICK -->"
-MIN_LINES_FOR_REVIEW = 50
-
-
-def find_plan_file(cwd: str) -> Path | None:
-    """Find the plan file in .claude/plans/ directory."""
-    claude_dir = Path(cwd) / ".claude" / "plans"
-    if not claude_dir.exists():
-        # Check home directory
-        home_claude = Path.home() / ".claude" / "plans"
-        if home_claude.exists():
-            claude_dir = home_claude
-        else:
-            return None
-
-    # Find the most recently modified .md file
-    plan_files = list(claude_dir.glob("*.md"))
-    if not plan_files:
-        return None
+This entry point only uses modules the interpreter has loaded at startup:
+events that do not mention ExitPlanMode are let through after a byte scan
+of stdin, so the json/re/pathlib imports are only paid when the gate can
+apply.
 
-    return max(plan_files, key=lambda p: p.stat().st_mtime)
+When plan-review-daemon.py is running (its socket exists), the event is
+forwarded to it and its exit code, stdout and stderr are relayed, so the
+gate is not imported at all. If the daemon is absent or does not answer,
+the gate runs in-process with the same result.
 
+Set PLAN_REVIEW_STARTUP_TIMING to a file path to append per-call startup
+timings in the layout of `python -X importtime` (microseconds).
+"""
 
-def read_plan_content(plan_path: Path) -> str | None:
-    """Read plan content from file."""
-    try:
-        return plan_path.read_text()
-    except Exception:
-        return None
+import os
+import sys
+import time
 
+TOOL_TOKEN = b'"ExitPlanMode"'
+TIMING_ENV = "PLAN_REVIEW_STARTUP_TIMING"
+SOCKET_ENV = "PLAN_REVIEW_SOCKET"
+DAEMON_TIMEOUT = 5  # seconds before falling back to the in-process gate
 
-def parse_review_status(plan: str) -> dict:
-    """Parse the Plan Review Status section if present."""
-    status = {
-        "present": False,
-        "approved": False,
-        "review_count": 0,
-        "status": "NONE"
-    }
 
-    match = re.search(
-        r'## Plan Review Status\s*\n'
-        r'Reviews:\s*(\d+)/\d+\s*\n'
-        r'Status:\s*(\w+)',
-        plan,
-        re.MULTILINE
-    )
+def log_timing(path: str, phases: list[tuple[str, int]]) -> None:
+    """Append (phase, ns) pairs as `self | cumulative | phase` lines; never fails."""
+    lines = [f"plan-review startup: {'self [us]':>9} | {'cumulative':>10} | phase"]
+    total = 0
+    for name, ns in phases:
+        total += ns
+        lines.append(f"plan-review startup: {ns // 1000:>9} | {total // 1000:>10} | {name}")
+    try:
+        with open(path, "a") as f:
+            f.write("\n".join(lines) + "\n")
+    except OSError:
+        pass
 
-    if match:
-        status["present"] = True
-        status["review_count"] = int(match.group(1))
-        status["status"] = match.group(2).upper()
-        status["approved"] = status["status"] == "APPROVED"
 
-    return status
+def ask_daemon(path: str, data: bytes) -> tuple[int, bytes, bytes] | None:
+    """Forward the event to the daemon; (exit code, stdout, stderr) or None on any failure."""
+    # The C module: `import socket` would cost more than the whole round trip
+    import _socket
 
+    sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    chunks = []
+    try:
+        sock.settimeout(DAEMON_TIMEOUT)
+        sock.connect(path)
+        sock.sendall(os.getcwdb() + b"\n" + data)
+        sock.shutdown(_socket.SHUT_WR)
+        while chunk := sock.recv(65536):
+            chunks.append(chunk)
+    except OSError:
+        return None
+    finally:
+        sock.close()
 
-def should_bypass(plan: str) -> tuple[bool, str]:
-    """Check if plan should bypass review."""
-    # Quick bypass marker
-    if QUICK_BYPASS_MARKER in plan:
-        return True, "Quick bypass marker found"
+    header, _, body = b"".join(chunks).partition(b"\n")
+    try:
+        code, out_len = map(int, header.split())
+    except ValueError:
+        return None
+    return code, body[:out_len], body[out_len:]
 
-    # Small plan threshold
-    line_count = len(plan.strip().split('\n'))
-    if line_count < MIN_LINES_FOR_REVIEW:
-        return True, f"Plan is {line_count} lines (threshold: {MIN_LINES_FOR_REVIEW})"
 
-    return False, ""
+def main():
+    timing_path = os.environ.get(TIMING_ENV)
+    # CPU time spent before this line is the interpreter's own startup
+    phases = [("interpreter startup (cpu)", time.process_time_ns())]
+    mark = time.perf_counter_ns()
 
+    def phase(name):
+        nonlocal mark
+        now = time.perf_counter_ns()
+        phases.append((name, now - mark))
+        mark = now
 
-def main():
     try:
-        input_data = json.load(sys.stdin)
-    except json.JSONDecodeError:
-        # Allow on parse failure (fail open for safety)
-        sys.exit(0)
-
-    tool_name = input_data.get("tool_name", "")
-    cwd = input_data.get("cwd", ".")
-
-    # Only handle ExitPlanMode
-    if tool_name != "ExitPlanMode":
-        sys.exit(0)
-
-    # Find and read the plan file
-    plan_path = find_plan_file(cwd)
-    if not plan_path:
-        # No plan file found - allow through
-        sys.exit(0)
-
-    plan = read_plan_content(plan_path)
-    if not plan:
-        # Could not read plan - allow through
-        sys.exit(0)
-
-    # Check bypass conditions
-    bypass, reason = should_bypass(plan)
-    if bypass:
-        sys.exit(0)
-
-    # Parse review status
-    status = parse_review_status(plan)
-
-    # If approved, allow through
-    if status["approved"]:
-        sys.exit(0)
-
-    # If max reviews reached, allow with warning
-    if status["review_count"] >= MAX_REVIEWS:
-        print(json.dumps({
-            "systemMessage": f"Warning: Plan approved after {MAX_REVIEWS} review cycles without full consensus."
-        }))
-        sys.exit(0)
-
-    # Block and provide instructions
-    review_count = status["review_count"]
-
-    instructions = f"""
-BLOCKED: Plan requires review before execution.
-
-Plan file: {plan_path}
-Review cycle: {review_count + 1}/{MAX_REVIEWS}
-
-## Multi-Agent Review Process (3 rounds)
-
-### Round 1: Independent Review (parallel)
-Spawn TWO review agents IN PARALLEL using the Task tool.
-**IMPORTANT**: Save the agent IDs returned - you'll need them for Round 2.
-
-1. **Architect Reviewer** (subagent_type: "plan-review:architect-reviewer"):
-   - Include the full plan content
-   - Agent will challenge architectural decisions, verify best practices via MCP/web
-   - Returns findings as HIGH/MEDIUM/LOW with verdict
-   - **Save the agentId from the response**
-
-2. **Code Simplifier** (subagent_type: "code-simplifier:code-simplifier"):
-   - Include the full plan content
-   - Ask it to review for over-engineering, unnecessary complexity, simpler alternatives
-   - Returns findings with simplification recommendations
-   - **Save the agentId from the response**
-
-### Round 2: Cross-Review Debate (parallel)
-After Round 1, RESUME both agents IN PARALLEL using the `resume` parameter with their agent IDs from Round 1.
-
-Each agent receives (via prompt):
-- The OTHER agent's Round 1 findings
-
-Prompt each resumed agent to:
-- Review the other's findings
-- AGREE, DISAGREE, or ADD NUANCE to each point
-- Identify any findings they now reconsider based on the other perspective
-- State their final position on each issue
-
-Example Task call for Round 2:
-```
-Task(resume="<architect-agent-id>", prompt="Here are the Code Simplifier's findings: ...")
-Task(resume="<simplifier-agent-id>", prompt="Here are the Architect's findings: ...")
-```
-
-### Round 3: Consensus Formation (you synthesize)
-After Round 2, YOU form the consensus:
-1. **Aligned findings**: Issues both agents agree on → must address
-2. **Disputed findings**: Where they disagree → use your judgment, document reasoning
-3. **Withdrawn findings**: Issues an agent reconsidered → can skip
-
-Update the plan:
-1. Address all aligned HIGH severity concerns
-2. Make judgment calls on disputed items (document why)
-3. Add the "## Plan Review Status" section:
-
-```markdown
-## Plan Review Status
-Reviews: {review_count + 1}/3
-Status: APPROVED
-Last Review: <current timestamp>
-
-### Consensus Summary
-**Aligned (addressed):**
-- [finding]: [how addressed]
-
-**Disputed (judgment call):**
-- [finding]: [decision and reasoning]
-
-**Withdrawn:**
-- [finding]: [why reconsidered]
-```
-
-Then call ExitPlanMode again.
-
-**Bypass options:**
-- Add `{QUICK_BYPASS_MARKER}` to plan for trivial changes
-- Plans under {MIN_LINES_FOR_REVIEW} lines auto-bypass
-"""
-
-    print(instructions, file=sys.stderr)
-    sys.exit(2)
+        data = sys.stdin.buffer.read()
+        phase("read stdin")
+
+        # Only handle ExitPlanMode; anything that doesn't even contain the
+        # name cannot be it
+        if TOOL_TOKEN not in data:
+            phase("skip")
+            sys.exit(0)
+
+        socket_path = os.environ.get(SOCKET_ENV) or os.path.join(
+            os.path.expanduser("~"), ".claude", "plan-review.sock"
+        )
+        if os.path.exists(socket_path):
+            reply = ask_daemon(socket_path, data)
+            phase("daemon")
+            if reply is not None:
+                code, out, err = reply
+                sys.stdout.buffer.write(out)
+                sys.stderr.buffer.write(err)
+                sys.exit(code)
+
+        import plan_review_gate
+        phase("import plan_review_gate")
+        try:
+            plan_review_gate.main(data)
+        finally:
+            phase("gate")
+    finally:
+        if timing_path:
+            log_timing(timing_path, phases)
 
 
 if __name__ == "__main__":
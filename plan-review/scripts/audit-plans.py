@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Audit the review status of every plan across many projects.
+
+For each project root given, checks <root>/.claude/plans (or, with
+--recursive, every .claude/plans below it) plus ~/.claude/plans, and reports
+for each plan what the ExitPlanMode gate would decide: its review status
+and count (from the review sidecar when there is one, with its number of
+recorded rounds), line count and bypass reason, under the project's policy
+file (.claude/plan-review.json) when there is one. Roots are scanned in a process
+pool with the gate's own bounded reader (plan_review_gate.analyze_plan), so
+no hook process is started per plan.
+
+Usage:
+    python3 scripts/audit-plans.py ~/src/*
+    python3 scripts/audit-plans.py ~/src --recursive --format jsonl | jq 'select(.verdict == "blocked")'
+    python3 scripts/audit-plans.py . --no-home --format json --fail-on-blocked
+"""
+
+import os
+import sys
+import json
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+HOOKS_DIR = Path(__file__).resolve().parent.parent / "hooks"
+sys.path.insert(0, str(HOOKS_DIR))
+
+import plan_review_gate  # noqa: E402
+
+# Never descended into by --recursive
+SKIP_DIRS = {".git", "node_modules", ".venv", "venv", "__pycache__", "dist", "build"}
+VERDICTS = ["blocked", "max-reviews", "approved", "bypass", "error"]
+
+
+def find_plans_dirs(root: Path, recursive: bool) -> list[Path]:
+    """.claude/plans directories for a project root (the root itself if it is one)."""
+    if root.name == "plans" and root.parent.name == ".claude":
+        return [root]
+    if not recursive:
+        plans_dir = root / ".claude" / "plans"
+        return [plans_dir] if plans_dir.is_dir() else []
+
+    found = []
+    for dirpath, dirnames, _ in os.walk(root):
+        if os.path.basename(dirpath) == ".claude" and "plans" in dirnames:
+            found.append(Path(dirpath) / "plans")
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+    return found
+
+
+def audit_plan(path: Path, policy: dict) -> dict:
+    """One report record for a plan file under its project's compiled policy."""
+    settings = plan_review_gate.plan_policy(policy, path.name)
+    analysis = plan_review_gate.analyze_plan(path, settings=settings)
+    if analysis is None:
+        return {"path": str(path), "verdict": "error", "error": "empty or unreadable"}
+    plan_review_gate.apply_review(analysis, path)
+    status = plan_review_gate.effective_status(analysis)
+    return {
+        "path": str(path),
+        "verdict": plan_review_gate.plan_verdict(analysis, settings),
+        "status": status["status"],
+        "review_count": status["review_count"],
+        "max_reviews": settings["max_reviews"],
+        "rule": settings["rule"],
+        "missing_reviewers": plan_review_gate.missing_reviewers(status, settings),
+        "source": status.get("source", "markdown"),
+        "rounds": status.get("rounds"),
+        "line_count": analysis["line_count"],
+        "bypass_reason": analysis["reason"],
+        "truncated": analysis["truncated"],
+    }
+
+
+def audit_root(root: str, recursive: bool) -> list[dict]:
+    """Audit every plan under one root; runs in a worker process."""
+    records = []
+    for plans_dir in find_plans_dirs(Path(root), recursive):
+        try:
+            with os.scandir(plans_dir) as entries:
+                names = sorted(e.name for e in entries if e.name.endswith(".md") and e.is_file())
+        except OSError as e:
+            records.append({"path": str(plans_dir), "verdict": "error", "error": str(e)})
+            continue
+        policy = plan_review_gate.load_policy(plans_dir)
+        if policy["error"]:
+            # Reported, then the plans are audited under the defaults like the gate does
+            records.append({"path": str(plans_dir.parent / plan_review_gate.POLICY_NAME),
+                            "verdict": "error", "error": policy["error"]})
+        records.extend(audit_plan(plans_dir / name, policy) for name in names)
+    return records
+
+
+def iter_records(roots: list[str], recursive: bool, jobs: int):
+    """Yield records root by root as workers finish, each plan file once."""
+    seen = set()
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [executor.submit(audit_root, root, recursive) for root in roots]
+        for future in as_completed(futures):
+            for record in future.result():
+                key = os.path.realpath(record["path"])
+                if key not in seen:
+                    seen.add(key)
+                    yield record
+
+
+def format_row(record: dict) -> str:
+    if record["verdict"] == "error":
+        return f"{'error':<12} {'':>7} {'':<10} {'':>7}  {record['path']}  ({record['error']})"
+    reason = f"  ({record['bypass_reason']})" if record["bypass_reason"] else ""
+    if record["verdict"] == "blocked" and record["missing_reviewers"]:
+        reason += f"  (missing reviewers: {', '.join(record['missing_reviewers'])})"
+    lines = f"{record['line_count']}{'+' if record['truncated'] else ''}"
+    return (f"{record['verdict']:<12} {record['review_count']:>3}/{record['max_reviews']:<3} "
+            f"{record['status']:<10} {lines:>7}  {record['path']}{reason}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the plan-review status of plans across projects")
+    parser.add_argument("roots", nargs="*", default=["."], help="Project roots to audit (default: .)")
+    parser.add_argument("-r", "--recursive", action="store_true",
+                        help="Find every .claude/plans below each root, not just <root>/.claude/plans")
+    parser.add_argument("--no-home", action="store_true", help="Skip ~/.claude/plans")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--format", choices=["table", "json", "jsonl"], default="table",
+                        help="table and jsonl stream records as roots finish; json prints one document "
+                             "(default: table)")
+    parser.add_argument("--fail-on-blocked", action="store_true",
+                        help="Exit 1 if any plan would be blocked by the gate")
+    args = parser.parse_args()
+
+    roots = [str(Path(root).expanduser().absolute()) for root in args.roots]
+    home_plans = Path.home() / ".claude" / "plans"
+    if not args.no_home and home_plans.is_dir():
+        roots.append(str(home_plans))
+
+    counts = dict.fromkeys(VERDICTS, 0)
+    records = []
+    if args.format == "table":
+        print(f"{'verdict':<12} {'reviews':>7} {'status':<10} {'lines':>7}  path")
+
+    try:
+        for record in iter_records(roots, args.recursive, max(1, args.jobs)):
+            counts[record["verdict"]] += 1
+            if args.format == "table":
+                print(format_row(record), flush=True)
+            elif args.format == "jsonl":
+                print(json.dumps(record), flush=True)
+            else:
+                records.append(record)
+    except BrokenPipeError:
+        # Reader went away (e.g. `| head`): stop quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+
+    if args.format == "json":
+        records.sort(key=lambda r: r["path"])
+        print(json.dumps({"plans": records, "summary": counts}, indent=2))
+    else:
+        summary = ", ".join(f"{count} {verdict}" for verdict, count in counts.items() if count)
+        print(f"{sum(counts.values())} plans: {summary or 'none found'}", file=sys.stderr)
+
+    sys.exit(1 if args.fail_on_blocked and counts["blocked"] else 0)
+
+
+if __name__ == "__main__":
+    main()
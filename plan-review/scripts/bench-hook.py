@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Latency benchmark for the plan-review ExitPlanMode hook.
+
+Builds synthetic .claude/plans/ trees (every combination of --plans and
+--lines) and reports p50/p95/p99 latency of an ExitPlanMode check for each:
+
+  runners  inline   plan_review_gate.evaluate() called in this process
+           process  the hook as registered, `python3 -S preuse-exitplanmode.py`
+           daemon   the same, with plan-review-daemon.py answering
+  modes    cold     plans index deleted before every call (full scan + read;
+                    the daemon keeps its in-memory index, so stays warm)
+           edited   newest plan's mtime bumped before every call (re-read)
+           warm     nothing changed since the previous call
+
+Only the newest plan gets --lines lines and a pending review status, so the
+hook blocks after the full check; the others are small, since the hook only
+stats them. Phase medians come from PLAN_REVIEW_TIMING_LOG (inline and
+process runners).
+
+Usage:
+    python3 scripts/bench-hook.py
+    python3 scripts/bench-hook.py --plans 10 10000 --lines 50 50000 --runs 50 --json
+    python3 scripts/bench-hook.py --runner process daemon --mode warm
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+import statistics
+from pathlib import Path
+
+HOOKS_DIR = Path(__file__).resolve().parent.parent / "hooks"
+HOOK = HOOKS_DIR / "preuse-exitplanmode.py"
+DAEMON = HOOKS_DIR / "plan-review-daemon.py"
+sys.path.insert(0, str(HOOKS_DIR))
+
+import plan_review_gate  # noqa: E402
+
+RUNNERS = ["inline", "process", "daemon"]
+MODES = ["cold", "edited", "warm"]
+LINE = "- step: update the handler, add a test, document the option\n"
+STATUS_BLOCK = "\n## Plan Review Status\nReviews: 1/3\nStatus: REVISE\n"
+
+
+def build_tree(root: Path, plans: int) -> Path:
+    """Create root/.claude/plans with `plans` small plans, oldest first."""
+    plans_dir = root / ".claude" / "plans"
+    plans_dir.mkdir(parents=True)
+    now = time.time()
+    small = "# Plan\n" + LINE * 10
+    for n in range(plans):
+        path = plans_dir / f"plan-{n:05d}.md"
+        path.write_text(small)
+        mtime = now - (plans - n) * 60
+        os.utime(path, (mtime, mtime))
+    return plans_dir
+
+
+def write_newest(plans_dir: Path, lines: int) -> Path:
+    """(Re)write the newest plan with `lines` lines ending in a pending status."""
+    newest = max(plans_dir.iterdir(), key=lambda p: p.stat().st_mtime_ns)
+    newest.write_text("# Plan\n" + LINE * lines + STATUS_BLOCK)
+    return newest
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def start_daemon(socket_path: Path, env: dict) -> subprocess.Popen:
+    daemon = subprocess.Popen(
+        [sys.executable, str(DAEMON), "--socket", str(socket_path)],
+        env=env, stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + 10
+    while not socket_path.exists():
+        if time.monotonic() > deadline or daemon.poll() is not None:
+            daemon.kill()
+            sys.exit("plan-review daemon did not start")
+        time.sleep(0.02)
+    return daemon
+
+
+def measure(runner, mode, root, plans_dir, newest, runs, env, timing_log):
+    """Latencies (ms) of `runs` ExitPlanMode checks; the first, untimed call warms up."""
+    event = json.dumps({"tool_name": "ExitPlanMode", "cwd": str(root)}).encode()
+    index_path = plans_dir.parent / plan_review_gate.INDEX_NAME
+    mtime_ns = newest.stat().st_mtime_ns
+
+    def call():
+        if runner == "inline":
+            return plan_review_gate.evaluate(event)[0]
+        return subprocess.run(
+            [sys.executable, "-S", str(HOOK)], input=event, env=env, capture_output=True
+        ).returncode
+
+    call()
+    timing_log.unlink(missing_ok=True)
+    samples = []
+    for _ in range(runs):
+        if mode == "cold":
+            index_path.unlink(missing_ok=True)
+        elif mode == "edited":
+            mtime_ns += 1_000_000
+            os.utime(newest, ns=(mtime_ns, mtime_ns))
+        start = time.perf_counter()
+        code = call()
+        samples.append((time.perf_counter() - start) * 1000)
+        if code != 2:
+            sys.exit(f"unexpected hook exit code {code} ({runner}/{mode})")
+    return samples
+
+
+def phase_medians(timing_log: Path) -> dict:
+    """Median microseconds per phase over the records in timing_log."""
+    phases = {}
+    try:
+        with open(timing_log) as f:
+            for line in f:
+                for name, us in json.loads(line)["phases_us"].items():
+                    phases.setdefault(name, []).append(us)
+    except OSError:
+        return {}
+    return {name: statistics.median(values) for name, values in phases.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark plan-review hook latency")
+    parser.add_argument("--plans", type=int, nargs="+", default=[10, 100, 1000, 10000],
+                        help="Plans per tree (default: 10 100 1000 10000)")
+    parser.add_argument("--lines", type=int, nargs="+", default=[50, 500, 5000, 50000],
+                        help="Lines in the newest plan (default: 50 500 5000 50000)")
+    parser.add_argument("--runner", choices=RUNNERS, nargs="+", default=["inline", "process"],
+                        help="How the hook is run (default: inline process)")
+    parser.add_argument("--mode", choices=MODES, nargs="+", default=MODES,
+                        help="Cache state before each call (default: all)")
+    parser.add_argument("--runs", type=int, default=30, help="Timed calls per scenario (default: 30)")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON instead of a table")
+    args = parser.parse_args()
+
+    work = Path(tempfile.mkdtemp(prefix="bench-hook-"))
+    timing_log = work / "timing.jsonl"
+    env = dict(os.environ, PLAN_REVIEW_SOCKET=str(work / "absent.sock"), PLAN_REVIEW_TIMING_LOG=str(timing_log))
+    daemon_socket = work / "daemon.sock"
+    daemon_env = dict(env, PLAN_REVIEW_SOCKET=str(daemon_socket))
+    daemon_env.pop("PLAN_REVIEW_TIMING_LOG")
+    os.environ["PLAN_REVIEW_TIMING_LOG"] = str(timing_log)
+    daemon = start_daemon(daemon_socket, daemon_env) if "daemon" in args.runner else None
+
+    results = []
+    try:
+        for plans in args.plans:
+            root = work / f"tree-{plans}"
+            plans_dir = build_tree(root, plans)
+            for lines in args.lines:
+                newest = write_newest(plans_dir, lines)
+                for runner in args.runner:
+                    for mode in args.mode:
+                        samples = measure(runner, mode, root, plans_dir, newest, args.runs,
+                                          daemon_env if runner == "daemon" else env, timing_log)
+                        results.append({
+                            "plans": plans,
+                            "lines": lines,
+                            "runner": runner,
+                            "mode": mode,
+                            "runs": args.runs,
+                            "p50_ms": round(percentile(samples, 50), 3),
+                            "p95_ms": round(percentile(samples, 95), 3),
+                            "p99_ms": round(percentile(samples, 99), 3),
+                            "phases_us": phase_medians(timing_log) if runner != "daemon" else {},
+                        })
+            shutil.rmtree(root)
+    finally:
+        if daemon:
+            daemon.terminate()
+            daemon.wait()
+        shutil.rmtree(work, ignore_errors=True)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'plans':>6} {'lines':>6} {'runner':<8} {'mode':<7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}  phases (median us)")
+    for r in results:
+        phases = " ".join(f"{name}={us:g}" for name, us in r["phases_us"].items())
+        print(f"{r['plans']:>6} {r['lines']:>6} {r['runner']:<8} {r['mode']:<7} "
+              f"{r['p50_ms']:>8.3f} {r['p95_ms']:>8.3f} {r['p99_ms']:>8.3f}  {phases}")
+
+
+if __name__ == "__main__":
+    main()
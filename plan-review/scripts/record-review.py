@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Record plan review rounds in the plan's review sidecar.
+
+The sidecar (<plan stem>.review.json beside the plan) is what the
+ExitPlanMode gate reads instead of the markdown "## Plan Review Status"
+block:
+
+    {
+      "version": 1,
+      "plan": "harmonic-painting-pretzel.md",
+      "status": "APPROVED",
+      "reviews": 1,
+      "rounds": [
+        {"review": 1, "round": 1, "reviewer": "architect-reviewer",
+         "verdict": "REVISE", "summary": "...", "at": "2026-03-11T10:02:11Z"},
+        ...
+      ],
+      "updated_at": "2026-03-11T10:09:40Z"
+    }
+
+"reviews" counts completed review cycles. Rounds are recorded against the
+cycle in progress (reviews + 1), and --status closes that cycle.
+
+Usage:
+    python3 scripts/record-review.py PLAN --round 1 --reviewer architect-reviewer --verdict REVISE
+    python3 scripts/record-review.py PLAN --round 3 --reviewer consensus --verdict APPROVED --status APPROVED
+    python3 scripts/record-review.py PLAN --show
+"""
+
+import os
+import sys
+import json
+import argparse
+from datetime import datetime, timezone
+from pathlib import Path
+
+HOOKS_DIR = Path(__file__).resolve().parent.parent / "hooks"
+sys.path.insert(0, str(HOOKS_DIR))
+
+from plan_review_gate import REVIEW_VERSION, load_review, review_path  # noqa: E402
+
+
+def utc_now() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def save_review(path: Path, review: dict) -> None:
+    """Write the sidecar atomically."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(review, indent=2) + "\n")
+    os.replace(tmp, path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record plan review rounds in the plan's review sidecar")
+    parser.add_argument("plan", help="Plan file (.claude/plans/<name>.md)")
+    parser.add_argument("--reviewer", help="Reviewer of this round (e.g. architect-reviewer)")
+    parser.add_argument("--verdict", help="The reviewer's verdict (e.g. APPROVED, REVISE)")
+    parser.add_argument("--round", type=int, help="Round within the review cycle (1-3)")
+    parser.add_argument("--summary", help="One-line summary of the findings")
+    parser.add_argument("--status", help="Close the current review cycle with this status (e.g. APPROVED)")
+    parser.add_argument("--show", action="store_true", help="Print the sidecar and exit")
+    args = parser.parse_args()
+
+    plan = Path(args.plan)
+    if not plan.is_file():
+        print(f"Plan not found: {plan}", file=sys.stderr)
+        sys.exit(1)
+    path = review_path(plan)
+
+    if args.show:
+        review = load_review(path)
+        if review is None:
+            print(f"No review recorded for {plan}", file=sys.stderr)
+            sys.exit(1)
+        print(json.dumps(review, indent=2))
+        return
+
+    if bool(args.reviewer) != bool(args.verdict):
+        parser.error("--reviewer and --verdict go together")
+    if not args.reviewer and not args.status:
+        parser.error("nothing to record: give --reviewer/--verdict and/or --status")
+
+    review = load_review(path) or {
+        "version": REVIEW_VERSION,
+        "plan": plan.name,
+        "status": "PENDING",
+        "reviews": 0,
+        "rounds": [],
+    }
+
+    now = utc_now()
+    if args.reviewer:
+        entry = {"review": review["reviews"] + 1, "round": args.round, "reviewer": args.reviewer,
+                 "verdict": args.verdict.upper(), "at": now}
+        if args.summary:
+            entry["summary"] = args.summary
+        review.setdefault("rounds", []).append(entry)
+    if args.status:
+        review["reviews"] += 1
+        review["status"] = args.status.upper()
+    review["updated_at"] = now
+
+    save_review(path, review)
+    print(f"Review {review['reviews']} status {review['status']}, "
+          f"{len(review['rounds'])} rounds recorded: {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -25,23 +25,29 @@ const PLUGIN_ROOT = path.dirname(SCRIPT_DIR);
 const SETTINGS_FILE = '.claude/settings.local.json';
 const BACKUP_FILE = '.claude/settings.local.json.backup';
 
-// Find hook script path (works whether plugin is installed or in dev)
-function findHookScript() {
+// Find a hook script path (works whether plugin is installed or in dev)
+function findHookScript(name) {
   // Check if we're in the installed location
   const installedPath = path.join(HOME, '.claude', 'plugins', 'marketplaces');
   const candidates = [
-    path.join(PLUGIN_ROOT, 'hooks', 'preuse-exitplanmode.py'),
+    path.join(PLUGIN_ROOT, 'hooks', name),
     // Search installed plugins
     ...fs.readdirSync(installedPath, { withFileTypes: true })
       .filter(d => d.isDirectory())
-      .map(d => path.join(installedPath, d.name, 'plan-review', 'hooks', 'preuse-exitplanmode.py'))
+      .map(d => path.join(installedPath, d.name, 'plan-review', 'hooks', name))
       .filter(p => fs.existsSync(p))
   ].filter(p => fs.existsSync(p));
 
-  return candidates[0] || path.join(PLUGIN_ROOT, 'hooks', 'preuse-exitplanmode.py');
+  return candidates[0] || path.join(PLUGIN_ROOT, 'hooks', name);
 }
 
-const HOOK_SCRIPT_PATH = findHookScript();
+const HOOK_SCRIPT_PATH = findHookScript('preuse-exitplanmode.py');
+const RECORD_SCRIPT_PATH = findHookScript('postuse-record-plan.py');
+
+// -S skips site-packages setup: the hooks only need the standard library,
+// and each runs as a fresh interpreter on every matching tool call
+const HOOK_COMMAND = `python3 -S "${HOOK_SCRIPT_PATH}"`;
+const RECORD_COMMAND = `python3 -S "${RECORD_SCRIPT_PATH}"`;
 
 // Hook definitions
 const PLUGIN_HOOKS = {
@@ -51,13 +57,26 @@ const PLUGIN_HOOKS = {
       hooks: [
         {
           type: 'command',
-          command: HOOK_SCRIPT_PATH,
+          command: HOOK_COMMAND,
           timeout: 10,
           description: 'Requires plan review before execution (from plugin)',
         },
       ],
     },
   ],
+  PostToolUse: [
+    {
+      matcher: 'Write|Edit|MultiEdit',
+      hooks: [
+        {
+          type: 'command',
+          command: RECORD_COMMAND,
+          timeout: 10,
+          description: 'Records which plan each session writes (from plugin)',
+        },
+      ],
+    },
+  ],
 };
 
 // Utility functions
@@ -107,6 +126,25 @@ function removePluginHooks(hooks) {
     .filter(matcher => matcher.hooks.length > 0);
 }
 
+// Plugin hooks in a list of matchers, as comparable strings
+function pluginHookKeys(matchers) {
+  if (!Array.isArray(matchers)) return [];
+  return matchers.flatMap(m =>
+    (m.hooks || []).filter(isPluginHook).map(h => JSON.stringify({ matcher: m.matcher, ...h }))
+  );
+}
+
+// Whether the installed plugin hooks are exactly PLUGIN_HOOKS. Settings
+// written by an older plugin version may lack an event (the PostToolUse
+// session tracking) or carry an older command line.
+function pluginHooksCurrent(settingsHooks) {
+  return Object.entries(PLUGIN_HOOKS).every(([event, matchers]) => {
+    const installed = pluginHookKeys(settingsHooks[event]);
+    const wanted = pluginHookKeys(matchers);
+    return installed.length === wanted.length && wanted.every(key => installed.includes(key));
+  });
+}
+
 function mergeHooks(existing, plugin) {
   if (!Array.isArray(existing)) {
     return plugin;
@@ -137,14 +175,17 @@ function mergeHooks(existing, plugin) {
 function main() {
   console.log('Plan Review Plugin - Hook Installer\n');
 
-  // Check hook script exists
-  if (!fileExists(HOOK_SCRIPT_PATH)) {
-    console.error('Hook script not found:', HOOK_SCRIPT_PATH);
-    console.error('\nEnsure the plugin is properly installed.');
-    process.exit(1);
+  // Check hook scripts exist
+  for (const script of [HOOK_SCRIPT_PATH, RECORD_SCRIPT_PATH]) {
+    if (!fileExists(script)) {
+      console.error('Hook script not found:', script);
+      console.error('\nEnsure the plugin is properly installed.');
+      process.exit(1);
+    }
   }
 
   console.log('Hook script:', HOOK_SCRIPT_PATH);
+  console.log('Hook script:', RECORD_SCRIPT_PATH);
 
   // Read or create settings
   let settings = readJSON(SETTINGS_FILE);
@@ -192,32 +233,26 @@ function main() {
     // Install plugin hooks
     console.log('\nInstalling hooks...\n');
 
-    // Check if already installed
-    let alreadyInstalled = false;
-    for (const [event, hooks] of Object.entries(PLUGIN_HOOKS)) {
-      if (settings.hooks[event]) {
-        for (const matcher of hooks) {
-          const existing = settings.hooks[event].find(m => m.matcher === matcher.matcher);
-          if (existing && existing.hooks.some(isPluginHook)) {
-            alreadyInstalled = true;
-          }
-        }
-      }
-    }
+    // Check if already installed, and up to date
+    const alreadyInstalled = Object.keys(PLUGIN_HOOKS)
+      .some(event => pluginHookKeys(settings.hooks[event]).length > 0);
 
-    if (alreadyInstalled && !flags.force) {
-      console.log('Plugin hooks already installed');
+    if (alreadyInstalled && pluginHooksCurrent(settings.hooks) && !flags.force) {
+      console.log('Plugin hooks already installed and up to date');
       console.log('\nUse --force to reinstall');
       process.exit(0);
     }
 
-    // Merge hooks
+    // Merge hooks (replacing plugin hooks from an older version in place)
     for (const [event, hooks] of Object.entries(PLUGIN_HOOKS)) {
       settings.hooks[event] = mergeHooks(settings.hooks[event], hooks);
     }
 
-    console.log('Installed 1 hook from plan-review plugin');
+    console.log(alreadyInstalled && !flags.force
+      ? 'Upgraded hooks from an older plan-review version'
+      : 'Installed 2 hooks from plan-review plugin');
     console.log('   - PreToolUse:ExitPlanMode -> plan review gate');
+    console.log('   - PostToolUse:Write|Edit|MultiEdit -> session plan tracking');
   }
 
   // Dry run check
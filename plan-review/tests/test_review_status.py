@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Which review status the plan-review gate acts on when a plan has both a
+markdown status block and a sidecar written by scripts/record-review.py.
+
+Usage:
+    python3 -m unittest discover plan-review/tests
+"""
+
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+PLUGIN_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PLUGIN_DIR / "hooks"))
+
+import plan_review_gate  # noqa: E402
+
+RECORD_REVIEW = PLUGIN_DIR / "scripts" / "record-review.py"
+
+
+class ReviewStatusTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.plans_dir = Path(tmp.name) / ".claude" / "plans"
+        self.plans_dir.mkdir(parents=True)
+        self.plan = self.plans_dir / "feature.md"
+
+    def write_plan(self, reviews, status):
+        steps = "".join(f"- step {n}\n" for n in range(100))
+        self.plan.write_text(
+            f"# Feature\n\n{steps}\n## Plan Review Status\nReviews: {reviews}/3\nStatus: {status}\n"
+        )
+
+    def record(self, *args):
+        subprocess.run([sys.executable, str(RECORD_REVIEW), str(self.plan), *args],
+                       check=True, capture_output=True)
+
+    def exit_code(self):
+        code, _, _ = plan_review_gate.check_plan(self.plans_dir, {}, plan_name=self.plan.name)
+        return code
+
+    def test_pending_sidecar_keeps_approved_markdown(self):
+        self.write_plan(1, "APPROVED")
+        self.record("--round", "1", "--reviewer", "architect-reviewer", "--verdict", "REVISE")
+        self.assertEqual(self.exit_code(), 0)
+
+    def test_pending_sidecar_and_markdown_block(self):
+        self.write_plan(0, "PENDING")
+        self.record("--round", "1", "--reviewer", "architect-reviewer", "--verdict", "REVISE")
+        self.assertEqual(self.exit_code(), 2)
+
+    def test_approved_sidecar_overrides_pending_markdown(self):
+        self.write_plan(0, "PENDING")
+        self.record("--round", "3", "--reviewer", "consensus", "--verdict", "APPROVED",
+                    "--status", "APPROVED")
+        self.assertEqual(self.exit_code(), 0)
+
+    def test_sidecar_with_more_reviews_wins(self):
+        self.write_plan(1, "PENDING")
+        for _ in range(plan_review_gate.MAX_REVIEWS):
+            self.record("--status", "REVISE")
+        code, out, _ = plan_review_gate.check_plan(self.plans_dir, {}, plan_name=self.plan.name)
+        self.assertEqual(code, 0)
+        self.assertIn("review cycles without full consensus", out)
+
+
+if __name__ == "__main__":
+    unittest.main()